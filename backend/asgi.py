@@ -0,0 +1,168 @@
+"""
+ASGI entry point for the async serving mode.
+
+The read endpoints in routes/async_api.py run natively on the event loop with
+the async Supabase client, so one worker can keep hundreds of slow upstream
+calls in flight. Every other route (and any request whose JWT is missing or
+invalid, so the error responses stay identical) is handed to the Flask app on
+a thread pool of ASGI_THREADS threads per worker.
+
+Run with: uvicorn asgi:application --host 0.0.0.0 --port 5000 --workers 4
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+# Set production environment before importing app
+os.environ["FLASK_ENV"] = "production"
+
+from app import create_app
+from asgiref.sync import sync_to_async
+from asgiref.wsgi import WsgiToAsgi, WsgiToAsgiInstance
+from flask_jwt_extended import decode_token
+
+from routes.async_api import ROUTES
+from utils.async_database import close_async_service_role_client
+from utils.compression import COMPRESSION_ENABLED, MIN_SIZE, choose_encoding, compress
+from utils.etag import etag_headers
+from utils.metrics import request_finished, request_started
+from utils.query_tracking import finish_request_log, start_request_log
+
+ASGI_THREADS = int(os.getenv("ASGI_THREADS", "32"))
+
+app = create_app()
+
+
+class _PooledWsgiInstance(WsgiToAsgiInstance):
+    """WsgiToAsgiInstance that runs the app on the given executor"""
+
+    def __init__(self, wsgi_application, executor):
+        super().__init__(wsgi_application)
+        self.executor = executor
+
+    async def run_wsgi_app(self, body):
+        # asgiref's default is thread_sensitive=True: every request in the
+        # process on one shared thread, so slow Flask routes queue behind
+        # each other
+        run = partial(WsgiToAsgiInstance.__dict__["run_wsgi_app"].func, self)
+        await sync_to_async(run, thread_sensitive=False, executor=self.executor)(body)
+
+
+class PooledWsgiToAsgi(WsgiToAsgi):
+    """WsgiToAsgi running requests concurrently on up to max_workers threads"""
+
+    def __init__(self, wsgi_application, max_workers):
+        super().__init__(wsgi_application)
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="flask"
+        )
+
+    async def __call__(self, scope, receive, send):
+        await _PooledWsgiInstance(self.wsgi_application, self.executor)(
+            scope, receive, send
+        )
+
+
+flask_application = PooledWsgiToAsgi(app, ASGI_THREADS)
+
+
+def _get_identity(headers):
+    """JWT identity for an access token, or None to let Flask handle the request"""
+    auth_header = headers.get(b"authorization", b"").decode("latin-1")
+    scheme, _, token = auth_header.partition(" ")
+    if scheme != "Bearer" or not token:
+        return None
+
+    try:
+        with app.app_context():
+            decoded = decode_token(token)
+    except Exception:
+        return None
+
+    if decoded.get("type") != "access":
+        return None
+    return decoded.get(app.config["JWT_IDENTITY_CLAIM"])
+
+
+async def _send_json(send, payload, status, headers):
+    """Send a JSON response; returns (status, body length) as actually sent"""
+    # Byte for byte what jsonify would send, so both modes share ETags
+    body = app.json.response(payload).get_data()
+    response_headers = [
+        (b"content-type", b"application/json"),
+        (b"vary", b"Accept-Encoding"),
+    ]
+    # Same tag the Flask route would give this body (see utils/etag.py)
+    if status == 200:
+        status, extra = etag_headers(body, headers)
+        response_headers.extend(extra)
+    if status == 304:
+        body = b""
+    else:
+        encoding = None
+        if COMPRESSION_ENABLED and status == 200 and len(body) >= MIN_SIZE:
+            encoding = choose_encoding(
+                headers.get(b"accept-encoding", b"").decode("latin-1")
+            )
+        if encoding is not None:
+            body = compress(body, encoding)
+            response_headers.append((b"content-encoding", encoding.encode()))
+            response_headers = [
+                (name, b"W/" + value) if name == b"etag" else (name, value)
+                for name, value in response_headers
+            ]
+        response_headers.append((b"content-length", str(len(body)).encode()))
+    # Match flask_cors' default of allowing any origin
+    if b"origin" in headers:
+        response_headers.append((b"access-control-allow-origin", b"*"))
+    await send(
+        {"type": "http.response.start", "status": status, "headers": response_headers}
+    )
+    await send({"type": "http.response.body", "body": body})
+    return status, len(body)
+
+
+async def _lifespan(receive, send):
+    while True:
+        message = await receive()
+        if message["type"] == "lifespan.startup":
+            await send({"type": "lifespan.startup.complete"})
+        elif message["type"] == "lifespan.shutdown":
+            await close_async_service_role_client()
+            flask_application.executor.shutdown(wait=False)
+            await send({"type": "lifespan.shutdown.complete"})
+            return
+
+
+async def application(scope, receive, send):
+    if scope["type"] == "lifespan":
+        await _lifespan(receive, send)
+        return
+
+    if scope["type"] == "http":
+        handler = ROUTES.get((scope["method"], scope["path"]))
+        if handler is not None:
+            headers = dict(scope["headers"])
+            auth_id = _get_identity(headers)
+            if auth_id is not None:
+                started = request_started(scope["path"])
+                # Stays 500 unless the response is sent, so a request that
+                # raises is still finished, exactly once
+                status, size = 500, 0
+                try:
+                    log, token = start_request_log(scope["path"])
+                    try:
+                        payload, handler_status = await handler(auth_id)
+                    finally:
+                        finish_request_log(log, token, scope["method"], scope["path"])
+                    status, size = await _send_json(
+                        send, payload, handler_status, headers
+                    )
+                finally:
+                    request_finished(
+                        started, scope["method"], scope["path"], status, 0, size
+                    )
+                return
+
+    await flask_application(scope, receive, send)
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Script to award every user the achievements they have already earned.
+Completions only check the thresholds they cross, so run this once after
+adding achievements to the catalog or deploying a fix that makes existing
+ones awardable. Logins run the same check for a single user.
+"""
+
+import os
+
+from dotenv import load_dotenv
+from supabase import Client, create_client
+
+from utils.achievements_with_db import award_achievements
+
+# Load environment variables
+load_dotenv()
+
+# Initialize Supabase client with service role key
+supabase_url = os.getenv("SUPABASE_URL")
+service_key = os.getenv("SUPABASE_SERVICE_KEY")
+
+if not supabase_url or not service_key:
+    print("Error: SUPABASE_URL and SUPABASE_SERVICE_KEY must be set in .env file")
+    exit(1)
+
+supabase: Client = create_client(supabase_url, service_key)
+
+
+def main():
+    user_ids = []
+    start = 0
+    while True:
+        page = (
+            supabase.table("users")
+            .select("id")
+            .order("id")
+            .range(start, start + 999)
+            .execute()
+        )
+        user_ids.extend(row["id"] for row in page.data or [])
+        if not page.data or len(page.data) < 1000:
+            break
+        start += 1000
+
+    response = input(
+        f"Do you want to check achievements for {len(user_ids)} users? (yes/no): "
+    )
+    if response.lower() != "yes":
+        print("Aborting...")
+        return
+
+    awarded = 0
+    for user_id in user_ids:
+        try:
+            earned = award_achievements(user_id, supabase, notify=True)
+        except Exception as e:
+            print(f"  - User {user_id[:8]}... failed: {e}")
+            continue
+        if earned:
+            awarded += len(earned)
+            print(f"  - User {user_id[:8]}... {[a['name'] for a in earned]}")
+
+    print(f"\nAwarded {awarded} achievements")
+
+
+if __name__ == "__main__":
+    main()
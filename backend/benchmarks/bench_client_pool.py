@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Benchmark per-request latency of the service role client.
+
+Compares building a fresh client for every request (the old behaviour of
+get_service_role_client) against the pooled keep-alive client, using a local
+PostgREST stand-in so the numbers are not dominated by network jitter.
+
+Usage: python benchmarks/bench_client_pool.py [requests]
+"""
+
+import json
+import os
+import statistics
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils import database
+
+
+class PostgrestStandIn(BaseHTTPRequestHandler):
+    """Answers every REST call with a single users row over HTTP/1.1"""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    # Simulated server-side query time (seconds)
+    query_delay = 0.001
+
+    def do_GET(self):
+        time.sleep(self.query_delay)
+        body = json.dumps([{"id": "00000000-0000-0000-0000-000000000001"}]).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_stand_in():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), PostgrestStandIn)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
+
+
+def lookup_user(client):
+    return client.table("users").select("id").eq("auth_id", "bench-auth-id").execute()
+
+
+def measure(label, get_client, iterations):
+    # Warm up imports and (for the pooled client) the first connection
+    lookup_user(get_client())
+
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        lookup_user(get_client())
+        samples.append((time.perf_counter() - start) * 1000)
+
+    samples.sort()
+    p95 = samples[int(len(samples) * 0.95) - 1]
+    print(
+        f"{label:<22} mean {statistics.mean(samples):7.3f} ms | "
+        f"p50 {statistics.median(samples):7.3f} ms | p95 {p95:7.3f} ms"
+    )
+    return statistics.mean(samples)
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    server = start_stand_in()
+    host, port = server.server_address
+
+    os.environ["SUPABASE_URL"] = f"http://{host}:{port}"
+    os.environ.setdefault("SUPABASE_SERVICE_KEY", "benchmark-service-key")
+
+    print(f"PostgREST stand-in on http://{host}:{port}, {iterations} requests each\n")
+
+    before = measure(
+        "new client per request", database.create_service_role_client, iterations
+    )
+    after = measure("pooled client", database.get_service_role_client, iterations)
+
+    print(f"\nSpeed-up: {before / after:.1f}x per request")
+
+    database.close_service_role_client()
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
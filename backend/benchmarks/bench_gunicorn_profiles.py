@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Benchmark gunicorn profiles for gunicorn.conf.py.
+
+Serves the backend under several worker setups against the PostgREST
+stand-in from bench_serving_modes.py (every query answered after a fixed
+delay) and drives GET /api/xp with many concurrent clients. For each profile
+it reports requests per second, latency percentiles, time until the first
+request succeeds and the workers' memory: PSS counts pages shared
+copy-on-write with the preloading master only fractionally, USS only the
+pages private to each worker.
+
+Profiles are set through the GUNICORN_* variables gunicorn.conf.py reads, so
+it runs with the shipped hooks. Linux only (memory comes from /proc).
+
+Usage: python benchmarks/bench_gunicorn_profiles.py [concurrency] [upstream_ms] [seconds]
+"""
+
+import asyncio
+import multiprocessing
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from bench_serving_modes import (
+    BACKEND_DIR,
+    JWT_SECRET,
+    drive,
+    free_port,
+    make_token,
+    report,
+    start_stand_in,
+    wait_until_ready,
+)
+
+CPUS = multiprocessing.cpu_count()
+
+# label -> GUNICORN_* overrides; the first is what backend-prod used to run
+PROFILES = {
+    "sync x4 (old backend-prod)": {
+        "GUNICORN_WORKER_CLASS": "sync",
+        "GUNICORN_WORKERS": "4",
+        "GUNICORN_PRELOAD": "false",
+    },
+    f"sync x{CPUS * 2 + 1}": {
+        "GUNICORN_WORKER_CLASS": "sync",
+        "GUNICORN_WORKERS": str(CPUS * 2 + 1),
+    },
+    f"gthread x{CPUS * 2} x4": {"GUNICORN_THREADS": "4"},
+    f"gthread x{CPUS * 2} x8 (default)": {},
+    f"gthread x{CPUS * 2} x8, no preload": {"GUNICORN_PRELOAD": "false"},
+    f"gthread x{CPUS * 2} x16": {"GUNICORN_THREADS": "16"},
+    f"gthread x{CPUS * 4} x8": {"GUNICORN_WORKERS": str(CPUS * 4)},
+    f"gevent x{CPUS * 2}": {"GUNICORN_WORKER_CLASS": "gevent"},
+}
+
+
+def worker_pids(master_pid):
+    children = Path(f"/proc/{master_pid}/task/{master_pid}/children")
+    return [int(pid) for pid in children.read_text().split()]
+
+
+def memory_mb(pids):
+    """Summed (PSS, USS) of processes in MB, from smaps_rollup"""
+    pss = uss = 0
+    for pid in pids:
+        fields = {}
+        for line in Path(f"/proc/{pid}/smaps_rollup").read_text().splitlines()[1:]:
+            name, value = line.split(":", 1)
+            fields[name] = int(value.split()[0])
+        pss += fields["Pss"]
+        uss += fields["Private_Clean"] + fields["Private_Dirty"]
+    return pss / 1024, uss / 1024
+
+
+def run_profile(label, overrides, env, token, concurrency, seconds):
+    port = free_port()
+    env = {
+        **env,
+        "GUNICORN_ACCESS_LOG": "",
+        "GUNICORN_BIND": f"127.0.0.1:{port}",
+        **overrides,
+    }
+    url = f"http://127.0.0.1:{port}/api/xp"
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "gunicorn", "-c", "gunicorn.conf.py", "wsgi:app"],
+        cwd=BACKEND_DIR,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        wait_until_ready(url, token)
+        startup = time.perf_counter() - started
+        latencies, errors, elapsed = asyncio.run(
+            drive(url, token, concurrency, seconds)
+        )
+        pss, uss = memory_mb(worker_pids(process.pid))
+        report(label, latencies, errors, elapsed)
+        print(
+            f"{'':<40} ready {startup:5.1f}s | workers PSS {pss:6.1f} MB, USS {uss:6.1f} MB"
+        )
+    finally:
+        process.terminate()
+        process.wait(timeout=60)
+
+
+def main():
+    concurrency = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    upstream_ms = float(sys.argv[2]) if len(sys.argv) > 2 else 50
+    seconds = float(sys.argv[3]) if len(sys.argv) > 3 else 10
+
+    stand_in, stand_in_port = start_stand_in(upstream_ms / 1000)
+    env = {
+        **os.environ,
+        "FLASK_ENV": "production",
+        "SUPABASE_URL": f"http://127.0.0.1:{stand_in_port}",
+        "SUPABASE_ANON_KEY": "benchmark-anon-key",
+        "SUPABASE_SERVICE_KEY": "benchmark-service-key",
+        "JWT_SECRET_KEY": JWT_SECRET,
+    }
+    token = make_token()
+
+    print(
+        f"{CPUS} CPUs, {concurrency} concurrent clients, "
+        f"{upstream_ms:.0f} ms per upstream query, {seconds:.0f}s per profile\n"
+    )
+    try:
+        import gevent  # noqa: F401
+    except ImportError:
+        print("gevent not installed, skipping the gevent profile\n")
+        PROFILES.pop(f"gevent x{CPUS * 2}", None)
+
+    for label, overrides in PROFILES.items():
+        run_profile(label, overrides, env, token, concurrency, seconds)
+    stand_in.terminate()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Benchmark encoding and compressing task-list responses.
+
+Builds GET /api/tasks and GET /api/boards/<id>/tasks bodies of realistic
+sizes and times Flask's default JSON provider against the orjson provider
+(utils/json_provider.py), then gzip and brotli at the levels
+utils/compression.py uses, with the bytes each would put on the wire.
+
+Usage: python benchmarks/bench_json_compression.py [sizes...]
+"""
+
+import random
+import sys
+import timeit
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+
+from utils import compression, json_provider
+
+WORDS = [
+    "review",
+    "draft",
+    "lab",
+    "report",
+    "chapter",
+    "notes",
+    "study",
+    "group",
+    "exam",
+    "prep",
+    "email",
+    "professor",
+    "submit",
+    "essay",
+    "outline",
+    "slides",
+    "read",
+    "pages",
+    "problem",
+    "set",
+]
+
+
+def _sentence(n):
+    return " ".join(random.choice(WORDS) for _ in range(n)).capitalize()
+
+
+def task_rows(count):
+    """Rows shaped like "Tasks" as GET /api/tasks returns them"""
+    start = datetime(2026, 1, 1)
+    rows = []
+    for _ in range(count):
+        created = start + timedelta(minutes=random.randint(0, 500_000))
+        completed = random.random() < 0.4
+        rows.append(
+            {
+                "id": str(uuid.uuid4()),
+                "user_id": "5f0c6a4e-9f55-4a4b-8f0e-0d6a4b7c1e21",
+                "title": _sentence(random.randint(2, 6)),
+                "description": _sentence(random.randint(5, 30)),
+                "due_date": (created + timedelta(days=7)).date().isoformat(),
+                "priority": random.choice(("low", "medium", "high")),
+                "completed": completed,
+                "create_date": created.isoformat() + "+00:00",
+                "updated_date": created.isoformat() + "+00:00",
+                "completed_date": created.isoformat() + "+00:00" if completed else None,
+                "assigned_to": random.choice(("", "sam", "alex")),
+            }
+        )
+    return rows
+
+
+def board_task_rows(rows):
+    """The per-task dicts get_board_tasks builds"""
+    return [
+        {
+            "id": row["id"],
+            "title": row["title"],
+            "description": row["description"],
+            "status": "done" if row["completed"] else "todo",
+            "priority": row["priority"],
+            "due_date": row["due_date"],
+            "added_by": "sam",
+            "added_at": row["create_date"],
+            "assigned_to": row["assigned_to"],
+        }
+        for row in rows
+    ]
+
+
+def best_of(fn, number):
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number
+
+
+def bench_payload(label, payload, providers):
+    print(f"\n{label}")
+    bodies = {}
+    for name, provider in providers.items():
+        seconds = best_of(lambda p=provider: p.response(payload).get_data(), 20)
+        bodies[name] = provider.response(payload).get_data()
+        print(
+            f"  {name:<10} encode {seconds * 1000:8.3f} ms   "
+            f"{len(bodies[name]):>10,} bytes"
+        )
+
+    body = bodies[next(reversed(bodies))]
+    for encoding in compression.supported_encodings():
+        seconds = best_of(lambda e=encoding: compression.compress(body, e), 10)
+        size = len(compression.compress(body, encoding))
+        print(
+            f"  {encoding:<10} compress {seconds * 1000:6.3f} ms   "
+            f"{size:>10,} bytes ({size / len(body):.0%})"
+        )
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10, 100, 1000, 5000]
+    random.seed(0)
+
+    app = Flask(__name__)
+    providers = {"stdlib": DefaultJSONProvider(app)}
+    if json_provider.orjson is None:
+        print("orjson not installed, timing the default provider only")
+    else:
+        providers["orjson"] = json_provider.OrjsonProvider(app)
+    if compression.brotli is None:
+        print("brotli not installed, timing gzip only")
+
+    for size in sizes:
+        rows = task_rows(size)
+        bench_payload(
+            f"GET /api/tasks, {size} tasks",
+            {"tasks": rows, "pagination": {"limit": size, "count": size}},
+            providers,
+        )
+        bench_payload(
+            f"GET /api/boards/<id>/tasks, {size} tasks",
+            {"tasks": board_task_rows(rows)},
+            providers,
+        )
+
+
+if __name__ == "__main__":
+    main()
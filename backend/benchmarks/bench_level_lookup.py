@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Benchmark level lookups.
+
+Compares the old linear scan over LEVEL_SYSTEM with the bisect-based
+get_level_info/get_level, and mapping a batch of XP totals one by one
+against get_levels (list input, plus a numpy array when numpy is installed).
+
+Usage: python benchmarks/bench_level_lookup.py [batch_size]
+"""
+
+import random
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.level_system import LEVEL_SYSTEM, get_level, get_level_info, get_levels
+
+
+def linear_level_info(total_xp):
+    """The previous implementation: scan every level until one matches"""
+    for level_data in LEVEL_SYSTEM:
+        if level_data["min_xp"] <= total_xp < level_data["max_xp"]:
+            if level_data["level"] < 10:
+                xp_in_level = total_xp - level_data["min_xp"]
+                xp_for_level = level_data["max_xp"] - level_data["min_xp"]
+                progress_percent = int((xp_in_level / xp_for_level) * 100)
+                xp_to_next = level_data["max_xp"] - total_xp
+            else:
+                progress_percent = 100
+                xp_to_next = 0
+
+            return {
+                "level": level_data["level"],
+                "level_name": level_data["name"],
+                "current_xp": total_xp,
+                "min_xp_for_level": level_data["min_xp"],
+                "max_xp_for_level": level_data["max_xp"],
+                "xp_to_next_level": xp_to_next,
+                "progress_percent": progress_percent,
+            }
+    return None
+
+
+def per_call(label, fn, values, number):
+    seconds = timeit.timeit(lambda: [fn(xp) for xp in values], number=number)
+    print(f"{label:<34} {seconds / (number * len(values)) * 1e9:8.1f} ns/lookup")
+
+
+def per_batch(label, fn, values, number):
+    seconds = timeit.timeit(lambda: fn(values), number=number)
+    print(f"{label:<34} {seconds / (number * len(values)) * 1e9:8.1f} ns/lookup")
+
+
+def main():
+    batch_size = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    random.seed(0)
+    values = [random.randint(0, 6000) for _ in range(batch_size)]
+    number = max(1, 1_000_000 // batch_size)
+
+    for xp in values[:1000]:
+        assert linear_level_info(xp) == get_level_info(xp)
+
+    print(f"{batch_size} XP values, {number} rounds\n")
+    per_call("linear scan (old get_level_info)", linear_level_info, values, number)
+    per_call("get_level_info (bisect)", get_level_info, values, number)
+    per_call(
+        "linear scan, level only",
+        lambda xp: linear_level_info(xp)["level"],
+        values,
+        number,
+    )
+    per_call("get_level (bisect)", get_level, values, number)
+    per_batch("get_levels(list)", get_levels, values, number)
+
+    try:
+        import numpy as np
+    except ImportError:
+        print("get_levels(ndarray)                numpy not installed, skipped")
+        return
+    array = np.array(values)
+    per_batch("get_levels(ndarray)", get_levels, array, number)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+Load benchmark: gunicorn sync workers vs the ASGI serving mode.
+
+Starts an asyncio PostgREST stand-in (in its own process) that answers every
+query after a fixed delay, then serves the backend both ways with the same
+number of worker processes and drives each of PATHS with many concurrent
+clients. Reports requests per second and latency percentiles for each mode
+and path.
+
+Needs gunicorn, uvicorn and asgiref installed.
+
+Usage: python benchmarks/bench_serving_modes.py [concurrency] [upstream_ms] [seconds]
+"""
+
+import asyncio
+import json
+import multiprocessing
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import httpx
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+WORKERS = int(os.getenv("BENCH_WORKERS", "4"))
+JWT_SECRET = "benchmark-jwt-secret-key-with-enough-length"
+
+# /api/xp is ported to routes/async_api.py; /api/tasks is not, so under
+# uvicorn it measures the Flask fallback thread pool (ASGI_THREADS)
+PATHS = ["/api/xp", "/api/tasks"]
+
+
+STAND_IN_ROW = {
+    "id": "00000000-0000-0000-0000-000000000001",
+    "email": "bench@example.com",
+    "total_xp": 420,
+}
+
+
+async def _handle_stand_in(reader, writer, query_delay):
+    """Minimal keep-alive HTTP/1.1 server: one row per request after a delay"""
+    body = json.dumps([STAND_IN_ROW]).encode()
+    try:
+        while True:
+            request_line = await reader.readline()
+            if not request_line:
+                break
+            content_length = 0
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b"\n", b""):
+                    break
+                name, _, value = line.decode("latin-1").partition(":")
+                if name.strip().lower() == "content-length":
+                    content_length = int(value.strip())
+            if content_length:
+                await reader.readexactly(content_length)
+
+            await asyncio.sleep(query_delay)
+            is_head = request_line.startswith(b"HEAD")
+            writer.write(
+                b"HTTP/1.1 200 OK\r\n"
+                b"Content-Type: application/json\r\n"
+                b"Content-Range: 0-0/1\r\n"
+                + f"Content-Length: {len(body)}\r\n\r\n".encode()
+                + (b"" if is_head else body)
+            )
+            await writer.drain()
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass
+    finally:
+        writer.close()
+
+
+def _serve_stand_in(port, query_delay):
+    async def serve():
+        server = await asyncio.start_server(
+            lambda r, w: _handle_stand_in(r, w, query_delay),
+            "127.0.0.1",
+            port,
+            backlog=2048,
+        )
+        async with server:
+            await server.serve_forever()
+
+    asyncio.run(serve())
+
+
+def start_stand_in(query_delay):
+    """PostgREST stand-in in its own process so it never competes for our GIL"""
+    port = free_port()
+    process = multiprocessing.Process(
+        target=_serve_stand_in, args=(port, query_delay), daemon=True
+    )
+    process.start()
+    deadline = time.monotonic() + 10
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=1).close()
+            return process, port
+        except OSError:
+            time.sleep(0.05)
+    raise RuntimeError("PostgREST stand-in did not start")
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def make_token():
+    from flask import Flask
+    from flask_jwt_extended import JWTManager, create_access_token
+
+    app = Flask(__name__)
+    app.config["JWT_SECRET_KEY"] = JWT_SECRET
+    JWTManager(app)
+    with app.app_context():
+        return create_access_token(identity="bench-auth-id")
+
+
+def start_server(command, env):
+    return subprocess.Popen(
+        command,
+        cwd=BACKEND_DIR,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+
+def wait_until_ready(url, token, timeout=30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            response = httpx.get(
+                url, headers={"Authorization": f"Bearer {token}"}, timeout=5
+            )
+            if response.status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f"Server at {url} did not become ready")
+
+
+async def drive(url, token, concurrency, seconds):
+    headers = {"Authorization": f"Bearer {token}"}
+    limits = httpx.Limits(
+        max_connections=concurrency, max_keepalive_connections=concurrency
+    )
+    latencies = []
+    errors = 0
+    deadline = time.perf_counter() + seconds
+
+    async with httpx.AsyncClient(limits=limits, timeout=60) as client:
+
+        async def worker():
+            nonlocal errors
+            while time.perf_counter() < deadline:
+                start = time.perf_counter()
+                try:
+                    response = await client.get(url, headers=headers)
+                    if response.status_code != 200:
+                        errors += 1
+                        continue
+                except httpx.HTTPError:
+                    errors += 1
+                    continue
+                latencies.append((time.perf_counter() - start) * 1000)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    return latencies, errors, elapsed
+
+
+def report(label, latencies, errors, elapsed):
+    if not latencies:
+        print(f"{label:<40} no successful requests ({errors} errors)")
+        return 0
+    latencies.sort()
+    p99 = latencies[max(int(len(latencies) * 0.99) - 1, 0)]
+    rps = len(latencies) / elapsed
+    print(
+        f"{label:<40} {rps:8.1f} req/s | p50 {statistics.median(latencies):8.1f} ms"
+        f" | p99 {p99:8.1f} ms | errors {errors}"
+    )
+    return rps
+
+
+def run_mode(label, command, env, token, concurrency, seconds, port):
+    """path -> requests per second for every path in PATHS"""
+    base_url = f"http://127.0.0.1:{port}"
+    process = start_server(command, env)
+    try:
+        wait_until_ready(base_url + PATHS[0], token)
+        rps = {}
+        for path in PATHS:
+            latencies, errors, elapsed = asyncio.run(
+                drive(base_url + path, token, concurrency, seconds)
+            )
+            rps[path] = report(f"{label} {path}", latencies, errors, elapsed)
+        return rps
+    finally:
+        process.terminate()
+        process.wait(timeout=30)
+
+
+def main():
+    concurrency = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    upstream_ms = float(sys.argv[2]) if len(sys.argv) > 2 else 50
+    seconds = float(sys.argv[3]) if len(sys.argv) > 3 else 10
+
+    stand_in, stand_in_port = start_stand_in(upstream_ms / 1000)
+
+    env = {
+        **os.environ,
+        "SUPABASE_URL": f"http://127.0.0.1:{stand_in_port}",
+        "SUPABASE_ANON_KEY": "benchmark-anon-key",
+        "SUPABASE_SERVICE_KEY": "benchmark-service-key",
+        "JWT_SECRET_KEY": JWT_SECRET,
+    }
+    token = make_token()
+
+    print(
+        f"{WORKERS} workers, {concurrency} concurrent clients, "
+        f"{upstream_ms:.0f} ms per upstream query, {seconds:.0f}s per path\n"
+    )
+
+    port = free_port()
+    sync_rps = run_mode(
+        "gunicorn sync (wsgi:app)",
+        [
+            sys.executable,
+            "-m",
+            "gunicorn",
+            "--bind",
+            f"127.0.0.1:{port}",
+            "--workers",
+            str(WORKERS),
+            "--backlog",
+            "2048",
+            "wsgi:app",
+        ],
+        # Plain sync workers, not the gthread default of gunicorn.conf.py
+        {**env, "GUNICORN_WORKER_CLASS": "sync"},
+        token,
+        concurrency,
+        seconds,
+        port,
+    )
+
+    port = free_port()
+    async_rps = run_mode(
+        "uvicorn (asgi:application)",
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "asgi:application",
+            "--host",
+            "127.0.0.1",
+            "--port",
+            str(port),
+            "--workers",
+            str(WORKERS),
+            "--no-access-log",
+            "--log-level",
+            "warning",
+        ],
+        env,
+        token,
+        concurrency,
+        seconds,
+        port,
+    )
+
+    print()
+    for path in PATHS:
+        if sync_rps[path]:
+            print(
+                f"Throughput {path}: {async_rps[path] / sync_rps[path]:.1f}x"
+                " with the ASGI mode"
+            )
+    stand_in.terminate()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Benchmark worker startup: importing app, create_app() and warm_up().
+
+Every run is a fresh interpreter, so module caches never carry over. Times
+are the median over the runs for:
+
+  import app                  what the gunicorn master or a worker pays to load wsgi
+  create_app(warm=False)      building the app, blueprints and extensions
+  warm_up()                   Supabase client and achievements catalog, against
+                              the PostgREST stand-in from bench_serving_modes.py
+
+It then runs create_app(warm=False) once under `python -X importtime` and
+lists the packages that cost the most, by their own import time summed over
+all of their modules, so a heavy import creeping back into the startup path
+shows up by name.
+
+Usage: python benchmarks/bench_startup.py [runs] [top]
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+
+from bench_serving_modes import BACKEND_DIR, JWT_SECRET, start_stand_in
+
+# Runs in the child; prints the stage timings as JSON
+STAGES = """
+import json, time
+started = time.perf_counter()
+import app
+imported = time.perf_counter()
+flask_app = app.create_app(warm=False)
+created = time.perf_counter()
+app.warm_up()
+warmed = time.perf_counter()
+from utils.health import monitor
+monitor.stop()
+print(json.dumps({
+    "import app": imported - started,
+    "create_app(warm=False)": created - imported,
+    "warm_up()": warmed - created,
+}))
+"""
+
+IMPORTTIME = "import app; app.create_app(warm=False)"
+
+
+def run_child(code, env, importtime=False):
+    command = [sys.executable]
+    if importtime:
+        command += ["-X", "importtime"]
+    return subprocess.run(
+        [*command, "-c", code],
+        cwd=BACKEND_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def package_import_times(stderr):
+    """Top-level package -> summed self import time in seconds"""
+    totals = defaultdict(int)
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = line[len("import time:") :].split("|")
+        totals[name.strip().split(".")[0]] += int(self_us)
+    return {name: us / 1e6 for name, us in totals.items()}
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    top = int(sys.argv[2]) if len(sys.argv) > 2 else 15
+
+    stand_in, stand_in_port = start_stand_in(0)
+    env = {
+        **os.environ,
+        "FLASK_ENV": "production",
+        "SUPABASE_URL": f"http://127.0.0.1:{stand_in_port}",
+        "SUPABASE_ANON_KEY": "benchmark-anon-key",
+        "SUPABASE_SERVICE_KEY": "benchmark-service-key",
+        "JWT_SECRET_KEY": JWT_SECRET,
+    }
+
+    try:
+        samples = defaultdict(list)
+        for _ in range(runs):
+            output = run_child(STAGES, env).stdout
+            timings = json.loads(output.strip().splitlines()[-1])
+            for stage, seconds in timings.items():
+                samples[stage].append(seconds)
+
+        print(f"Startup stages, median of {runs} fresh interpreters:")
+        for stage, values in samples.items():
+            print(
+                f"  {stage:<24} {statistics.median(values) * 1000:8.1f} ms"
+                f"  (min {min(values) * 1000:.1f}, max {max(values) * 1000:.1f})"
+            )
+
+        totals = package_import_times(run_child(IMPORTTIME, env, True).stderr)
+        print(
+            f"\n-X importtime for `{IMPORTTIME}`: "
+            f"{sum(totals.values()) * 1000:.1f} ms in {len(totals)} top-level packages"
+        )
+        for name, seconds in sorted(totals.items(), key=lambda item: -item[1])[:top]:
+            print(f"  {name:<24} {seconds * 1000:8.1f} ms")
+    finally:
+        stand_in.terminate()
+
+
+if __name__ == "__main__":
+    main()
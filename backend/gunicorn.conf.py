@@ -0,0 +1,99 @@
+"""
+Gunicorn settings for production: gunicorn -c gunicorn.conf.py wsgi:app
+
+The app is preloaded in the master, so imports and the achievements catalog
+are loaded once and shared copy-on-write by every worker. Anything that must
+not cross a fork (the master's health monitor thread, pooled connections) is
+stopped before the first worker starts and rebuilt per worker in post_fork.
+
+Workers default to gthread: requests mostly wait on Supabase, and threads let
+one worker overlap those waits while still sharing its connection pool.
+GUNICORN_WORKER_CLASS=gevent (pip install gevent) trades threads for
+greenlets. benchmarks/bench_gunicorn_profiles.py compares the profiles.
+"""
+
+import multiprocessing
+import os
+from pathlib import Path
+
+CPUS = multiprocessing.cpu_count()
+
+worker_class = os.getenv("GUNICORN_WORKER_CLASS", "gthread")
+if worker_class == "gevent":
+    # Patch before the app is preloaded, or its sockets and locks stay blocking
+    from gevent import monkey
+
+    monkey.patch_all()
+
+bind = os.getenv("GUNICORN_BIND", f"0.0.0.0:{os.getenv('PORT', '5000')}")
+workers = int(os.getenv("GUNICORN_WORKERS", str(CPUS * 2)))
+# Only for gthread (gunicorn turns sync into gthread when threads > 1)
+threads = int(os.getenv("GUNICORN_THREADS", "8")) if worker_class == "gthread" else 1
+worker_connections = int(os.getenv("GUNICORN_WORKER_CONNECTIONS", "100"))
+preload_app = os.getenv("GUNICORN_PRELOAD", "true").lower() == "true"
+
+# Recycle workers now and then so slow leaks cannot build up; the jitter keeps
+# them from all restarting at once
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", "2000"))
+max_requests_jitter = int(os.getenv("GUNICORN_MAX_REQUESTS_JITTER", "200"))
+
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "30"))
+# Time a worker gets on shutdown/reload to finish requests and flush buffers
+graceful_timeout = int(os.getenv("GUNICORN_GRACEFUL_TIMEOUT", "30"))
+keepalive = int(os.getenv("GUNICORN_KEEPALIVE", "5"))
+backlog = int(os.getenv("GUNICORN_BACKLOG", "2048"))
+
+# Empty disables the access log
+accesslog = os.getenv("GUNICORN_ACCESS_LOG", "-") or None
+errorlog = "-"
+
+# prometheus_client needs the directory before the app is (pre)loaded
+if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+    Path(os.environ["PROMETHEUS_MULTIPROC_DIR"]).mkdir(parents=True, exist_ok=True)
+
+
+def on_starting(server):
+    # Samples left by workers of a previous run would be merged into /metrics
+    multiproc_dir = os.getenv("PROMETHEUS_MULTIPROC_DIR")
+    if multiproc_dir:
+        for path in Path(multiproc_dir).glob("*.db"):
+            if not path.name.endswith(f"_{os.getpid()}.db"):
+                path.unlink(missing_ok=True)
+
+
+def when_ready(server):
+    if not preload_app:
+        return
+    from utils.database import close_service_role_client
+    from utils.health import monitor
+
+    # The master serves no requests; a thread or connection it still holds
+    # when a worker forks would be copied into that worker mid-use
+    monitor.stop(timeout=10)
+    close_service_role_client()
+
+
+def post_fork(server, worker):
+    from utils.database import init_service_role_client, init_supabase
+    from utils.health import monitor
+
+    try:
+        init_supabase()
+        init_service_role_client()
+    except Exception as e:
+        print(f"Worker {worker.pid}: Supabase client setup failed: {e}")
+    monitor.start()
+
+
+def worker_exit(server, worker):
+    from utils.jobs import shutdown_jobs
+    from utils.write_behind import flush_pending
+
+    flush_pending()
+    shutdown_jobs()
+
+
+def child_exit(server, worker):
+    from utils.metrics import mark_worker_dead
+
+    mark_worker_dead(worker.pid)
@@ -0,0 +1,64 @@
+-- XP ledger: an append-only history of every XP change, plus award_xp(),
+-- which applies a change atomically so concurrent awards never lose
+-- increments and the API pays a single round trip per award.
+--
+-- Apply with the Supabase SQL editor or `psql "$DATABASE_URL" -f ...`.
+
+create table if not exists xp_events (
+    id bigint generated always as identity primary key,
+    user_id uuid not null references users (id) on delete cascade,
+    amount integer not null,
+    reason text not null,
+    created_at timestamptz not null default now()
+);
+
+create index if not exists xp_events_user_id_idx on xp_events (user_id);
+
+-- Only the API's service role reads or appends to the ledger; with no
+-- policies, anon and authenticated clients get nothing through PostgREST
+alter table xp_events enable row level security;
+
+-- award_xp() relies on one user_xp row per user
+create unique index if not exists user_xp_user_id_key on user_xp (user_id);
+
+-- Opening balances, so replaying the ledger reproduces today's totals
+insert into xp_events (user_id, amount, reason)
+select x.user_id, x.total_xp, 'opening_balance'
+from user_xp x
+where x.total_xp <> 0
+  and not exists (select 1 from xp_events e where e.user_id = x.user_id);
+
+-- Add p_amount to a user's XP (never below zero), record the change that
+-- was actually applied in the ledger, and return the new total.
+create or replace function award_xp(p_user_id uuid, p_amount integer, p_reason text)
+returns integer
+language plpgsql
+as $$
+declare
+    old_total integer;
+    new_total integer;
+begin
+    insert into user_xp (user_id, total_xp)
+    values (p_user_id, 0)
+    on conflict (user_id) do nothing;
+
+    select total_xp into old_total
+    from user_xp
+    where user_id = p_user_id
+    for update;
+
+    new_total := greatest(0, old_total + p_amount);
+
+    if new_total <> old_total then
+        update user_xp set total_xp = new_total where user_id = p_user_id;
+
+        insert into xp_events (user_id, amount, reason)
+        values (p_user_id, new_total - old_total, p_reason);
+    end if;
+
+    return new_total;
+end;
+$$;
+
+-- Only the backend (service role) may award XP
+revoke execute on function award_xp(uuid, integer, text) from public, anon, authenticated;
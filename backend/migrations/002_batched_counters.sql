@@ -0,0 +1,46 @@
+-- Batched counter updates used by the write-behind buffer in
+-- utils/write_behind.py. Each call applies many coalesced increments in a
+-- single round trip.
+
+-- increment_daily_task_stats() upserts on (user_id, date)
+create unique index if not exists daily_task_stats_user_date_key
+    on daily_task_stats (user_id, date);
+
+-- p_awards: [{"user_id": ..., "amount": ..., "reason": ...}, ...]
+create or replace function award_xp_batch(p_awards jsonb)
+returns void
+language plpgsql
+as $$
+declare
+    award jsonb;
+begin
+    -- Lock user_xp rows in a stable order so concurrent batches cannot deadlock
+    for award in
+        select value from jsonb_array_elements(p_awards)
+        order by value->>'user_id', value->>'reason'
+    loop
+        perform award_xp(
+            (award->>'user_id')::uuid,
+            (award->>'amount')::integer,
+            award->>'reason'
+        );
+    end loop;
+end;
+$$;
+
+-- p_rows: [{"user_id": ..., "date": "YYYY-MM-DD", "count": ...}, ...]
+-- with at most one entry per (user_id, date)
+create or replace function increment_daily_task_stats(p_rows jsonb)
+returns void
+language sql
+as $$
+    insert into daily_task_stats as s (user_id, date, tasks_completed)
+    select (r->>'user_id')::uuid, (r->>'date')::date, (r->>'count')::integer
+    from jsonb_array_elements(p_rows) as r
+    order by 1, 2
+    on conflict (user_id, date)
+    do update set tasks_completed = s.tasks_completed + excluded.tasks_completed;
+$$;
+
+revoke execute on function award_xp_batch(jsonb) from public, anon, authenticated;
+revoke execute on function increment_daily_task_stats(jsonb) from public, anon, authenticated;
@@ -0,0 +1,20 @@
+-- Pending notifications produced by background jobs (e.g. achievements
+-- earned after a completion response was already sent). Rows are handed
+-- out once by GET /api/notifications, which stamps delivered_at.
+
+create table if not exists notifications (
+    id bigint generated always as identity primary key,
+    user_id uuid not null references users (id) on delete cascade,
+    kind text not null,
+    payload jsonb not null default '{}'::jsonb,
+    created_at timestamptz not null default now(),
+    delivered_at timestamptz
+);
+
+create index if not exists notifications_pending_idx
+    on notifications (user_id, id)
+    where delivered_at is null;
+
+-- The frontend reads notifications only through the API, which uses the
+-- service role, so there are no policies and clients get nothing directly
+alter table notifications enable row level security;
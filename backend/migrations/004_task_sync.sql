@@ -0,0 +1,77 @@
+-- Delta sync for GET /api/tasks/changes. The database owns updated_date and
+-- records a tombstone for every deleted task, so every route (and any direct
+-- SQL) keeps the change feed consistent without remembering to.
+
+-- updated_date is always the server's clock, never the client's
+create or replace function touch_task_updated_date()
+returns trigger
+language plpgsql
+as $$
+begin
+    new.updated_date := now();
+    return new;
+end;
+$$;
+
+drop trigger if exists tasks_touch_updated_date on "Tasks";
+create trigger tasks_touch_updated_date
+    before insert or update on "Tasks"
+    for each row execute function touch_task_updated_date();
+
+update "Tasks" set updated_date = coalesce(updated_date, create_date, now())
+    where updated_date is null;
+
+create index if not exists tasks_user_updated_idx
+    on "Tasks" (user_id, updated_date);
+
+-- task_id is text so it matches whatever type "Tasks".id uses
+create table if not exists task_tombstones (
+    task_id text not null,
+    user_id uuid not null references users (id) on delete cascade,
+    deleted_at timestamptz not null default now(),
+    primary key (task_id)
+);
+
+create index if not exists task_tombstones_user_deleted_idx
+    on task_tombstones (user_id, deleted_at);
+
+-- Read only by the API's service role; no policies, so anon and
+-- authenticated clients see nothing
+alter table task_tombstones enable row level security;
+
+-- security definer so deletes by any role can write the tombstone past RLS
+
+create or replace function record_task_tombstone()
+returns trigger
+language plpgsql
+security definer
+set search_path = public
+as $$
+begin
+    insert into task_tombstones (task_id, user_id)
+    values (old.id::text, old.user_id)
+    on conflict (task_id) do update set deleted_at = excluded.deleted_at;
+    return old;
+end;
+$$;
+
+drop trigger if exists tasks_record_tombstone on "Tasks";
+create trigger tasks_record_tombstone
+    after delete on "Tasks"
+    for each row execute function record_task_tombstone();
+
+-- Tombstones older than the retention window are pruned (e.g. daily via
+-- pg_cron); clients whose token is older are told to do a full reload.
+create or replace function prune_task_tombstones(p_retention interval)
+returns integer
+language sql
+as $$
+    with pruned as (
+        delete from task_tombstones
+        where deleted_at < now() - p_retention
+        returning 1
+    )
+    select count(*)::integer from pruned;
+$$;
+
+revoke execute on function prune_task_tombstones(interval) from public, anon, authenticated;
@@ -0,0 +1,116 @@
+-- Retry-safe writes for the background jobs in utils/completion.py. The job
+-- runner retries a job that raised, which includes a job whose writes had
+-- already committed (e.g. the response was lost), so each job's writes are
+-- either keyed or done in a single transaction.
+
+-- Keys of increment_daily_task_stats() rows already applied. They only have
+-- to outlive a job's retries, so each call prunes those older than a day.
+create table if not exists daily_task_stats_applied (
+    key text primary key,
+    applied_at timestamptz not null default now()
+);
+
+create index if not exists daily_task_stats_applied_at_idx
+    on daily_task_stats_applied (applied_at);
+
+-- Only touched by increment_daily_task_stats() as the service role
+alter table daily_task_stats_applied enable row level security;
+
+-- p_rows: [{"user_id": ..., "date": "YYYY-MM-DD", "count": ..., "key": ...}, ...]
+-- with at most one entry per (user_id, date). A row with a key is applied at
+-- most once; rows without one always are.
+create or replace function increment_daily_task_stats(p_rows jsonb)
+returns void
+language sql
+as $$
+    delete from daily_task_stats_applied
+    where applied_at < now() - interval '1 day';
+
+    with fresh as (
+        insert into daily_task_stats_applied (key)
+        select r->>'key'
+        from jsonb_array_elements(p_rows) as r
+        where r ? 'key'
+        on conflict (key) do nothing
+        returning key
+    )
+    insert into daily_task_stats as s (user_id, date, tasks_completed)
+    select (r->>'user_id')::uuid, (r->>'date')::date, (r->>'count')::integer
+    from jsonb_array_elements(p_rows) as r
+    where not r ? 'key' or r->>'key' in (select key from fresh)
+    order by 1, 2
+    on conflict (user_id, date)
+    do update set tasks_completed = s.tasks_completed + excluded.tasks_completed;
+$$;
+
+-- award_achievements() inserts on (user_id, achievement_id); drop any
+-- duplicates earlier concurrent checks may have left first
+delete from user_achievements a
+using user_achievements b
+where a.user_id = b.user_id
+  and a.achievement_id = b.achievement_id
+  and a.ctid > b.ctid;
+
+create unique index if not exists user_achievements_user_achievement_key
+    on user_achievements (user_id, achievement_id);
+
+-- Award the given achievements a user does not have yet, their XP and, with
+-- p_notify, one 'achievement' notification each (payload as built by
+-- utils/achievements_with_db.py), all in one transaction. Returns the ids
+-- actually awarded, so a repeated call awards, credits and notifies nothing.
+create or replace function award_achievements(
+    p_user_id uuid,
+    p_achievement_ids text[],
+    p_reason text,
+    p_notify boolean default false
+)
+returns text[]
+language plpgsql
+as $$
+declare
+    new_ids text[];
+    gained integer;
+begin
+    with inserted as (
+        insert into user_achievements (user_id, achievement_id)
+        select p_user_id, a.id
+        from achievements a
+        where a.id::text = any(p_achievement_ids)
+        order by a.id
+        on conflict (user_id, achievement_id) do nothing
+        returning achievement_id
+    )
+    select coalesce(array_agg(achievement_id::text), '{}') into new_ids
+    from inserted;
+
+    if cardinality(new_ids) = 0 then
+        return new_ids;
+    end if;
+
+    select coalesce(sum(xp_reward), 0) into gained
+    from achievements
+    where id::text = any(new_ids);
+
+    if gained <> 0 then
+        perform award_xp(p_user_id, gained, p_reason);
+    end if;
+
+    if p_notify then
+        insert into notifications (user_id, kind, payload)
+        select p_user_id, 'achievement', jsonb_build_object(
+            'name', name,
+            'description', description,
+            'icon', icon,
+            'xp_reward', xp_reward
+        )
+        from achievements
+        where id::text = any(new_ids)
+        order by sort_order;
+    end if;
+
+    return new_ids;
+end;
+$$;
+
+revoke execute on function increment_daily_task_stats(jsonb) from public, anon, authenticated;
+revoke execute on function award_achievements(uuid, text[], text, boolean) from public, anon, authenticated;
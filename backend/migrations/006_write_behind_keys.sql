@@ -0,0 +1,56 @@
+-- Retry-safe flushes for the write-behind buffer in utils/write_behind.py.
+-- A batch whose call failed is retried with the same keys, and that includes
+-- a batch that had committed (e.g. the response timed out), so every award
+-- with a key is applied at most once. Daily stats rows already are (see
+-- 005_idempotent_jobs.sql).
+
+-- Keys of award_xp_batch() entries already applied. They only have to
+-- outlive a batch's retries, so each call prunes those older than a day.
+create table if not exists xp_awards_applied (
+    key text primary key,
+    applied_at timestamptz not null default now()
+);
+
+create index if not exists xp_awards_applied_at_idx
+    on xp_awards_applied (applied_at);
+
+-- Only touched by award_xp_batch() as the service role
+alter table xp_awards_applied enable row level security;
+
+-- p_awards: [{"user_id": ..., "amount": ..., "reason": ..., "key": ...}, ...]
+-- An award with a key is applied at most once; awards without one always are.
+create or replace function award_xp_batch(p_awards jsonb)
+returns void
+language plpgsql
+as $$
+declare
+    award jsonb;
+begin
+    delete from xp_awards_applied
+    where applied_at < now() - interval '1 day';
+
+    -- Lock user_xp rows in a stable order so concurrent batches cannot deadlock
+    for award in
+        select value from jsonb_array_elements(p_awards)
+        order by value->>'user_id', value->>'reason'
+    loop
+        if award ? 'key' then
+            insert into xp_awards_applied (key)
+            values (award->>'key')
+            on conflict (key) do nothing;
+
+            if not found then
+                continue;
+            end if;
+        end if;
+
+        perform award_xp(
+            (award->>'user_id')::uuid,
+            (award->>'amount')::integer,
+            award->>'reason'
+        );
+    end loop;
+end;
+$$;
+
+revoke execute on function award_xp_batch(jsonb) from public, anon, authenticated;
@@ -9,6 +9,8 @@ import os
 from dotenv import load_dotenv
 from supabase import Client, create_client
 
+from utils.achievement_catalog import bump_catalog_version
+
 # Load environment variables
 load_dotenv()
 
@@ -197,6 +199,10 @@ def main():
 
     print(f"\nSuccessfully inserted {success_count}/{len(achievements)} achievements")
 
+    # Running workers reload their in-memory catalog on the next request
+    bump_catalog_version()
+    print("Bumped achievements catalog version")
+
     # Verify the data
     final_check = (
         supabase.table("achievements").select("*").order("sort_order").execute()
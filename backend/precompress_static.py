@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Script to write .br and .gz variants next to the files of the frontend build.
+Run it after `npm run build` (frontend-prod does); utils/static_assets.py
+serves the variants in production instead of compressing per worker.
+
+Usage: python precompress_static.py [build_dir]
+"""
+
+import gzip
+import mimetypes
+import sys
+from pathlib import Path
+
+from utils.compression import MIN_SIZE, compressible
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Compressed once per build, so use the slowest, smallest settings
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 11
+
+DEFAULT_BUILD_DIR = Path(__file__).resolve().parent.parent / "frontend" / "build"
+
+
+def _write_variant(path, suffix, data, source_size):
+    variant_path = path.with_name(path.name + suffix)
+    if len(data) >= source_size:
+        # Not worth sending; drop one from an earlier run
+        variant_path.unlink(missing_ok=True)
+        return 0
+    variant_path.write_bytes(data)
+    return len(data)
+
+
+def precompress(build_dir):
+    """Write variants for every compressible file; returns (files, bytes before, after)"""
+    files = before = after = 0
+    for path in sorted(build_dir.rglob("*")):
+        if path.suffix in (".br", ".gz") or not path.is_file():
+            continue
+        if not compressible(mimetypes.guess_type(path.name)[0]):
+            continue
+        body = path.read_bytes()
+        if len(body) < MIN_SIZE:
+            continue
+
+        files += 1
+        before += len(body)
+        sizes = [
+            _write_variant(
+                path,
+                ".gz",
+                gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0),
+                len(body),
+            )
+        ]
+        if brotli is not None:
+            sizes.append(
+                _write_variant(
+                    path,
+                    ".br",
+                    brotli.compress(body, quality=BROTLI_QUALITY),
+                    len(body),
+                )
+            )
+        after += min((size for size in sizes if size), default=len(body))
+    return files, before, after
+
+
+def main():
+    build_dir = Path(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_BUILD_DIR
+    if not build_dir.is_dir():
+        print(f"Error: {build_dir} does not exist, run npm run build first")
+        exit(1)
+    if brotli is None:
+        print("brotli not installed, writing .gz variants only")
+
+    files, before, after = precompress(build_dir)
+    print(f"Precompressed {files} files in {build_dir}")
+    if files:
+        print(
+            f"  {before:,} -> {after:,} bytes ({after / before:.0%}) for the best variant"
+        )
+
+
+if __name__ == "__main__":
+    main()
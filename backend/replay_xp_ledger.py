@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Script to rebuild user_xp totals by replaying the xp_events ledger.
+Run this after restoring a backup or if user_xp ever drifts from the ledger.
+"""
+
+import os
+
+from dotenv import load_dotenv
+from supabase import Client, create_client
+
+from utils.xp import replay_ledger
+
+# Load environment variables
+load_dotenv()
+
+# Initialize Supabase client with service role key
+supabase_url = os.getenv("SUPABASE_URL")
+service_key = os.getenv("SUPABASE_SERVICE_KEY")
+
+if not supabase_url or not service_key:
+    print("Error: SUPABASE_URL and SUPABASE_SERVICE_KEY must be set in .env file")
+    exit(1)
+
+supabase: Client = create_client(supabase_url, service_key)
+
+
+def main():
+    print("Replaying xp_events ledger...\n")
+
+    ledger_totals = replay_ledger(supabase)
+    print(f"Ledger covers {len(ledger_totals)} users")
+
+    current_totals = {}
+    start = 0
+    while True:
+        page = (
+            supabase.table("user_xp")
+            .select("user_id, total_xp")
+            .order("user_id")
+            .range(start, start + 999)
+            .execute()
+        )
+        for row in page.data or []:
+            current_totals[row["user_id"]] = row["total_xp"]
+        if not page.data or len(page.data) < 1000:
+            break
+        start += 1000
+
+    # Users missing from the ledger have never earned XP through award_xp
+    mismatches = {}
+    for user_id in set(ledger_totals) | set(current_totals):
+        expected = ledger_totals.get(user_id, 0)
+        if current_totals.get(user_id) != expected:
+            mismatches[user_id] = expected
+
+    if not mismatches:
+        print("✨ Every user_xp total matches the ledger.")
+        return
+
+    print(f"\nFound {len(mismatches)} totals that differ from the ledger:")
+    for user_id, expected in mismatches.items():
+        print(f"  - User {user_id[:8]}... {current_totals.get(user_id)} -> {expected}")
+
+    response = input(
+        "\nDo you want to rewrite these totals from the ledger? (yes/no): "
+    )
+    if response.lower() != "yes":
+        print("Aborting...")
+        return
+
+    rows = [
+        {"user_id": user_id, "total_xp": expected}
+        for user_id, expected in mismatches.items()
+    ]
+    supabase.table("user_xp").upsert(rows, on_conflict="user_id").execute()
+    print(f"\nRewrote {len(rows)} user_xp totals")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Achievements with earned state for the signed-in user."""
+
+from flask import Blueprint, jsonify
+from flask_jwt_extended import get_jwt_identity, jwt_required
+
+from utils.achievement_catalog import describe_achievements, get_catalog
+from utils.auth import get_user_by_auth_id
+from utils.database import get_service_role_client
+from utils.etag import with_etag
+from utils.fanout import gather
+from utils.stats import achievement_stats, count_completed, get_total_xp
+
+bp = Blueprint("achievements", __name__)
+
+
+@bp.route("/api/achievements", methods=["GET"])
+@jwt_required()
+def get_achievements():
+    """Get user's achievements with emoji badges"""
+    try:
+        auth_id = get_jwt_identity()
+        service_supabase = get_service_role_client()
+
+        user = get_user_by_auth_id(auth_id)
+        if not user:
+            return jsonify({"error": "User not found"}), 404
+
+        user_id = user["id"]
+
+        # These queries are independent, so issue them all at once
+        total_tasks, total_focus, total_xp, earned_response = gather(
+            lambda: count_completed(service_supabase, "tasks", user_id),
+            lambda: count_completed(service_supabase, "focus", user_id),
+            lambda: get_total_xp(service_supabase, user_id),
+            lambda: (
+                service_supabase.table("user_achievements")
+                .select("achievement_id, earned_at")
+                .eq("user_id", user_id)
+                .execute()
+            ),
+            return_exceptions=True,
+        )
+
+        stats = achievement_stats(total_tasks, total_focus, total_xp)
+
+        if isinstance(earned_response, Exception):
+            raise earned_response
+
+        catalog = get_catalog(service_supabase)
+
+        if not catalog.achievements:
+            return jsonify({"error": "No achievements found in database"}), 500
+
+        all_achievements, total_earned = describe_achievements(
+            catalog, stats, earned_response.data or []
+        )
+
+        print(
+            f"User stats - Tasks: {stats['tasks_completed']}, "
+            f"Focus: {stats['focus_sessions']}, Level: {stats['level']}"
+        )
+
+        return with_etag(
+            jsonify(
+                {
+                    "achievements": all_achievements,
+                    "total_earned": total_earned,
+                    "stats": stats,
+                }
+            )
+        )
+
+    except Exception as e:
+        print(f"Error fetching achievements: {e}")
+        return jsonify({"error": "Failed to fetch achievements"}), 500
@@ -0,0 +1,105 @@
+"""Analytics endpoints."""
+
+from datetime import date
+
+from flask import Blueprint, jsonify, request
+from flask_jwt_extended import get_jwt_identity, jwt_required
+
+from utils.auth import get_user_by_auth_id
+from utils.database import get_service_role_client
+from utils.stats import (
+    daily_completions_query,
+    last_7_days,
+    summarize_daily_completions,
+)
+
+bp = Blueprint("analytics", __name__)
+
+
+@bp.route("/api/analytics/daily-completions", methods=["GET"])
+@jwt_required()
+def get_daily_completions():
+    """Get daily task completions for the past 7 days"""
+    try:
+        auth_id = get_jwt_identity()
+        service_supabase = get_service_role_client()
+
+        user = get_user_by_auth_id(auth_id)
+
+        if not user:
+            return jsonify({"error": "User not found"}), 404
+
+        user_id = user["id"]
+
+        dates = last_7_days()
+        stats_response = daily_completions_query(
+            service_supabase, user_id, dates
+        ).execute()
+
+        return jsonify(
+            summarize_daily_completions(dates, stats_response.data or [])
+        ), 200
+
+    except Exception as e:
+        print(f"Daily analytics error: {e}")
+        return jsonify({"error": str(e)}), 500
+
+
+@bp.route("/api/analytics/tasks", methods=["GET"])
+@jwt_required()
+def get_task_analytics():
+    """Get task completion statistics"""
+    try:
+        auth_id = get_jwt_identity()
+
+        service_supabase = get_service_role_client()
+
+        user = get_user_by_auth_id(auth_id)
+
+        if not user:
+            return jsonify({"error": "User profile not found"}), 404
+
+        user_id = user["id"]
+
+        start_date = request.args.get("start_date", date.today().isoformat())
+        end_date = request.args.get("end_date", date.today().isoformat())
+
+        stats_response = (
+            service_supabase.table("daily_task_stats")
+            .select("*")
+            .eq("user_id", user_id)
+            .gte("date", start_date)
+            .lte("date", end_date)
+            .order("date")
+            .execute()
+        )
+
+        stats = stats_response.data if stats_response.data else []
+        total_completed = sum(stat["tasks_completed"] for stat in stats)
+
+        return jsonify(
+            {
+                "start_date": start_date,
+                "end_date": end_date,
+                "total_completed": total_completed,
+                "daily_stats": stats,
+                "days_tracked": len(stats),
+            }
+        ), 200
+
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
+@bp.route("/api/analytics/focus", methods=["GET"])
+def get_focus_analytics():
+    """get focus session analytics"""
+    return jsonify({"message": "get focus analytics endpoint - todo: implement"}), 501
+
+
+@bp.route("/api/analytics/productivity", methods=["GET"])
+def get_productivity_analytics():
+    """get productivity trends and patterns"""
+    return jsonify(
+        {"message": "get productivity analytics endpoint - todo: implement"}
+    ), 501
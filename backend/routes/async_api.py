@@ -0,0 +1,120 @@
+"""Async ports of the read endpoints that spend most of their time upstream.
+
+Served by asgi.py on the async Supabase client. Each handler takes the JWT
+identity and returns (payload, status) exactly as its Flask twin in routes/
+would; the response shapes are shared through the same utils builders.
+"""
+
+import asyncio
+
+from utils.achievement_catalog import describe_achievements, get_catalog
+from utils.async_database import get_async_service_role_client
+from utils.auth import get_user_by_auth_id_async
+from utils.boards import summarize_boards
+from utils.level_system import xp_summary
+from utils.stats import (
+    achievement_stats,
+    count_completed_async,
+    get_total_xp_async,
+)
+from utils.write_behind import pending_xp
+
+
+async def get_user_xp(auth_id):
+    """Get user's current XP, level, and progress"""
+    try:
+        service_supabase = await get_async_service_role_client()
+        user = await get_user_by_auth_id_async(auth_id, service_supabase)
+
+        if not user:
+            return xp_summary(0), 200
+
+        user_id = user["id"]
+        total_xp = await get_total_xp_async(service_supabase, user_id)
+        return xp_summary(total_xp + pending_xp(user_id)), 200
+
+    except Exception as e:
+        return {"error": str(e)}, 500
+
+
+async def get_achievements(auth_id):
+    """Get user's achievements with emoji badges"""
+    try:
+        service_supabase = await get_async_service_role_client()
+        user = await get_user_by_auth_id_async(auth_id, service_supabase)
+        if not user:
+            return {"error": "User not found"}, 404
+
+        user_id = user["id"]
+
+        total_tasks, total_focus, total_xp, earned_response = await asyncio.gather(
+            count_completed_async(service_supabase, "tasks", user_id),
+            count_completed_async(service_supabase, "focus", user_id),
+            get_total_xp_async(service_supabase, user_id),
+            service_supabase.table("user_achievements")
+            .select("achievement_id, earned_at")
+            .eq("user_id", user_id)
+            .execute(),
+            return_exceptions=True,
+        )
+
+        stats = achievement_stats(total_tasks, total_focus, total_xp)
+
+        if isinstance(earned_response, Exception):
+            raise earned_response
+
+        # Usually an in-memory hit; a reload uses the sync client, so keep it
+        # off the event loop
+        catalog = await asyncio.to_thread(get_catalog)
+
+        if not catalog.achievements:
+            return {"error": "No achievements found in database"}, 500
+
+        all_achievements, total_earned = describe_achievements(
+            catalog, stats, earned_response.data or []
+        )
+
+        return {
+            "achievements": all_achievements,
+            "total_earned": total_earned,
+            "stats": stats,
+        }, 200
+
+    except Exception as e:
+        print(f"Error fetching achievements: {e}")
+        return {"error": "Failed to fetch achievements"}, 500
+
+
+async def get_shared_boards(auth_id):
+    """get user's shared task boards (owned and joined)"""
+    try:
+        service_supabase = await get_async_service_role_client()
+        user = await get_user_by_auth_id_async(auth_id, service_supabase)
+        if not user:
+            return {"error": "User profile not found"}, 404
+
+        owned_boards, accepted_invites = await asyncio.gather(
+            service_supabase.table("SharedBoards")
+            .select("*, users!inner(username)")
+            .eq("user_id", user["id"])
+            .execute(),
+            service_supabase.table("BoardInvites")
+            .select("*, SharedBoards!inner(*, users!inner(username))")
+            .eq("invited_email", user["email"])
+            .eq("status", "Accepted")
+            .execute(),
+        )
+
+        boards = summarize_boards(owned_boards.data or [], accepted_invites.data or [])
+        return {"boards": boards}, 200
+
+    except Exception as e:
+        return {"error": str(e)}, 500
+
+
+# (method, path) -> handler, dispatched by asgi.py
+ROUTES = {
+    ("GET", "/api/xp"): get_user_xp,
+    ("GET", "/api/achievements"): get_achievements,
+    ("GET", "/api/boards"): get_shared_boards,
+}
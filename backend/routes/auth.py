@@ -0,0 +1,256 @@
+"""Registration, login and logout against Supabase Auth."""
+
+from flask import Blueprint, jsonify, request
+from flask_jwt_extended import create_access_token
+
+from utils.auth import cache_user_profile, invalidate_user
+from utils.completion import recheck_achievements
+from utils.database import get_service_role_client, get_supabase_client
+
+bp = Blueprint("auth", __name__)
+
+
+@bp.route("/api/auth/register", methods=["POST"])
+def register():
+    """register new user account"""
+    try:
+        data = request.get_json()
+
+        if not data:
+            return jsonify({"error": "No data provided"}), 400
+
+        email = data.get("email")
+        password = data.get("password")
+        username = data.get("username")
+        major = data.get("major")
+        year = data.get("year")
+        first_name = data.get("firstName")
+        last_name = data.get("lastName")
+        if not email or not password:
+            return jsonify({"error": "Email and password are required"}), 400
+
+        if not username:
+            return jsonify({"error": "Username is required"}), 400
+
+        if len(password) < 6:
+            return jsonify(
+                {"error": "Password must be at least 6 characters long"}
+            ), 400
+        if not any(char.isdigit() for char in password):
+            return jsonify({"error": "Password must contain at least one number"}), 400
+        if not any(char in '!@#$%^&*(),.?":{}|<>' for char in password):
+            return jsonify({"error": "Password must contain at least one symbol"}), 400
+
+        supabase = get_supabase_client()
+
+        existing_username = (
+            supabase.table("users")
+            .select("username")
+            .eq("username", username)
+            .execute()
+        )
+        if existing_username.data:
+            return jsonify({"error": "Username already exists"}), 400
+
+        auth_response = supabase.auth.sign_up({"email": email, "password": password})
+
+        if not auth_response.user:
+            return jsonify({"error": "Failed to create auth user"}), 400
+
+        service_supabase = get_service_role_client()
+
+        user_profile_data = {
+            "auth_id": auth_response.user.id,
+            "email": email,
+            "username": username,
+            "major": major,
+            "year": year,
+            "first_name": first_name,
+            "last_name": last_name,
+            "email_verified": False,
+        }
+
+        profile_response = (
+            service_supabase.table("users").insert(user_profile_data).execute()
+        )
+        invalidate_user(auth_response.user.id)
+
+        if profile_response.data:
+            return jsonify(
+                {
+                    "message": "User successfully created",
+                    "user": {
+                        "id": profile_response.data[0]["id"],
+                        "email": email,
+                        "username": username,
+                        "major": major,
+                        "year": year,
+                        "first_name": first_name,
+                        "last_name": last_name,
+                    },
+                    "access_token": auth_response.session.access_token
+                    if auth_response.session
+                    else None,
+                    "note": "Please check your email to verify your account",
+                }
+            ), 201
+        return jsonify({"error": "Failed to create user profile"}), 400
+
+    except Exception as e:
+        error_message = str(e)
+        print(f"Registration error: {error_message}")
+
+        if "User already registered" in error_message:
+            return jsonify({"error": "An account with this email already exists"}), 400
+        if (
+            "duplicate key value violates unique constraint" in error_message
+            and "username" in error_message
+        ):
+            return jsonify({"error": "Username already exists"}), 400
+
+        return jsonify({"error": "Registration failed", "details": error_message}), 500
+
+
+@bp.route("/api/auth/check-username", methods=["POST"])
+def check_username():
+    """Check if username is available"""
+    try:
+        data = request.get_json()
+        username = data.get("username", "").strip()
+
+        if not username:
+            return jsonify({"available": False, "message": "Username is required"}), 200
+
+        if len(username) < 3:
+            return jsonify(
+                {
+                    "available": False,
+                    "message": "Username must be at least 3 characters",
+                }
+            ), 200
+
+        if not username.replace("_", "").replace("-", "").isalnum():
+            return jsonify(
+                {
+                    "available": False,
+                    "message": "Username can only contain letters, numbers, - and _",
+                }
+            ), 200
+
+        service_supabase = get_service_role_client()
+        existing = (
+            service_supabase.table("users")
+            .select("id")
+            .eq("username", username)
+            .execute()
+        )
+
+        if existing.data:
+            return jsonify(
+                {"available": False, "message": "Username already taken"}
+            ), 200
+
+        return jsonify({"available": True, "message": "Username available"}), 200
+
+    except Exception as e:
+        print(f"Username check error: {e}")
+        return jsonify({"error": "Failed to check username"}), 500
+
+
+@bp.route("/api/auth/login", methods=["POST"])
+def login():
+    """authenticate user login"""
+    try:
+        data = request.get_json()
+
+        if not data:
+            return jsonify({"error": "No data provided"}), 400
+
+        email = data.get("email")
+        password = data.get("password")
+
+        if not email or not password:
+            return jsonify({"error": "Email and password are required"}), 400
+
+        supabase = get_supabase_client()
+
+        auth_response = supabase.auth.sign_in_with_password(
+            {"email": email, "password": password}
+        )
+
+        if not auth_response.user:
+            return jsonify({"error": "Invalid credentials"}), 401
+
+        print(f"Auth successful for user: {auth_response.user.id}")
+
+        try:
+            service_supabase = get_service_role_client()
+            user_profile_response = (
+                service_supabase.table("users")
+                .select("*")
+                .eq("auth_id", auth_response.user.id)
+                .execute()
+            )
+
+            print(f"User profile query result: {user_profile_response.data}")
+
+            if user_profile_response.data:
+                user_profile = user_profile_response.data[0]
+                cache_user_profile(auth_response.user.id, user_profile)
+                print(f"Found user profile: {user_profile}")
+            else:
+                print("No user profile found")
+                return jsonify({"error": "User profile not found"}), 404
+
+        except Exception as profile_error:
+            print(f"Profile retrieval error: {profile_error}")
+            return jsonify(
+                {"error": "Profile retrieval failed", "details": str(profile_error)}
+            ), 500
+
+        # Catch up on achievements earned before they could be awarded; queued,
+        # so the frontend picks them up from GET /api/notifications
+        recheck_achievements(user_profile["id"])
+
+        flask_access_token = create_access_token(identity=auth_response.user.id)
+
+        return jsonify(
+            {
+                "message": "Login successful",
+                "user": {
+                    "id": user_profile["id"],
+                    "email": user_profile["email"],
+                    "username": user_profile["username"],
+                    "major": user_profile.get("major"),
+                    "year": user_profile.get("year"),
+                    "first_name": user_profile.get("first_name"),
+                    "last_name": user_profile.get("last_name"),
+                    "email_verified": user_profile["email_verified"],
+                },
+                "access_token": flask_access_token,
+                "supabase_token": auth_response.session.access_token,
+            }
+        ), 200
+
+    except Exception as e:
+        print(f"Login error: {e}")
+        return jsonify({"error": "Login failed", "details": str(e)}), 500
+
+
+@bp.route("/api/auth/logout", methods=["POST"])
+def logout():
+    """logout user session"""
+    try:
+        supabase = get_supabase_client()
+
+        auth_header = request.headers.get("Authorization")
+        if not auth_header or not auth_header.startswith("Bearer "):
+            return jsonify({"error": "No valid authorization token provided"}), 401
+
+        supabase.auth.sign_out()
+
+        return jsonify({"message": "Logout successful"}), 200
+
+    except Exception as e:
+        print(f"Logout error: {e}")
+        return jsonify({"error": "Logout failed", "details": str(e)}), 500
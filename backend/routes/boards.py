@@ -0,0 +1,636 @@
+"""Shared boards: boards, invites, members and board tasks."""
+
+import uuid
+
+from flask import Blueprint, jsonify, request
+from flask_jwt_extended import get_jwt_identity, jwt_required
+
+from utils.auth import get_user_by_auth_id
+from utils.boards import (
+    BOARD_ROLE_OWNER,
+    get_board_member_list,
+    get_board_role,
+    invalidate_board,
+    pending_invites_query,
+    summarize_boards,
+    summarize_invites,
+)
+from utils.database import get_service_role_client
+from utils.etag import with_etag
+from utils.fanout import gather
+
+bp = Blueprint("boards", __name__)
+
+
+@bp.route("/api/boards", methods=["GET"])
+@jwt_required()
+def get_shared_boards():
+    """get user's shared task boards (owned and joined)"""
+    try:
+        auth_id = get_jwt_identity()
+        service_supabase = get_service_role_client()
+
+        user = get_user_by_auth_id(auth_id)
+        if not user:
+            return jsonify({"error": "User profile not found"}), 404
+
+        user_id = user["id"]
+        user_email = user["email"]
+
+        owned_boards, accepted_invites = gather(
+            lambda: (
+                service_supabase.table("SharedBoards")
+                .select("*, users!inner(username)")
+                .eq("user_id", user_id)
+                .execute()
+            ),
+            lambda: (
+                service_supabase.table("BoardInvites")
+                .select("*, SharedBoards!inner(*, users!inner(username))")
+                .eq("invited_email", user_email)
+                .eq("status", "Accepted")
+                .execute()
+            ),
+        )
+
+        boards = summarize_boards(owned_boards.data or [], accepted_invites.data or [])
+
+        return with_etag(jsonify({"boards": boards}))
+
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
+@bp.route("/api/boards", methods=["POST"])
+@jwt_required()
+def create_shared_board():
+    """create new shared task board"""
+    try:
+        data = request.get_json()
+        name = data.get("name")
+        if not name:
+            return jsonify({"error": "Board name is required"}), 400
+
+        auth_id = get_jwt_identity()
+        service_supabase = get_service_role_client()
+
+        user = get_user_by_auth_id(auth_id)
+        if not user:
+            return jsonify({"error": "User profile not found"}), 404
+
+        user_id = user["id"]
+
+        board_data = {
+            "id": str(uuid.uuid4()),
+            "name": name,
+            "description": data.get("description", ""),
+            "user_id": user_id,
+            # No create_date since it sets to now() default in Supabase - Ant
+        }
+
+        insert_response = (
+            service_supabase.table("SharedBoards").insert(board_data).execute()
+        )
+        if insert_response.data:
+            return jsonify(
+                {
+                    "message": "Board created successfully",
+                    "board": insert_response.data[0],
+                }
+            ), 201
+        return jsonify({"error": "Failed to create board"}), 500
+
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
+@bp.route("/api/boards/<string:board_id>/invite", methods=["POST"])
+@jwt_required()
+def invite_to_board(board_id):
+    """invite user to shared board by username"""
+    try:
+        data = request.get_json()
+        username = data.get("username")
+        message = data.get("message", "Hi! I'd like to invite you to my Taskboard!")
+
+        if not username:
+            return jsonify({"error": "Username is required"}), 400
+
+        auth_id = get_jwt_identity()
+        service_supabase = get_service_role_client()
+
+        user = get_user_by_auth_id(auth_id)
+        if not user:
+            return jsonify({"error": "User not found"}), 404
+        user_id = user["id"]
+
+        board_check = (
+            service_supabase.table("SharedBoards")
+            .select("id, name")
+            .eq("id", board_id)
+            .eq("user_id", user_id)
+            .execute()
+        )
+        if not board_check.data:
+            return jsonify({"error": "Board not found or unauthorized"}), 403
+
+        invited_user = (
+            service_supabase.table("users")
+            .select("id, email")
+            .eq("username", username)
+            .execute()
+        )
+        if not invited_user.data:
+            return jsonify({"error": f"User '{username}' not found"}), 404
+
+        invited_email = invited_user.data[0]["email"]
+
+        existing_invite = (
+            service_supabase.table("BoardInvites")
+            .select("id")
+            .eq("board_id", board_id)
+            .eq("invited_email", invited_email)
+            .eq("status", "Pending")
+            .execute()
+        )
+        if existing_invite.data:
+            return jsonify({"error": "User already has a pending invite"}), 400
+
+        invite_data = {
+            "board_id": board_id,
+            "invited_email": invited_email,
+            "invited_by": user_id,
+            "status": "Pending",
+            "message": message,
+        }
+
+        invite_response = (
+            service_supabase.table("BoardInvites").insert(invite_data).execute()
+        )
+
+        if invite_response.data:
+            return jsonify(
+                {
+                    "message": f"User '{username}' invited to board",
+                    "invite": invite_response.data[0],
+                }
+            ), 201
+        return jsonify({"error": "Failed to send invite"}), 500
+
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
+@bp.route("/api/invites", methods=["GET"])
+@jwt_required()
+def get_user_invites():
+    """Get pending invites for the current user"""
+    try:
+        auth_id = get_jwt_identity()
+        service_supabase = get_service_role_client()
+
+        user = get_user_by_auth_id(auth_id)
+        if not user:
+            return jsonify({"error": "User not found"}), 404
+
+        user_email = user["email"]
+
+        invites_response = pending_invites_query(service_supabase, user_email).execute()
+        invites = summarize_invites(invites_response.data or [])
+
+        return with_etag(jsonify({"invites": invites}))
+
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
+@bp.route("/api/invites/<string:invite_id>/accept", methods=["POST"])
+@jwt_required()
+def accept_invite(invite_id):
+    """Accept a board invite"""
+    try:
+        auth_id = get_jwt_identity()
+        service_supabase = get_service_role_client()
+
+        user = get_user_by_auth_id(auth_id)
+        if not user:
+            return jsonify({"error": "User not found"}), 404
+
+        user_email = user["email"]
+
+        invite_response = (
+            service_supabase.table("BoardInvites")
+            .select("*, SharedBoards!inner(name)")
+            .eq("id", invite_id)
+            .eq("invited_email", user_email)
+            .eq("status", "Pending")
+            .execute()
+        )
+
+        if not invite_response.data:
+            return jsonify({"error": "Invite not found or already processed"}), 404
+
+        invite = invite_response.data[0]
+        board_id = invite["board_id"]
+
+        update_response = (
+            service_supabase.table("BoardInvites")
+            .update({"status": "Accepted"})
+            .eq("id", invite_id)
+            .execute()
+        )
+        invalidate_board(board_id)
+
+        if update_response.data:
+            return jsonify(
+                {
+                    "message": "Invite accepted successfully",
+                    "board_id": board_id,
+                    "board_name": invite["SharedBoards"]["name"],
+                }
+            ), 200
+
+        return jsonify({"error": "Failed to accept invite"}), 500
+
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
+@bp.route("/api/invites/<string:invite_id>/decline", methods=["POST"])
+@jwt_required()
+def decline_invite(invite_id):
+    """Decline a board invite"""
+    try:
+        auth_id = get_jwt_identity()
+        service_supabase = get_service_role_client()
+
+        user = get_user_by_auth_id(auth_id)
+        if not user:
+            return jsonify({"error": "User not found"}), 404
+
+        user_email = user["email"]
+
+        update_response = (
+            service_supabase.table("BoardInvites")
+            .update({"status": "Declined"})
+            .eq("id", invite_id)
+            .eq("invited_email", user_email)
+            .eq("status", "Pending")
+            .execute()
+        )
+
+        if update_response.data:
+            return jsonify({"message": "Invite declined"}), 200
+
+        return jsonify({"error": "Invite not found or already processed"}), 404
+
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
+@bp.route("/api/boards/<string:board_id>/members", methods=["GET"])
+@jwt_required()
+def get_board_members(board_id):
+    """Get all members of a board"""
+    try:
+        auth_id = get_jwt_identity()
+        service_supabase = get_service_role_client()
+
+        user = get_user_by_auth_id(auth_id)
+        if not user:
+            return jsonify({"error": "User not found"}), 404
+
+        members = get_board_member_list(board_id, service_supabase)
+        if members is None:
+            return jsonify({"error": "Board not found"}), 404
+
+        role = get_board_role(board_id, user, service_supabase)
+        if not role:
+            return jsonify({"error": "Unauthorized"}), 403
+
+        is_owner = role == BOARD_ROLE_OWNER
+
+        return jsonify({"members": members, "is_owner": is_owner}), 200
+
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
+@bp.route(
+    "/api/boards/<string:board_id>/members/<string:member_id>", methods=["DELETE"]
+)
+@jwt_required()
+def remove_board_member(board_id, member_id):
+    """Remove a member from a board (owner only)"""
+    try:
+        auth_id = get_jwt_identity()
+        service_supabase = get_service_role_client()
+
+        user = get_user_by_auth_id(auth_id)
+        if not user:
+            return jsonify({"error": "User not found"}), 404
+
+        user_id = user["id"]
+
+        board_check = (
+            service_supabase.table("SharedBoards")
+            .select("id")
+            .eq("id", board_id)
+            .eq("user_id", user_id)
+            .execute()
+        )
+        if not board_check.data:
+            return jsonify(
+                {"error": "Unauthorized - only board owner can remove members"}
+            ), 403
+
+        member_response = (
+            service_supabase.table("users")
+            .select("email")
+            .eq("id", member_id)
+            .execute()
+        )
+        if not member_response.data:
+            return jsonify({"error": "Member not found"}), 404
+
+        member_email = member_response.data[0]["email"]
+
+        update_response = (
+            service_supabase.table("BoardInvites")
+            .update({"status": "Removed"})
+            .eq("board_id", board_id)
+            .eq("invited_email", member_email)
+            .eq("status", "Accepted")
+            .execute()
+        )
+        invalidate_board(board_id)
+
+        if update_response.data:
+            return jsonify({"message": "Member removed successfully"}), 200
+
+        return jsonify({"error": "Member not found in board"}), 404
+
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
+@bp.route("/api/boards/<string:board_id>/tasks", methods=["GET"])
+@jwt_required()
+def get_board_tasks(board_id):
+    """Get tasks for a shared board"""
+    try:
+        auth_id = get_jwt_identity()
+        service_supabase = get_service_role_client()
+
+        user = get_user_by_auth_id(auth_id)
+        if not user:
+            return jsonify({"error": "User not found"}), 404
+
+        if not get_board_role(board_id, user, service_supabase):
+            return jsonify({"error": "Unauthorized"}), 403
+
+        tasks_response = (
+            service_supabase.table("board_tasks")
+            .select("*, Tasks!inner(*), users!added_by(username)")
+            .eq("board_id", board_id)
+            .execute()
+        )
+
+        tasks = []
+        if tasks_response.data:
+            for board_task in tasks_response.data:
+                task = board_task["Tasks"]
+                status = "todo"
+                if task.get("completed", False):
+                    status = "done"
+                tasks.append(
+                    {
+                        "id": task["id"],
+                        "title": task["title"],
+                        "description": task.get("description", ""),
+                        "status": board_task.get("status", status),
+                        "priority": task.get("priority", "medium"),
+                        "due_date": task.get("due_date"),
+                        "added_by": board_task["users"]["username"],
+                        "added_at": board_task["added_at"],
+                        "assigned_to": task.get("assigned_to", ""),
+                    }
+                )
+
+        return with_etag(jsonify({"tasks": tasks}))
+
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
+@bp.route("/api/boards/<string:board_id>/tasks", methods=["POST"])
+@jwt_required()
+def create_board_task(board_id):
+    """Create a task in a shared board"""
+    try:
+        auth_id = get_jwt_identity()
+        service_supabase = get_service_role_client()
+        data = request.get_json()
+
+        user = get_user_by_auth_id(auth_id)
+        if not user:
+            return jsonify({"error": "User not found"}), 404
+
+        user_id = user["id"]
+        if not get_board_role(board_id, user, service_supabase, fresh=True):
+            return jsonify({"error": "Unauthorized"}), 403
+
+        task_data = {
+            "user_id": user_id,
+            "title": data.get("title", ""),
+            "description": data.get("description", ""),
+            "priority": data.get("priority", "medium"),
+            "due_date": data.get("due_date"),
+            "completed": False,
+        }
+
+        assigned_to = data.get("assigned_to", "").strip()
+        if assigned_to:
+            task_data["assigned_to"] = assigned_to
+
+        print(f"Creating task with data: {task_data}")
+
+        task_response = service_supabase.table("Tasks").insert(task_data).execute()
+
+        if task_response.data:
+            task_id = task_response.data[0]["id"]
+
+            board_task_data = {
+                "board_id": board_id,
+                "task_id": task_id,
+                "added_by": user_id,
+                "status": "todo",
+            }
+
+            print(f"Linking task to board with data: {board_task_data}")
+
+            board_task_response = (
+                service_supabase.table("board_tasks").insert(board_task_data).execute()
+            )
+
+            if board_task_response.data:
+                return jsonify(
+                    {
+                        "message": "Task created successfully",
+                        "task": task_response.data[0],
+                    }
+                ), 201
+            print("Failed to link task to board")
+
+        return jsonify({"error": "Failed to create task"}), 500
+
+    except Exception as e:
+        print(f"Error creating board task: {e!s}")
+        return jsonify({"error": str(e)}), 500
+
+
+@bp.route("/api/boards/<string:board_id>/tasks/<string:task_id>", methods=["PUT"])
+@jwt_required()
+def update_board_task(board_id, task_id):
+    """Update a task in a shared board"""
+    try:
+        auth_id = get_jwt_identity()
+        service_supabase = get_service_role_client()
+        data = request.get_json()
+
+        user = get_user_by_auth_id(auth_id)
+        if not user:
+            return jsonify({"error": "User not found"}), 404
+
+        if not get_board_role(board_id, user, service_supabase, fresh=True):
+            return jsonify({"error": "Unauthorized"}), 403
+
+        task_check = (
+            service_supabase.table("board_tasks")
+            .select("id")
+            .eq("board_id", board_id)
+            .eq("task_id", task_id)
+            .execute()
+        )
+
+        if not task_check.data:
+            return jsonify({"error": "Task not found in this board"}), 404
+
+        update_data = {}
+        if "title" in data:
+            update_data["title"] = data["title"]
+        if "description" in data:
+            update_data["description"] = data["description"]
+        if "status" in data:
+            service_supabase.table("board_tasks").update({"status": data["status"]}).eq(
+                "board_id", board_id
+            ).eq("task_id", task_id).execute()
+
+            if data["status"] == "done":
+                update_data["completed"] = True
+            else:
+                update_data["completed"] = False
+        if "priority" in data:
+            update_data["priority"] = data["priority"]
+        if "due_date" in data:
+            update_data["due_date"] = data["due_date"]
+        if "completed" in data:
+            update_data["completed"] = data["completed"]
+        if "assigned_to" in data:
+            update_data["assigned_to"] = data["assigned_to"]
+
+        update_response = (
+            service_supabase.table("Tasks")
+            .update(update_data)
+            .eq("id", task_id)
+            .execute()
+        )
+
+        if update_response.data:
+            return jsonify(
+                {
+                    "message": "Task updated successfully",
+                    "task": update_response.data[0],
+                }
+            ), 200
+
+        return jsonify({"error": "Failed to update task"}), 500
+
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
+@bp.route("/api/boards/<string:board_id>/tasks/<string:task_id>", methods=["DELETE"])
+@jwt_required()
+def delete_board_task(board_id, task_id):
+    """Delete a task from a shared board"""
+    try:
+        auth_id = get_jwt_identity()
+        service_supabase = get_service_role_client()
+
+        user = get_user_by_auth_id(auth_id)
+        if not user:
+            return jsonify({"error": "User not found"}), 404
+
+        if not get_board_role(board_id, user, service_supabase, fresh=True):
+            return jsonify({"error": "Unauthorized"}), 403
+
+        service_supabase.table("board_tasks").delete().eq("board_id", board_id).eq(
+            "task_id", task_id
+        ).execute()
+
+        task_delete = (
+            service_supabase.table("Tasks").delete().eq("id", task_id).execute()
+        )
+
+        if task_delete.data:
+            return jsonify({"message": "Task deleted successfully"}), 200
+
+        return jsonify({"error": "Task not found"}), 404
+
+    except Exception as e:
+        print(f"Error deleting task: {e!s}")
+        return jsonify({"error": str(e)}), 500
+
+
+@bp.route("/api/boards/<string:board_id>", methods=["DELETE"])
+@jwt_required()
+def delete_board(board_id):
+    """Delete a shared board (only owner can delete)"""
+    try:
+        auth_id = get_jwt_identity()
+        service_supabase = get_service_role_client()
+
+        user = get_user_by_auth_id(auth_id)
+        if not user:
+            return jsonify({"error": "User profile not found"}), 404
+
+        user_id = user["id"]
+
+        board_check = (
+            service_supabase.table("SharedBoards")
+            .select("id")
+            .eq("id", board_id)
+            .eq("user_id", user_id)
+            .execute()
+        )
+        if not board_check.data:
+            return jsonify(
+                {"error": "Board not found or you do not have permission to delete it"}
+            ), 403
+
+        service_supabase.table("BoardInvites").delete().eq(
+            "board_id", board_id
+        ).execute()
+
+        delete_response = (
+            service_supabase.table("SharedBoards").delete().eq("id", board_id).execute()
+        )
+        invalidate_board(board_id)
+
+        if delete_response.data:
+            return jsonify({"message": "Board deleted successfully"}), 200
+        return jsonify({"error": "Failed to delete board"}), 500
+
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
@@ -0,0 +1,44 @@
+"""GET /api/bootstrap, the batched first page load (see utils/bootstrap)."""
+
+from flask import Blueprint, jsonify, request
+from flask_jwt_extended import get_jwt_identity, jwt_required
+
+from utils.auth import get_user_by_auth_id
+from utils.bootstrap import BootstrapError, build_bootstrap, parse_sections
+from utils.database import get_service_role_client
+from utils.query_tracking import query_budget
+from utils.tasks import TaskQueryError, parse_task_query
+
+bp = Blueprint("bootstrap", __name__)
+
+
+@bp.route("/api/bootstrap", methods=["GET"])
+@jwt_required()
+@query_budget(12)
+def bootstrap():
+    """Data for the first page load in one request (see utils/bootstrap)
+
+    ?sections=xp,achievements,tasks,invites,daily_completions picks sections
+    (all by default); the tasks section takes the GET /api/tasks parameters.
+    """
+    try:
+        auth_id = get_jwt_identity()
+        service_supabase = get_service_role_client()
+
+        try:
+            sections = parse_sections(request.args.get("sections"))
+            task_options = parse_task_query(request.args)
+        except (BootstrapError, TaskQueryError) as e:
+            return jsonify({"error": str(e)}), 400
+
+        user = get_user_by_auth_id(auth_id)
+        if not user:
+            return jsonify({"error": "User profile not found"}), 404
+
+        return jsonify(
+            build_bootstrap(service_supabase, user, sections, task_options)
+        ), 200
+
+    except Exception as e:
+        print(f"Bootstrap error: {e}")
+        return jsonify({"error": "Internal Server Error", "details": str(e)}), 500
@@ -0,0 +1,45 @@
+"""Health and load balancer probe endpoints."""
+
+import os
+
+from flask import Blueprint, jsonify
+
+from utils.health import get_readiness, monitor
+
+bp = Blueprint("health", __name__)
+
+
+@bp.route("/api/health")
+def health_check():
+    """Enhanced health check endpoint with database connectivity"""
+    # The monitor's last result, so probes never wait on Supabase
+    database = monitor.last_result()
+
+    return jsonify(
+        {
+            "message": "SwampScheduler backend is running!",
+            "status": "healthy",
+            "app": "swampscheduler",
+            "version": "0.1.0",
+            "database": {
+                "connected": database["connected"],
+                "message": database["message"],
+            },
+            "environment": os.getenv("FLASK_ENV", "development"),
+        }
+    )
+
+
+@bp.route("/api/health/live")
+def liveness_check():
+    """Liveness probe: the worker is serving requests (no I/O)"""
+    return jsonify({"status": "alive", "pid": os.getpid()}), 200
+
+
+@bp.route("/api/health/ready")
+def readiness_check():
+    """Readiness probe from the background-refreshed checks (see utils/health)"""
+    ready, details = get_readiness()
+    return jsonify({"status": "ready" if ready else "not ready", **details}), (
+        200 if ready else 503
+    )
@@ -0,0 +1,127 @@
+"""Pomodoro focus sessions."""
+
+import traceback
+from datetime import datetime
+
+from flask import Blueprint, jsonify
+from flask_jwt_extended import get_jwt_identity, jwt_required
+
+from utils.achievements_with_db import EVENT_FOCUS
+from utils.auth import get_user_by_auth_id
+from utils.completion import run_completion_side_effects
+from utils.database import get_service_role_client
+from utils.level_system import XP_REWARDS
+from utils.write_behind import record_xp
+from utils.xp import REASON_POMODORO_COMPLETION
+
+bp = Blueprint("pomodoro", __name__)
+
+
+@bp.route("/api/pomodoro/start", methods=["POST"])
+@jwt_required()
+def start_pomodoro_session():
+    """Start a new pomodoro session"""
+    try:
+        auth_id = get_jwt_identity()
+
+        service_supabase = get_service_role_client()
+        user = get_user_by_auth_id(auth_id)
+
+        if not user:
+            return jsonify({"error": "User profile not found"}), 404
+
+        user_id = user["id"]
+
+        new_session = (
+            service_supabase.table("focus_sessions")
+            .insert(
+                {
+                    "user_id": user_id,
+                    "start_time": datetime.utcnow().isoformat(),
+                    "duration": 1500,
+                    "completed": False,
+                }
+            )
+            .execute()
+        )
+
+        if new_session.data:
+            session = new_session.data[0]
+            return jsonify(
+                {"session_id": session["id"], "start_time": session["start_time"]}
+            ), 201
+        return jsonify({"error": "Failed to create session"}), 500
+
+    except Exception as e:
+        print(f"Pomodoro start error: {e!s}")
+        print(f"Full traceback: {traceback.format_exc()}")
+        return jsonify({"error": str(e)}), 500
+
+
+@bp.route("/api/pomodoro/<session_id>/complete", methods=["POST"])
+@jwt_required()
+def complete_pomodoro_session(session_id):
+    """Complete a pomodoro session"""
+    try:
+        auth_id = get_jwt_identity()
+
+        service_supabase = get_service_role_client()
+        user = get_user_by_auth_id(auth_id)
+
+        if not user:
+            return jsonify({"error": "User profile not found"}), 404
+
+        user_id = user["id"]
+
+        session_result = (
+            service_supabase.table("focus_sessions")
+            .select("*")
+            .eq("id", session_id)
+            .eq("user_id", user_id)
+            .execute()
+        )
+
+        if not session_result.data:
+            return jsonify({"error": "Session not found or unauthorized"}), 404
+
+        session = session_result.data[0]
+
+        if session["completed"]:
+            return jsonify({"error": "Session already completed"}), 400
+
+        update_result = (
+            service_supabase.table("focus_sessions")
+            .update({"completed": True})
+            .eq("id", session_id)
+            .execute()
+        )
+
+        if update_result.data:
+            xp_awarded = XP_REWARDS["pomodoro_completion"]
+            total_xp = record_xp(
+                user_id, xp_awarded, REASON_POMODORO_COMPLETION, service_supabase
+            )
+
+            newly_earned_achievements = run_completion_side_effects(
+                user_id, EVENT_FOCUS, total_xp, service_supabase
+            )
+            if newly_earned_achievements:
+                xp_awarded += sum(a["xp_reward"] for a in newly_earned_achievements)
+
+            response_data = {
+                "message": "Session completed successfully",
+                "session_id": session_id,
+                "completed": True,
+                "xp_awarded": xp_awarded,
+            }
+
+            if newly_earned_achievements:
+                response_data["achievements_earned"] = newly_earned_achievements
+            elif newly_earned_achievements is None:
+                response_data["achievements_pending"] = True
+
+            return jsonify(response_data), 200
+        return jsonify({"error": "Failed to update session"}), 500
+
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
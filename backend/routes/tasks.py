@@ -0,0 +1,314 @@
+"""Personal tasks: CRUD, delta sync, completion and the schedule stubs."""
+
+from datetime import datetime
+
+from flask import Blueprint, jsonify, request
+from flask_jwt_extended import get_jwt_identity, jwt_required
+
+from utils.achievements_with_db import EVENT_TASK
+from utils.auth import get_user_by_auth_id
+from utils.completion import run_completion_side_effects
+from utils.database import get_service_role_client
+from utils.etag import with_etag
+from utils.level_system import XP_REWARDS
+from utils.query_tracking import query_budget
+from utils.task_sync import (
+    SyncTokenError,
+    decode_sync_token,
+    get_sync_token,
+    get_task_changes,
+)
+from utils.tasks import TaskQueryError, apply_task_query, paginate, parse_task_query
+from utils.write_behind import record_xp
+from utils.xp import REASON_TASK_COMPLETION
+
+bp = Blueprint("tasks", __name__)
+
+
+@bp.route("/api/tasks", methods=["POST"])
+@jwt_required()
+def create_task():
+    """create new task"""
+    data = request.get_json()
+    print("Parsed JSON data:", data)
+
+    if not data:
+        return jsonify({"error": "No JSON data received"}), 400
+
+    title = data.get("title")
+    description = data.get("description")
+    due_date = data.get("due_date")
+    priority = data.get("priority")
+    create_date = data.get("create_date")
+
+    if not title or not description or not due_date or not priority:
+        return jsonify({"error": "Missing required fields"}), 400
+
+    auth_id = get_jwt_identity()
+    service_supabase = get_service_role_client()
+    user = get_user_by_auth_id(auth_id)
+
+    if user:
+        print(f"Found user profile: {user}")
+    else:
+        print("No user profile found")
+        return jsonify({"error": "User profile not found"}), 404
+
+    user_id = user["id"]
+
+    task_data = {
+        "user_id": user_id,
+        "title": title,
+        "description": description,
+        "due_date": due_date,
+        "priority": priority,
+        "completed": False,
+        "create_date": create_date,
+        "completed_date": None,
+    }
+
+    try:
+        task_response = service_supabase.table("Tasks").insert(task_data).execute()
+
+        if task_response.data:
+            return jsonify(
+                {"message": "Task created successfully", "task": task_response.data[0]}
+            ), 201
+        return jsonify({"error": "Error inserting task"}), 500
+
+    except Exception as e:
+        print(f"Error inserting task: {e}")
+        return jsonify({"error": "Internal Error", "details": str(e)}), 500
+
+
+@bp.route("/api/tasks", methods=["GET"])
+@jwt_required()
+def get_tasks():
+    """List the user's tasks a page at a time (see utils/tasks for the options)"""
+    try:
+        auth_id = get_jwt_identity()
+        service_supabase = get_service_role_client()
+
+        try:
+            options = parse_task_query(request.args)
+        except TaskQueryError as e:
+            return jsonify({"error": str(e)}), 400
+
+        user = get_user_by_auth_id(auth_id)
+        if not user:
+            return jsonify({"error": "User profile not found"}), 404
+
+        user_id = user["id"]
+
+        query = (
+            service_supabase.table("Tasks")
+            .select(options["select"])
+            .eq("user_id", user_id)
+        )
+        task_response = apply_task_query(query, options).execute()
+        tasks, pagination = paginate(task_response.data or [], options)
+
+        return with_etag(jsonify({"tasks": tasks, "pagination": pagination}))
+
+    except Exception as e:
+        print(f"Error fetching tasks: {e}")
+        return jsonify({"error": "Internal Server Error", "details": str(e)}), 500
+
+
+@bp.route("/api/tasks/changes", methods=["GET"])
+@jwt_required()
+def get_tasks_changes():
+    """Tasks changed and deleted since ?since=<sync_token> (see utils/task_sync)"""
+    try:
+        auth_id = get_jwt_identity()
+        service_supabase = get_service_role_client()
+
+        since = request.args.get("since")
+        try:
+            since = decode_sync_token(since) if since else None
+        except SyncTokenError as e:
+            return jsonify({"error": str(e)}), 400
+
+        user = get_user_by_auth_id(auth_id)
+        if not user:
+            return jsonify({"error": "User profile not found"}), 404
+
+        user_id = user["id"]
+
+        # No token yet: hand out one for the client's upcoming full load
+        if since is None:
+            return jsonify(
+                {"sync_token": get_sync_token(user_id, service_supabase)}
+            ), 200
+
+        return jsonify(get_task_changes(user_id, since, service_supabase)), 200
+
+    except Exception as e:
+        print(f"Error fetching task changes: {e}")
+        return jsonify({"error": "Internal Server Error", "details": str(e)}), 500
+
+
+@bp.route("/api/tasks/<task_id>", methods=["PUT"])
+@jwt_required()
+def update_task(task_id):
+    """Update task title only"""
+    try:
+        auth_id = get_jwt_identity()
+
+        data = request.get_json()
+        if not data or "title" not in data:
+            return jsonify({"error": "Title is required"}), 400
+
+        new_title = data.get("title")
+        if not new_title or not new_title.strip():
+            return jsonify({"error": "Title cannot be empty"}), 400
+
+        service_supabase = get_service_role_client()
+        user = get_user_by_auth_id(auth_id)
+
+        if not user:
+            return jsonify({"error": "User not found"}), 404
+
+        user_id = user["id"]
+
+        task_response = (
+            service_supabase.table("Tasks")
+            .update({"title": new_title.strip()})
+            .eq("id", task_id)
+            .eq("user_id", user_id)
+            .execute()
+        )
+
+        if not task_response.data:
+            return jsonify({"error": "Task not found or unauthorized"}), 404
+
+        return jsonify(
+            {"message": "Task updated successfully", "task": task_response.data[0]}
+        ), 200
+
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
+@bp.route("/api/tasks/<task_id>", methods=["DELETE"])
+@jwt_required()
+def delete_task(task_id):
+    """Delete task with ownership check"""
+    try:
+        auth_id = get_jwt_identity()
+
+        service_supabase = get_service_role_client()
+        user = get_user_by_auth_id(auth_id)
+
+        if not user:
+            return jsonify({"error": "User not found"}), 404
+
+        user_id = user["id"]
+
+        delete_response = (
+            service_supabase.table("Tasks")
+            .delete()
+            .eq("id", task_id)
+            .eq("user_id", user_id)
+            .execute()
+        )
+
+        if not delete_response.data:
+            return jsonify({"error": "Task not found or unauthorized"}), 404
+
+        return jsonify(
+            {"message": "Task deleted successfully", "task_id": task_id}
+        ), 200
+
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
+@bp.route("/api/tasks/<task_id>/complete", methods=["POST"])
+@jwt_required()
+@query_budget(10)
+def complete_task(task_id):
+    """Toggle task completion status"""
+    try:
+        auth_id = get_jwt_identity()
+
+        service_supabase = get_service_role_client()
+        user = get_user_by_auth_id(auth_id)
+
+        if not user:
+            return jsonify({"error": "User not found"}), 404
+
+        user_id = user["id"]
+
+        task_response = (
+            service_supabase.table("Tasks")
+            .select("*")
+            .eq("id", task_id)
+            .eq("user_id", user_id)
+            .execute()
+        )
+
+        if not task_response.data:
+            return jsonify({"error": "Task not found or unauthorized"}), 404
+
+        task = task_response.data[0]
+        new_completed = not task["completed"]
+
+        update_data = {
+            "completed": new_completed,
+            "completed_date": datetime.utcnow().isoformat() if new_completed else None,
+        }
+
+        update_response = (
+            service_supabase.table("Tasks")
+            .update(update_data)
+            .eq("id", task_id)
+            .execute()
+        )
+
+        if not update_response.data:
+            return jsonify({"error": "Failed to update task"}), 500
+
+        xp_awarded = 0
+        newly_earned_achievements = []
+        if new_completed and task["completed_date"] is None:
+            xp_awarded = XP_REWARDS["task_completion"]
+            total_xp = record_xp(
+                user_id, xp_awarded, REASON_TASK_COMPLETION, service_supabase
+            )
+
+            newly_earned_achievements = run_completion_side_effects(
+                user_id, EVENT_TASK, total_xp, service_supabase
+            )
+            if newly_earned_achievements:
+                print(f"Newly earned achievements: {newly_earned_achievements}")
+                xp_awarded += sum(a["xp_reward"] for a in newly_earned_achievements)
+                print(f"Total XP awarded (task + achievements): {xp_awarded}")
+
+        response_data = {
+            "message": f"Task {'completed' if new_completed else 'uncompleted'} successfully",
+            "task": update_response.data[0],
+            "xp_awarded": xp_awarded,
+        }
+
+        if new_completed and newly_earned_achievements:
+            response_data["achievements_earned"] = newly_earned_achievements
+        elif new_completed and newly_earned_achievements is None:
+            response_data["achievements_pending"] = True
+
+        return jsonify(response_data), 200
+
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
+@bp.route("/api/schedule/generate", methods=["POST"])
+def generate_schedule():
+    """generate adaptive schedule"""
+    return jsonify({"message": "generate schedule endpoint - todo: implement"}), 501
+
+
+@bp.route("/api/schedule", methods=["GET"])
+def get_schedule():
+    """get current schedule for user"""
+    return jsonify({"message": "get schedule endpoint - todo: implement"}), 501
@@ -0,0 +1,179 @@
+"""XP, profile, admin and notification endpoints for the signed-in user."""
+
+from flask import Blueprint, jsonify, request
+from flask_jwt_extended import get_jwt_identity, jwt_required
+
+from utils.auth import get_user_by_auth_id, invalidate_user
+from utils.completion import recheck_achievements
+from utils.database import get_service_role_client
+from utils.etag import with_etag
+from utils.level_system import xp_summary
+from utils.notifications import pop_notifications
+from utils.stats import get_total_xp
+from utils.write_behind import pending_xp
+from utils.xp import REASON_ADMIN_ADJUSTMENT, award_xp
+
+bp = Blueprint("users", __name__)
+
+
+@bp.route("/api/admin/adjust-xp", methods=["POST"])
+@jwt_required()
+def admin_adjust_xp():
+    """Admin endpoint to adjust any user's XP"""
+    try:
+        auth_id = get_jwt_identity()
+        service_supabase = get_service_role_client()
+
+        admin_response = (
+            service_supabase.table("users")
+            .select("is_admin")
+            .eq("auth_id", auth_id)
+            .execute()
+        )
+
+        if not admin_response.data or not admin_response.data[0].get("is_admin", False):
+            return jsonify({"error": "Unauthorized - Admin access required"}), 403
+
+        data = request.get_json()
+        target_email = data.get("email")
+        xp_change = data.get("xp_change", 0)
+
+        if not target_email:
+            return jsonify({"error": "Email is required"}), 400
+
+        target_user = (
+            service_supabase.table("users")
+            .select("id, email, username")
+            .eq("email", target_email)
+            .execute()
+        )
+
+        if not target_user.data:
+            return jsonify({"error": "User not found"}), 404
+
+        target_user_id = target_user.data[0]["id"]
+
+        new_xp = award_xp(
+            target_user_id, xp_change, REASON_ADMIN_ADJUSTMENT, service_supabase
+        )
+        # Levels crossed here are not seen by any completion's check
+        recheck_achievements(target_user_id, total_xp=new_xp)
+
+        return jsonify(
+            {
+                "message": "XP adjusted successfully",
+                "user": target_user.data[0]["username"],
+                "new_xp": new_xp,
+                "change": xp_change,
+            }
+        ), 200
+
+    except Exception as e:
+        print(f"Admin XP adjustment error: {e}")
+        return jsonify({"error": str(e)}), 500
+
+
+@bp.route("/api/xp", methods=["GET"])
+@jwt_required()
+def get_user_xp():
+    """Get user's current XP, level, and progress"""
+    try:
+        auth_id = get_jwt_identity()
+
+        service_supabase = get_service_role_client()
+
+        user = get_user_by_auth_id(auth_id)
+
+        if not user:
+            # User profile doesn't exist, return default values
+            return jsonify(xp_summary(0)), 200
+
+        user_id = user["id"]
+
+        # XP this worker has buffered but not flushed yet
+        total_xp = get_total_xp(service_supabase, user_id) + pending_xp(user_id)
+
+        return with_etag(jsonify(xp_summary(total_xp)))
+
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
+@bp.route("/api/user/is-admin", methods=["GET"])
+@jwt_required()
+def check_admin_status():
+    """Check if current user is admin"""
+    try:
+        auth_id = get_jwt_identity()
+        service_supabase = get_service_role_client()
+
+        user_response = (
+            service_supabase.table("users")
+            .select("is_admin")
+            .eq("auth_id", auth_id)
+            .execute()
+        )
+
+        if not user_response.data:
+            return jsonify({"is_admin": False}), 200
+
+        return jsonify({"is_admin": user_response.data[0].get("is_admin", False)}), 200
+
+    except Exception as e:
+        print(f"Admin check error: {e}")
+        return jsonify({"is_admin": False}), 200
+
+
+@bp.route("/api/user/profile", methods=["PUT"])
+@jwt_required()
+def update_profile():
+    """Update user profile (major and year only)"""
+    try:
+        auth_id = get_jwt_identity()
+        data = request.get_json()
+
+        # Validate input
+        major = data.get("major", "").strip()
+        year = data.get("year", "").strip()
+
+        service_supabase = get_service_role_client()
+
+        update_response = (
+            service_supabase.table("users")
+            .update({"major": major, "year": year})
+            .eq("auth_id", auth_id)
+            .execute()
+        )
+        invalidate_user(auth_id)
+
+        if update_response.data:
+            return jsonify(
+                {
+                    "message": "Profile updated successfully",
+                    "user": update_response.data[0],
+                }
+            ), 200
+        return jsonify({"error": "Failed to update profile"}), 400
+
+    except Exception as e:
+        print(f"Profile update error: {e}")
+        return jsonify({"error": str(e)}), 500
+
+
+@bp.route("/api/notifications", methods=["GET"])
+@jwt_required()
+def get_notifications():
+    """Return and clear the user's pending notifications (e.g. achievements)"""
+    try:
+        auth_id = get_jwt_identity()
+        user = get_user_by_auth_id(auth_id)
+
+        if not user:
+            return jsonify({"error": "User not found"}), 404
+
+        notifications = pop_notifications(user["id"])
+        return jsonify({"notifications": notifications}), 200
+
+    except Exception as e:
+        print(f"Error fetching notifications: {e}")
+        return jsonify({"error": "Failed to fetch notifications"}), 500
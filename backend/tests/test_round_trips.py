@@ -0,0 +1,112 @@
+"""Round-trip budgets of the hot routes, against a stub PostgREST.
+
+The pooled service role client is built on an httpx.MockTransport that
+answers every request with a fixed user, task and achievement, so each test
+counts the Supabase round trips a cold worker makes for one request. The
+limits match the routes' @query_budget.
+
+Run with python -m pytest (see [tool.pytest.ini_options] in pyproject.toml)
+"""
+
+import json
+import os
+
+os.environ.update(
+    FLASK_ENV="production",
+    SUPABASE_URL="http://supabase.test",
+    SUPABASE_ANON_KEY="test-anon-key",
+    SUPABASE_SERVICE_KEY="test-service-key",
+    JWT_SECRET_KEY="test-jwt-secret-key-at-least-32-bytes",
+)
+
+import httpx
+import pytest
+from app import create_app
+from flask_jwt_extended import create_access_token
+
+from utils import achievement_catalog, database
+from utils.auth import _user_cache
+from utils.query_tracking import (
+    QueryTrackingTransport,
+    assert_max_round_trips,
+)
+
+AUTH_ID = "test-auth-id"
+USER = {"id": "00000000-0000-0000-0000-000000000001", "email": "user@example.com"}
+TASK = {
+    "id": "task-1",
+    "user_id": USER["id"],
+    "title": "Write tests",
+    "priority": "high",
+    "due_date": None,
+    "completed": False,
+    "completed_date": None,
+    "create_date": "2026-01-01T00:00:00+00:00",
+    "updated_date": "2026-01-01T00:00:00+00:00",
+}
+ACHIEVEMENT = {
+    "id": "first-task",
+    "name": "First Task",
+    "description": "Complete a task",
+    "icon": "star",
+    "category": "tasks",
+    "requirement_value": 1,
+    "xp_reward": 50,
+    "sort_order": 1,
+}
+ROWS = {"users": [USER], "Tasks": [TASK], "achievements": [ACHIEVEMENT]}
+RPC_RESULTS = {"award_xp": 10, "award_achievements": [ACHIEVEMENT["id"]]}
+
+
+def stub_postgrest(request):
+    """Canned PostgREST answers; filters are ignored"""
+    name = request.url.path.rsplit("/", 1)[1]
+    if "/rpc/" in request.url.path:
+        return httpx.Response(200, json=RPC_RESULTS.get(name))
+    if request.method in ("GET", "HEAD"):
+        rows = ROWS.get(name, [])
+        return httpx.Response(
+            200,
+            json=rows,
+            headers={"Content-Range": f"0-{max(len(rows) - 1, 0)}/{len(rows)}"},
+        )
+    if request.method == "PATCH":
+        return httpx.Response(200, json=[{**TASK, **json.loads(request.content)}])
+    return httpx.Response(201, json=json.loads(request.content or b"[]"))
+
+
+def build_stub_http_client(settings=None):
+    """database.build_http_client, sending to stub_postgrest instead"""
+    kwargs = database.get_http_client_kwargs(settings)
+    kwargs.pop("limits")
+    transport = httpx.MockTransport(stub_postgrest)
+    return httpx.Client(transport=QueryTrackingTransport(transport), **kwargs)
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(database, "build_http_client", build_stub_http_client)
+    database.close_service_role_client()
+    # Count what a cold worker pays, not what earlier tests left cached
+    _user_cache.clear()
+    monkeypatch.setattr(achievement_catalog, "_catalog", None)
+
+    app = create_app(warm=False)
+    with app.app_context():
+        token = create_access_token(identity=AUTH_ID)
+    test_client = app.test_client()
+    test_client.environ_base["HTTP_AUTHORIZATION"] = f"Bearer {token}"
+    yield test_client
+    database.close_service_role_client()
+
+
+def test_complete_task_round_trips(client):
+    response = assert_max_round_trips(
+        client, "POST", f"/api/tasks/{TASK['id']}/complete", 10
+    )
+    assert response.status_code == 200, response.get_json()
+
+
+def test_bootstrap_round_trips(client):
+    response = assert_max_round_trips(client, "GET", "/api/bootstrap", 12)
+    assert response.status_code == 200, response.get_json()
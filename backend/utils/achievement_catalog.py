@@ -0,0 +1,189 @@
+"""In-memory achievements catalog shared by every request in a worker.
+
+The catalog is read once (at boot via warm_catalog, or on first use) and
+kept as an immutable, pre-indexed snapshot. It is reloaded when the TTL
+expires or when the version file is bumped, e.g. by populate_achievements.py.
+"""
+
+import os
+import threading
+import time
+from pathlib import Path
+from types import MappingProxyType
+from typing import NamedTuple
+
+from utils.database import get_service_role_client
+
+# The populate script stores "task" while older rows use "tasks"
+CATEGORY_ALIASES = {"task": "tasks"}
+
+CATALOG_TTL = float(os.getenv("ACHIEVEMENTS_CATALOG_TTL", "600"))
+VERSION_FILE = Path(
+    os.getenv(
+        "ACHIEVEMENTS_VERSION_FILE",
+        Path(__file__).resolve().parent.parent / ".achievements_version",
+    )
+)
+
+
+class AchievementCatalog(NamedTuple):
+    """Immutable snapshot of the achievements table"""
+
+    achievements: tuple
+    by_id: MappingProxyType
+    by_category: MappingProxyType
+    thresholds: MappingProxyType
+    version: int
+    loaded_at: float
+
+
+_catalog = None
+_catalog_lock = threading.Lock()
+
+
+def normalize_category(category):
+    """Map category spellings onto one canonical name"""
+    return CATEGORY_ALIASES.get(category, category)
+
+
+def build_catalog(rows, version=0):
+    """Index achievement rows (already in sort_order) into a catalog"""
+    achievements = tuple(MappingProxyType(dict(row)) for row in rows)
+
+    grouped = {}
+    for achievement in achievements:
+        category = normalize_category(achievement["category"])
+        grouped.setdefault(category, []).append(achievement)
+
+    by_category = {}
+    thresholds = {}
+    for category, items in grouped.items():
+        items.sort(key=lambda a: a["requirement_value"])
+        by_category[category] = tuple(items)
+        thresholds[category] = tuple(a["requirement_value"] for a in items)
+
+    return AchievementCatalog(
+        achievements=achievements,
+        by_id=MappingProxyType({a["id"]: a for a in achievements}),
+        by_category=MappingProxyType(by_category),
+        thresholds=MappingProxyType(thresholds),
+        version=version,
+        loaded_at=time.monotonic(),
+    )
+
+
+def get_catalog_version():
+    """Current catalog version as published through the version file"""
+    try:
+        return VERSION_FILE.stat().st_mtime_ns
+    except OSError:
+        return 0
+
+
+def bump_catalog_version():
+    """Tell every worker to reload the catalog on its next use"""
+    VERSION_FILE.write_text(f"{time.time_ns()}\n")
+    return get_catalog_version()
+
+
+def load_catalog(service_supabase=None):
+    """Read the achievements table and install a fresh catalog"""
+    global _catalog
+    version = get_catalog_version()
+    service_supabase = service_supabase or get_service_role_client()
+    response = (
+        service_supabase.table("achievements").select("*").order("sort_order").execute()
+    )
+    catalog = build_catalog(response.data or [], version)
+    _catalog = catalog
+    return catalog
+
+
+def _is_fresh(catalog):
+    return (
+        catalog is not None
+        and time.monotonic() - catalog.loaded_at < CATALOG_TTL
+        and catalog.version == get_catalog_version()
+    )
+
+
+def get_catalog(service_supabase=None):
+    """Return the current catalog, reloading it if stale"""
+    global _catalog
+    catalog = _catalog
+    if _is_fresh(catalog):
+        return catalog
+
+    with _catalog_lock:
+        catalog = _catalog
+        if _is_fresh(catalog):
+            return catalog
+        try:
+            return load_catalog(service_supabase)
+        except Exception as e:
+            if catalog is None:
+                raise
+            print(f"Failed to refresh achievements catalog, keeping old copy: {e}")
+            # Back off for a full TTL instead of retrying on every request
+            _catalog = catalog._replace(
+                version=get_catalog_version(), loaded_at=time.monotonic()
+            )
+            return _catalog
+
+
+def warm_catalog():
+    """Load the catalog ahead of the first request"""
+    with _catalog_lock:
+        return load_catalog()
+
+
+def get_catalog_status():
+    """Describe the loaded catalog for health checks"""
+    catalog = _catalog
+    if catalog is None:
+        return {"loaded": False}
+    return {
+        "loaded": True,
+        "achievements": len(catalog.achievements),
+        "version": catalog.version,
+        "age_seconds": round(time.monotonic() - catalog.loaded_at, 1),
+    }
+
+
+def describe_achievements(catalog, stats, earned_rows):
+    """Build the achievements list for a user's stats and user_achievements rows.
+
+    stats holds "tasks_completed", "focus_sessions" and "level"; returns the
+    list plus how many of its achievements are unlocked.
+    """
+    progress = {
+        "tasks": stats["tasks_completed"],
+        "focus": stats["focus_sessions"],
+        "level": stats["level"],
+    }
+    earned_dates = {row["achievement_id"]: row["earned_at"] for row in earned_rows}
+
+    all_achievements = []
+    total_earned = 0
+    for db_achievement in catalog.achievements:
+        value = progress.get(normalize_category(db_achievement["category"]))
+        unlocked = value is not None and value >= db_achievement["requirement_value"]
+
+        achievement = {
+            "id": db_achievement["id"],
+            "name": db_achievement["name"],
+            "description": db_achievement["description"],
+            "icon": db_achievement["icon"],
+            "xp_reward": db_achievement["xp_reward"],
+            "criteria": f"{db_achievement['category']} >= {db_achievement['requirement_value']}",
+            "unlocked": unlocked,
+            "category": db_achievement["category"],
+            "requirement_value": db_achievement["requirement_value"],
+        }
+        if unlocked:
+            total_earned += 1
+            if achievement["id"] in earned_dates:
+                achievement["earned_at"] = earned_dates[achievement["id"]]
+        all_achievements.append(achievement)
+
+    return all_achievements, total_earned
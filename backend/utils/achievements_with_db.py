@@ -1,133 +1,172 @@
 """Achievement system that works with database achievements"""
 
-
-def check_and_award_achievements(user_id, service_supabase):
-    """Check user's progress and award any newly earned achievements"""
-    newly_earned = []
-    print(f"Checking achievements for user {user_id}")
-
-    try:
-        # Get all achievements from database
-        achievements_response = (
-            service_supabase.table("achievements")
-            .select("*")
-            .order("sort_order")
-            .execute()
+from bisect import bisect_right
+from functools import partial
+
+from utils.achievement_catalog import get_catalog
+from utils.fanout import gather
+from utils.level_system import XP_REWARDS, get_level
+from utils.stats import COUNT_TABLES, count_completed, get_total_xp
+from utils.write_behind import pending_xp
+from utils.xp import REASON_ACHIEVEMENT_UNLOCK
+
+EVENT_TASK = "task"
+EVENT_FOCUS = "focus"
+
+# Counter category each event moves, and the XP it has already granted
+EVENT_CATEGORIES = {EVENT_TASK: "tasks", EVENT_FOCUS: "focus"}
+EVENT_XP = {
+    EVENT_TASK: XP_REWARDS["task_completion"],
+    EVENT_FOCUS: XP_REWARDS["pomodoro_completion"],
+}
+
+
+def find_crossed(catalog, category, new_value, old_value=None):
+    """Achievements in a category whose threshold lies in (old_value, new_value]"""
+    thresholds = catalog.thresholds.get(category, ())
+    high = bisect_right(thresholds, new_value)
+    low = 0 if old_value is None else bisect_right(thresholds, old_value)
+    return catalog.by_category.get(category, ())[low:high]
+
+
+def _collect_candidates(catalog, service_supabase, user_id, event, total_xp):
+    """Achievements whose threshold the event may have just crossed"""
+    candidates = []
+    if event is None:
+        # Full re-check: every counter category from zero
+        totals = gather(
+            *(
+                partial(count_completed, service_supabase, category, user_id)
+                for category in COUNT_TABLES
+            )
+        )
+        for category, total in zip(COUNT_TABLES, totals, strict=True):
+            candidates.extend(find_crossed(catalog, category, total))
+        candidates.extend(find_crossed(catalog, "level", get_level(total_xp)))
+        return candidates
+
+    # One event bumps a single counter by one and grants a fixed amount of XP
+    category = EVENT_CATEGORIES[event]
+    if catalog.thresholds.get(category):
+        total = count_completed(service_supabase, category, user_id)
+        candidates.extend(find_crossed(catalog, category, total, total - 1))
+
+    previous_xp = max(0, total_xp - EVENT_XP[event])
+    candidates.extend(
+        find_crossed(
+            catalog,
+            "level",
+            get_level(total_xp),
+            get_level(previous_xp),
         )
+    )
+    return candidates
 
-        if not achievements_response.data:
-            print("No achievements found in database")
-            return newly_earned
 
-        print(f"Found {len(achievements_response.data)} achievements in database")
-        for ach in achievements_response.data:
-            print(
-                f"Achievement: {ach['name']} - Category: {ach['category']} - Requirement: {ach['requirement_value']}"
-            )
+def award_achievements(
+    user_id, service_supabase, event=None, total_xp=None, notify=False
+):
+    """Check user's progress and award any newly earned achievements.
 
-        # Get user's current stats
-        tasks_response = (
-            service_supabase.table("Tasks")
-            .select("id")
-            .eq("user_id", user_id)
-            .eq("completed", True)
-            .execute()
-        )
-        total_tasks = len(tasks_response.data) if tasks_response.data else 0
-        print(f"User has completed {total_tasks} tasks")
+    With an event ("task" or "focus") only the achievements that event can
+    have just unlocked are considered; without one every category is
+    re-checked from scratch. Pass total_xp when the caller already knows it
+    (award_xp returns it) to skip reading user_xp again. With notify, a
+    notification is queued for each achievement in the same transaction.
+    """
+    newly_earned = []
 
-        focus_response = (
-            service_supabase.table("focus_sessions")
-            .select("id")
-            .eq("user_id", user_id)
-            .eq("completed", True)
-            .execute()
-        )
-        total_focus = len(focus_response.data) if focus_response.data else 0
+    catalog = get_catalog(service_supabase)
 
-        # Get user's XP and calculate level
-        from utils.level_system import get_level_info
+    if not catalog.achievements:
+        print("No achievements found in database")
+        return newly_earned
 
-        xp_response = (
-            service_supabase.table("user_xp")
-            .select("total_xp")
-            .eq("user_id", user_id)
-            .execute()
-        )
+    if total_xp is None:
+        # Include XP this worker has buffered but not written yet
+        total_xp = get_total_xp(service_supabase, user_id) + pending_xp(user_id)
 
-        total_xp = xp_response.data[0]["total_xp"] if xp_response.data else 0
-        level_info = get_level_info(total_xp)
-        user_level = level_info["level"]
+    candidates = _collect_candidates(
+        catalog, service_supabase, user_id, event, total_xp
+    )
 
-        # Get already earned achievements
+    to_award = []
+    checked_ids = set()
+    current_xp = total_xp
+    while candidates:
+        candidate_ids = [a["id"] for a in candidates if a["id"] not in checked_ids]
+        if not candidate_ids:
+            break
+        checked_ids.update(candidate_ids)
+
+        # Only look up earned rows for the handful of candidates
         earned_response = (
             service_supabase.table("user_achievements")
             .select("achievement_id")
             .eq("user_id", user_id)
+            .in_("achievement_id", candidate_ids)
             .execute()
         )
-
-        earned_ids = (
-            {item["achievement_id"] for item in earned_response.data}
-            if earned_response.data
-            else set()
+        earned_ids = {item["achievement_id"] for item in earned_response.data or []}
+        unlocked = [
+            a
+            for a in candidates
+            if a["id"] in candidate_ids and a["id"] not in earned_ids
+        ]
+        if not unlocked:
+            break
+        to_award.extend(unlocked)
+
+        # Achievement XP can itself cross a level threshold
+        gained_xp = sum(a["xp_reward"] for a in unlocked)
+        candidates = find_crossed(
+            catalog,
+            "level",
+            get_level(current_xp + gained_xp),
+            get_level(current_xp),
+        )
+        current_xp += gained_xp
+
+    if not to_award:
+        return newly_earned
+    to_award.sort(key=lambda a: a.get("sort_order") or 0)
+
+    # Rows, XP and notifications in one transaction (migrations/
+    # 005_idempotent_jobs.sql): a retry after a failure that committed
+    # finds everything done, and only the rows actually inserted count
+    response = service_supabase.rpc(
+        "award_achievements",
+        {
+            "p_user_id": user_id,
+            "p_achievement_ids": [str(a["id"]) for a in to_award],
+            "p_reason": REASON_ACHIEVEMENT_UNLOCK,
+            "p_notify": notify,
+        },
+    ).execute()
+    awarded_ids = set(response.data or [])
+
+    newly_earned = [
+        {
+            "name": achievement["name"],
+            "description": achievement["description"],
+            "icon": achievement["icon"],
+            "xp_reward": achievement["xp_reward"],
+        }
+        for achievement in to_award
+        if str(achievement["id"]) in awarded_ids
+    ]
+    if newly_earned:
+        print(
+            f"User {user_id} earned achievements: {[a['name'] for a in newly_earned]}"
         )
 
-        # Check each achievement
-        xp_to_award = 0
-        for achievement in achievements_response.data:
-            # Skip if already earned
-            if achievement["id"] in earned_ids:
-                continue
-
-            # Check if criteria is met
-            criteria_met = False
-
-            if achievement["category"] == "tasks":
-                criteria_met = total_tasks >= achievement["requirement_value"]
-            elif achievement["category"] == "focus":
-                criteria_met = total_focus >= achievement["requirement_value"]
-            elif achievement["category"] == "level":
-                criteria_met = user_level >= achievement["requirement_value"]
-
-            if criteria_met:
-                print(f"User meets criteria for achievement: {achievement['name']}")
-                # Award the achievement
-                service_supabase.table("user_achievements").insert(
-                    {"user_id": user_id, "achievement_id": achievement["id"]}
-                ).execute()
-
-                # Track XP to award
-                xp_to_award += achievement["xp_reward"]
-
-                newly_earned.append(
-                    {
-                        "name": achievement["name"],
-                        "description": achievement["description"],
-                        "icon": achievement["icon"],
-                        "xp_reward": achievement["xp_reward"],
-                    }
-                )
-                print(
-                    f"Achievement {achievement['name']} earned with {achievement['xp_reward']} XP"
-                )
-
-        # Award all XP at once if any achievements were earned
-        if xp_to_award > 0:
-            new_total_xp = total_xp + xp_to_award
-            print(
-                f"Awarding {xp_to_award} XP from achievements. New total: {new_total_xp}"
-            )
-            if xp_response.data:
-                service_supabase.table("user_xp").update({"total_xp": new_total_xp}).eq(
-                    "user_id", user_id
-                ).execute()
-            else:
-                service_supabase.table("user_xp").insert(
-                    {"user_id": user_id, "total_xp": xp_to_award}
-                ).execute()
+    return newly_earned
+
 
+def check_and_award_achievements(user_id, service_supabase, event=None, total_xp=None):
+    """Award newly earned achievements, logging rather than raising errors"""
+    try:
+        return award_achievements(user_id, service_supabase, event, total_xp)
     except Exception as e:
         print(f"Error checking achievements: {e}")
-
-    return newly_earned
+        return []
@@ -0,0 +1,86 @@
+"""Async service role client for the ASGI serving mode (see asgi.py).
+
+Each worker's event loop gets one pooled httpx.AsyncClient. The async pool
+is sized separately from the threaded one because a single loop is meant to
+keep many upstream calls in flight at once.
+"""
+
+import asyncio
+import os
+
+import httpx
+from supabase import AsyncClientOptions, acreate_client
+
+from utils.database import get_http_client_kwargs, get_pool_settings
+from utils.query_tracking import AsyncQueryTrackingTransport
+
+_client = None
+_client_http = None
+_client_loop = None
+_client_lock = None
+
+
+def get_async_pool_settings():
+    """Pool settings for the async client; the rest follow the sync pool"""
+    settings = get_pool_settings()
+    settings["max_connections"] = int(
+        os.getenv("SUPABASE_ASYNC_POOL_MAX_CONNECTIONS", "200")
+    )
+    settings["max_keepalive_connections"] = int(
+        os.getenv("SUPABASE_ASYNC_POOL_MAX_KEEPALIVE", "100")
+    )
+    return settings
+
+
+async def _create_client():
+    url = os.getenv("SUPABASE_URL")
+    service_key = os.getenv("SUPABASE_SERVICE_KEY")
+
+    if not url or not service_key:
+        raise Exception("Missing Supabase URL or Service Key")
+
+    kwargs = get_http_client_kwargs(get_async_pool_settings())
+    transport = httpx.AsyncHTTPTransport(limits=kwargs.pop("limits"))
+    http_client = httpx.AsyncClient(
+        transport=AsyncQueryTrackingTransport(transport), **kwargs
+    )
+    options = AsyncClientOptions(
+        auto_refresh_token=False,
+        persist_session=False,
+        httpx_client=http_client,
+    )
+    try:
+        client = await acreate_client(url, service_key, options=options)
+    except Exception:
+        await http_client.aclose()
+        raise
+    return client, http_client
+
+
+async def get_async_service_role_client():
+    """Async Supabase client with service role (bypasses RLS), one per loop"""
+    global _client, _client_http, _client_loop, _client_lock
+    loop = asyncio.get_running_loop()
+    if _client is not None and _client_loop is loop:
+        return _client
+
+    if _client_lock is None or _client_loop is not loop:
+        _client_lock = asyncio.Lock()
+        _client_loop = loop
+        _client = None
+        _client_http = None
+
+    async with _client_lock:
+        if _client is None:
+            _client, _client_http = await _create_client()
+    return _client
+
+
+async def close_async_service_role_client():
+    """Close this loop's pooled connections, e.g. on ASGI lifespan shutdown"""
+    global _client, _client_http
+    http_client = _client_http
+    _client = None
+    _client_http = None
+    if http_client is not None:
+        await http_client.aclose()
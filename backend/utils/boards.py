@@ -0,0 +1,209 @@
+"""Shared board access resolution backed by a per-worker membership cache.
+
+invalidate_board only clears the worker that made the change, so another
+worker keeps granting a removed member read access for up to
+BOARD_ACCESS_CACHE_TTL seconds. Writes to a board's tasks check membership
+against the database every time (fresh=True), so revocation is immediate
+for them.
+"""
+
+import os
+
+from utils.cache import TTLCache
+from utils.database import get_service_role_client
+from utils.fanout import gather
+
+BOARD_ROLE_OWNER = "owner"
+BOARD_ROLE_MEMBER = "member"
+
+# board_id -> {"owner_id": ..., "members": frozenset of accepted emails}
+# Grants access, so kept short: the TTL bounds revocation on other workers
+_membership_cache = TTLCache(
+    maxsize=int(os.getenv("BOARD_CACHE_SIZE", "2048")),
+    ttl=float(os.getenv("BOARD_ACCESS_CACHE_TTL", "5")),
+)
+
+# board_id -> tuple of member dicts as returned by GET /boards/<id>/members
+# Display only (access is still checked with get_board_role)
+_member_list_cache = TTLCache(
+    maxsize=int(os.getenv("BOARD_CACHE_SIZE", "2048")),
+    ttl=float(os.getenv("BOARD_CACHE_TTL", "60")),
+)
+
+
+def _load_membership(board_id, service_supabase):
+    """Read a board's owner and accepted members from the database"""
+    board_response = (
+        service_supabase.table("SharedBoards")
+        .select("id, user_id")
+        .eq("id", board_id)
+        .execute()
+    )
+    if not board_response.data:
+        return {"owner_id": None, "members": frozenset()}
+
+    invites_response = (
+        service_supabase.table("BoardInvites")
+        .select("invited_email")
+        .eq("board_id", board_id)
+        .eq("status", "Accepted")
+        .execute()
+    )
+    members = frozenset(
+        invite["invited_email"] for invite in (invites_response.data or [])
+    )
+    return {"owner_id": board_response.data[0]["user_id"], "members": members}
+
+
+def get_board_membership(board_id, service_supabase=None, fresh=False):
+    """Return the cached membership index for a board; fresh=True re-reads it"""
+    membership = None if fresh else _membership_cache.get(board_id)
+    if membership is None:
+        membership = _load_membership(
+            board_id, service_supabase or get_service_role_client()
+        )
+        _membership_cache.set(board_id, membership)
+    return membership
+
+
+def get_board_role(board_id, user, service_supabase=None, fresh=False):
+    """Return the user's role on a board: "owner", "member" or None.
+
+    Pass fresh=True for writes, so a member removed through another worker
+    is refused at once rather than when that worker's cache expires.
+    """
+    membership = get_board_membership(board_id, service_supabase, fresh)
+    if membership["owner_id"] is None:
+        return None
+    if membership["owner_id"] == user["id"]:
+        return BOARD_ROLE_OWNER
+    if user.get("email") in membership["members"]:
+        return BOARD_ROLE_MEMBER
+    return None
+
+
+def _load_member_list(board_id, service_supabase):
+    """Owner then accepted members (in invite order), or None for no board"""
+    board_response, invites_response = gather(
+        lambda: (
+            service_supabase.table("SharedBoards")
+            .select("user_id, users!inner(username, email)")
+            .eq("id", board_id)
+            .execute()
+        ),
+        lambda: (
+            service_supabase.table("BoardInvites")
+            .select("invited_email")
+            .eq("board_id", board_id)
+            .eq("status", "Accepted")
+            .execute()
+        ),
+    )
+    if not board_response.data:
+        return None
+
+    board = board_response.data[0]
+    emails = [invite["invited_email"] for invite in (invites_response.data or [])]
+
+    # The invites' users join is the inviter, so resolve members in one batch
+    users_by_email = {}
+    if emails:
+        users_response = (
+            service_supabase.table("users")
+            .select("id, username, email")
+            .in_("email", sorted(set(emails)))
+            .execute()
+        )
+        users_by_email = {row["email"]: row for row in users_response.data or []}
+
+    members = [
+        {
+            "id": board["user_id"],
+            "username": board["users"]["username"],
+            "email": board["users"]["email"],
+            "role": "owner",
+        }
+    ]
+    for email in emails:
+        member = users_by_email.get(email)
+        if member:
+            members.append(
+                {
+                    "id": member["id"],
+                    "username": member["username"],
+                    "email": member["email"],
+                    "role": "member",
+                }
+            )
+
+    # Same queries the membership index is built from, so prime it too
+    _membership_cache.set(
+        board_id, {"owner_id": board["user_id"], "members": frozenset(emails)}
+    )
+    return tuple(members)
+
+
+def get_board_member_list(board_id, service_supabase=None):
+    """Cached member list for a board (owner first), or None if it doesn't exist"""
+    members = _member_list_cache.get(board_id)
+    if members is None:
+        members = _load_member_list(
+            board_id, service_supabase or get_service_role_client()
+        )
+        if members is None:
+            return None
+        _member_list_cache.set(board_id, members)
+    return [dict(member) for member in members]
+
+
+def invalidate_board(board_id):
+    """Forget a board's membership after an owner or member change"""
+    _membership_cache.invalidate(board_id)
+    _member_list_cache.invalidate(board_id)
+
+
+def _board_summary(board, role):
+    return {
+        "id": board["id"],
+        "name": board["name"],
+        "description": board.get("description", ""),
+        "created_by": board["users"]["username"],
+        "created_at": board["create_date"],
+        "role": role,
+    }
+
+
+def pending_invites_query(service_supabase, email):
+    return (
+        service_supabase.table("BoardInvites")
+        .select("*, SharedBoards!inner(name, description), users!invited_by(username)")
+        .eq("invited_email", email)
+        .eq("status", "Pending")
+    )
+
+
+def summarize_invites(invites):
+    """Invite list for GET /api/invites from pending_invites_query rows"""
+    return [
+        {
+            "id": invite["id"],
+            "board_id": invite["board_id"],
+            "board_name": invite["SharedBoards"]["name"],
+            "board_description": invite["SharedBoards"]["description"],
+            "invited_by": invite["users"]["username"],
+            "message": invite.get(
+                "message", "Hi! I'd like to invite you to my Taskboard!"
+            ),
+            "invite_date": invite["invite_date"],
+        }
+        for invite in invites
+    ]
+
+
+def summarize_boards(owned_boards, accepted_invites):
+    """Board list for GET /api/boards from owned boards and accepted invites"""
+    boards = [_board_summary(board, "admin") for board in owned_boards]
+    boards.extend(
+        _board_summary(invite["SharedBoards"], "member") for invite in accepted_invites
+    )
+    return boards
@@ -0,0 +1,162 @@
+"""Sections of GET /api/bootstrap, the batched first page load.
+
+Each section names the queries it needs and builds the same payload as its
+standalone endpoint from their results. The endpoint runs the queries of
+every requested section in a single gather(), so a query two sections share
+(the XP total) runs once and the load waits for the slowest query rather
+than for each endpoint in turn.
+"""
+
+from utils.achievement_catalog import describe_achievements, get_catalog
+from utils.boards import pending_invites_query, summarize_invites
+from utils.fanout import gather
+from utils.level_system import xp_summary
+from utils.stats import (
+    achievement_stats,
+    count_completed,
+    daily_completions_query,
+    get_total_xp,
+    last_7_days,
+    summarize_daily_completions,
+)
+from utils.task_sync import (
+    latest_task_query,
+    latest_tombstone_query,
+    sync_token_for,
+)
+from utils.tasks import apply_task_query, paginate
+from utils.write_behind import pending_xp
+
+
+class BootstrapError(ValueError):
+    """Invalid ?sections= for GET /api/bootstrap"""
+
+
+def _result(results, name):
+    result = results[name]
+    if isinstance(result, Exception):
+        raise result
+    return result
+
+
+def _xp(user, results, context):
+    return xp_summary(_result(results, "total_xp") + pending_xp(user["id"]))
+
+
+def _achievements(user, results, context):
+    stats = achievement_stats(
+        results["tasks_completed"], results["focus_sessions"], results["total_xp"]
+    )
+    earned = _result(results, "earned")
+    catalog = get_catalog()
+    if not catalog.achievements:
+        raise LookupError("No achievements found in database")
+
+    all_achievements, total_earned = describe_achievements(
+        catalog, stats, earned.data or []
+    )
+    return {
+        "achievements": all_achievements,
+        "total_earned": total_earned,
+        "stats": stats,
+    }
+
+
+def _tasks(user, results, context):
+    tasks, pagination = paginate(
+        _result(results, "task_page").data or [], context["task_options"]
+    )
+    sync_token = sync_token_for(
+        _result(results, "latest_task").data or [],
+        _result(results, "latest_tombstone").data or [],
+    )
+    return {"tasks": tasks, "pagination": pagination, "sync_token": sync_token}
+
+
+def _invites(user, results, context):
+    return {"invites": summarize_invites(_result(results, "invites").data or [])}
+
+
+def _daily_completions(user, results, context):
+    return summarize_daily_completions(
+        context["dates"], _result(results, "daily_stats").data or []
+    )
+
+
+# Section -> (queries it needs, payload builder)
+SECTIONS = {
+    "xp": (("total_xp",), _xp),
+    "achievements": (
+        ("tasks_completed", "focus_sessions", "total_xp", "earned"),
+        _achievements,
+    ),
+    "tasks": (("task_page", "latest_task", "latest_tombstone"), _tasks),
+    "invites": (("invites",), _invites),
+    "daily_completions": (("daily_stats",), _daily_completions),
+}
+
+
+def _queries(service_supabase, user, context):
+    user_id = user["id"]
+    task_options = context["task_options"]
+    return {
+        "total_xp": lambda: get_total_xp(service_supabase, user_id),
+        "tasks_completed": lambda: count_completed(service_supabase, "tasks", user_id),
+        "focus_sessions": lambda: count_completed(service_supabase, "focus", user_id),
+        "earned": lambda: (
+            service_supabase.table("user_achievements")
+            .select("achievement_id, earned_at")
+            .eq("user_id", user_id)
+            .execute()
+        ),
+        "task_page": lambda: apply_task_query(
+            service_supabase.table("Tasks")
+            .select(task_options["select"])
+            .eq("user_id", user_id),
+            task_options,
+        ).execute(),
+        "latest_task": latest_task_query(service_supabase, user_id).execute,
+        "latest_tombstone": latest_tombstone_query(service_supabase, user_id).execute,
+        "invites": pending_invites_query(service_supabase, user["email"]).execute,
+        "daily_stats": daily_completions_query(
+            service_supabase, user_id, context["dates"]
+        ).execute,
+    }
+
+
+def parse_sections(value):
+    """Requested section names from ?sections=a,b (every section when absent)"""
+    if not value:
+        return list(SECTIONS)
+    sections = [name.strip() for name in value.split(",") if name.strip()]
+    unknown = sorted(set(sections) - SECTIONS.keys())
+    if unknown:
+        raise BootstrapError(f"Unknown sections: {', '.join(unknown)}")
+    return list(dict.fromkeys(sections))
+
+
+def build_bootstrap(service_supabase, user, sections, task_options):
+    """Payload with one key per section; failed sections are listed in "errors" """
+    context = {"task_options": task_options, "dates": last_7_days()}
+    queries = _queries(service_supabase, user, context)
+
+    names = list(dict.fromkeys(q for s in sections for q in SECTIONS[s][0]))
+    results = dict(
+        zip(
+            names,
+            gather(*(queries[name] for name in names), return_exceptions=True),
+            strict=True,
+        )
+    )
+
+    payload = {}
+    errors = {}
+    for section in sections:
+        try:
+            payload[section] = SECTIONS[section][1](user, results, context)
+        except Exception as e:
+            print(f"Bootstrap section {section} failed: {e}")
+            errors[section] = str(e)
+    if errors:
+        payload["errors"] = errors
+    return payload
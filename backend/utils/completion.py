@@ -0,0 +1,74 @@
+"""Side effects of completing a task or focus session.
+
+Daily stats and the achievement check run inline by default. With
+BACKGROUND_JOBS enabled they are handed to the job runner instead, and any
+achievements earned are queued as notifications for GET /api/notifications.
+
+A completion only checks the thresholds it can have just crossed, so
+recheck_achievements queues the full check at login and after admin XP
+changes to catch up on anything that was missed.
+"""
+
+import uuid
+from datetime import date
+
+from utils.achievements_with_db import (
+    EVENT_TASK,
+    award_achievements,
+    check_and_award_achievements,
+)
+from utils.database import get_service_role_client
+from utils.jobs import BACKGROUND_JOBS_ENABLED, submit_job
+from utils.write_behind import record_task_completion
+
+
+def award_and_notify(user_id, event, total_xp=None):
+    """Background job: award achievements and queue a notification for each"""
+    # One transaction for both, so a retried job cannot award without notifying
+    return award_achievements(
+        user_id,
+        get_service_role_client(),
+        event=event,
+        total_xp=total_xp,
+        notify=True,
+    )
+
+
+def run_completion_side_effects(user_id, event, total_xp=None, service_supabase=None):
+    """Record stats and check achievements for a completion event.
+
+    Returns the achievements earned, or None when the work was queued in the
+    background and results will arrive as notifications.
+    """
+    if BACKGROUND_JOBS_ENABLED:
+        if event == EVENT_TASK:
+            # Day and key are fixed now, so retries count the completion once
+            submit_job(
+                record_task_completion,
+                user_id,
+                date.today().isoformat(),
+                key=uuid.uuid4().hex,
+            )
+        submit_job(award_and_notify, user_id, event, total_xp)
+        return None
+
+    if event == EVENT_TASK:
+        try:
+            record_task_completion(user_id, service_supabase=service_supabase)
+        except Exception as stats_error:
+            print(f"Failed to update daily stats: {stats_error}")
+
+    return check_and_award_achievements(
+        user_id, service_supabase, event=event, total_xp=total_xp
+    )
+
+
+def recheck_achievements(user_id, total_xp=None):
+    """Queue a full achievement check; earned ones arrive as notifications.
+
+    Awards what a per-event check cannot see: thresholds passed before the
+    achievement existed or was awardable, and levels reached through an
+    admin XP adjustment. Always queued, whatever BACKGROUND_JOBS is, so it
+    never delays the login or admin response that triggers it.
+    """
+    submit_job(award_and_notify, user_id, None, total_xp)
@@ -0,0 +1,107 @@
+"""Negotiated gzip / brotli compression of API responses.
+
+Bodies of at least COMPRESS_MIN_SIZE bytes with a text-like mimetype are
+compressed with the best encoding the client accepts: brotli when the
+brotli package is installed, otherwise gzip. Smaller bodies are sent as they
+are, since the framing overhead and CPU time outweigh the bytes saved.
+Streamed and file responses (e.g. the frontend build) are left alone.
+
+A compressed body is a different representation, so its ETag is made weak;
+If-None-Match uses weak comparison, so 304s keep working (see utils/etag.py).
+"""
+
+import gzip
+import os
+
+from flask import request
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+COMPRESSION_ENABLED = os.getenv("COMPRESSION", "true").lower() == "true"
+MIN_SIZE = int(os.getenv("COMPRESS_MIN_SIZE", "1024"))
+GZIP_LEVEL = int(os.getenv("COMPRESS_GZIP_LEVEL", "6"))
+BROTLI_QUALITY = int(os.getenv("COMPRESS_BROTLI_QUALITY", "4"))
+
+COMPRESSIBLE_TYPES = frozenset(
+    {"application/json", "application/javascript", "image/svg+xml"}
+)
+
+
+def supported_encodings():
+    """Encodings this worker can produce, most preferred first"""
+    return ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def choose_encoding(accept_encoding, encodings=None):
+    """Best of encodings (default: supported ones) for an Accept-Encoding header"""
+    weights = {}
+    for part in (accept_encoding or "").split(","):
+        coding, _, params = part.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        weights[coding] = q
+
+    best, best_q = None, 0.0
+    if encodings is None:
+        encodings = supported_encodings()
+    for coding in encodings:
+        q = weights.get(coding, weights.get("*", 0.0))
+        if q > best_q:
+            best, best_q = coding, q
+    return best
+
+
+def compress(body, encoding):
+    if encoding == "br":
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+def compressible(mimetype):
+    return mimetype is not None and (
+        mimetype.startswith("text/") or mimetype in COMPRESSIBLE_TYPES
+    )
+
+
+def _after_request(response):
+    if response.direct_passthrough or not compressible(response.mimetype):
+        return response
+    response.vary.add("Accept-Encoding")
+    if (
+        response.status_code != 200
+        or response.is_streamed
+        or "Content-Encoding" in response.headers
+    ):
+        return response
+
+    body = response.get_data()
+    if len(body) < MIN_SIZE:
+        return response
+
+    encoding = choose_encoding(request.headers.get("Accept-Encoding"))
+    if encoding is None:
+        return response
+
+    response.set_data(compress(body, encoding))
+    response.headers["Content-Encoding"] = encoding
+    tag, weak = response.get_etag()
+    if tag and not weak:
+        response.set_etag(tag, weak=True)
+    return response
+
+
+def init_compression(app):
+    """Compress responses; install after init_metrics so sizes are on the wire"""
+    if COMPRESSION_ENABLED:
+        app.after_request(_after_request)
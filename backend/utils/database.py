@@ -1,8 +1,21 @@
 import os
+import threading
 
-from supabase import Client, create_client
+import httpx
 
-supabase_client: Client = None
+from utils.query_tracking import QueryTrackingTransport
+
+# supabase (about half of the app's import time) is imported by the functions
+# that create clients, so it loads on warm-up or first use instead of import
+supabase_client = None
+
+# One pooled service role client per worker process. Gunicorn forks workers
+# from the master, so the client is created lazily in the child and dropped
+# again after any fork (sockets must never be shared across processes).
+service_role_client = None
+_service_role_http: httpx.Client | None = None
+_service_role_pid = None
+_service_role_lock = threading.Lock()
 
 
 def init_supabase():
@@ -14,6 +27,8 @@ def init_supabase():
     if not url or not key:
         raise ValueError("Missing Supabase configuration. Check your .env file.")
 
+    from supabase import create_client
+
     supabase_client = create_client(url, key)
     return supabase_client
 
@@ -26,12 +41,47 @@ def get_supabase_client():
     return supabase_client
 
 
-def get_service_role_client():
-    """get Supabase client with service role (bypasses RLS)"""
-    import os
-
-    from supabase import create_client
-
+def get_pool_settings():
+    """Connection pool and timeout settings for the service role client"""
+    return {
+        "max_connections": int(os.getenv("SUPABASE_POOL_MAX_CONNECTIONS", "20")),
+        "max_keepalive_connections": int(
+            os.getenv("SUPABASE_POOL_MAX_KEEPALIVE", "10")
+        ),
+        "keepalive_expiry": float(os.getenv("SUPABASE_POOL_KEEPALIVE_EXPIRY", "30")),
+        "connect_timeout": float(os.getenv("SUPABASE_CONNECT_TIMEOUT", "5")),
+        "read_timeout": float(os.getenv("SUPABASE_READ_TIMEOUT", "10")),
+        "pool_timeout": float(os.getenv("SUPABASE_POOL_TIMEOUT", "5")),
+    }
+
+
+def get_http_client_kwargs(settings=None):
+    """httpx limits and timeouts for the pool, shared by sync and async clients"""
+    settings = settings or get_pool_settings()
+    return {
+        "limits": httpx.Limits(
+            max_connections=settings["max_connections"],
+            max_keepalive_connections=settings["max_keepalive_connections"],
+            keepalive_expiry=settings["keepalive_expiry"],
+        ),
+        "timeout": httpx.Timeout(
+            settings["read_timeout"],
+            connect=settings["connect_timeout"],
+            pool=settings["pool_timeout"],
+        ),
+        "follow_redirects": True,
+    }
+
+
+def build_http_client(settings=None):
+    """Build the keep-alive httpx client shared by every service role request"""
+    kwargs = get_http_client_kwargs(settings)
+    transport = httpx.HTTPTransport(limits=kwargs.pop("limits"))
+    return httpx.Client(transport=QueryTrackingTransport(transport), **kwargs)
+
+
+def create_service_role_client(http_client=None):
+    """Create a new service role client, optionally on a shared http client"""
     url = os.getenv("SUPABASE_URL")
     # You'll need to add this to .env
     service_key = os.getenv("SUPABASE_SERVICE_KEY")
@@ -39,20 +89,92 @@ def get_service_role_client():
     if not url or not service_key:
         raise Exception("Missing Supabase URL or Service Key")
 
-    return create_client(url, service_key)
+    from supabase import ClientOptions, create_client
+
+    if http_client is None:
+        return create_client(url, service_key)
 
+    options = ClientOptions(
+        auto_refresh_token=False,
+        persist_session=False,
+        httpx_client=http_client,
+    )
+    return create_client(url, service_key, options=options)
 
-def test_connection():
-    """Test the database connection"""
+
+def _install_service_role_client():
+    """Build and install a pooled client; caller holds the lock"""
+    global service_role_client, _service_role_http, _service_role_pid
+    http_client = build_http_client()
     try:
-        client = get_supabase_client()
+        client = create_service_role_client(http_client)
+    except Exception:
+        http_client.close()
+        raise
+
+    old_http = _service_role_http
+    service_role_client = client
+    _service_role_http = http_client
+    _service_role_pid = os.getpid()
+    return client, old_http
 
-        # Test connection by trying to access the auth user (this doesn't require any tables)
-        # This is a simple way to verify the Supabase client is working
-        client.auth.get_session()
 
-        # If we get here without an exception, the connection is working
-        return True, "Supabase connection successful"
+def init_service_role_client():
+    """(Re)create this worker's pooled service role client"""
+    with _service_role_lock:
+        client, old_http = _install_service_role_client()
 
-    except Exception as e:
-        return False, f"Connection failed: {e!s}"
+    if old_http is not None:
+        old_http.close()
+    return client
+
+
+def get_service_role_client():
+    """get Supabase client with service role (bypasses RLS)"""
+    client = service_role_client
+    if client is not None and _service_role_pid == os.getpid():
+        return client
+
+    with _service_role_lock:
+        if service_role_client is not None and _service_role_pid == os.getpid():
+            return service_role_client
+        client, _ = _install_service_role_client()
+    return client
+
+
+def close_service_role_client():
+    """Close the pooled connections held by this worker"""
+    global service_role_client, _service_role_http, _service_role_pid
+    with _service_role_lock:
+        http_client = _service_role_http
+        service_role_client = None
+        _service_role_http = None
+        _service_role_pid = None
+
+    if http_client is not None:
+        http_client.close()
+
+
+def get_pool_status():
+    """Describe this worker's service role connection pool"""
+    return {
+        "initialized": service_role_client is not None
+        and _service_role_pid == os.getpid(),
+        "pid": os.getpid(),
+        "settings": get_pool_settings(),
+    }
+
+
+def _reset_after_fork():
+    """Forget the parent's client in a freshly forked child"""
+    global service_role_client, _service_role_http, _service_role_pid
+    global _service_role_lock
+    # The parent's sockets belong to the parent; never close them from here.
+    service_role_client = None
+    _service_role_http = None
+    _service_role_pid = None
+    _service_role_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
@@ -0,0 +1,47 @@
+"""Strong ETags and 304 Not Modified for the endpoints the pages poll.
+
+A tag is a hash of the response body, so every worker (and the ASGI routes)
+tags identical bodies identically and a restart can never reuse a tag for
+different content. The body is built on every request: a tag remembered per
+worker would answer 304 with a stale body when the refetch after a write
+lands on a worker that did not see the write. The 304 still saves sending
+the body.
+"""
+
+import hashlib
+
+from flask import request
+
+
+def compute_etag(body):
+    """Strong ETag (unquoted) for a response body"""
+    return hashlib.blake2b(body, digest_size=16).hexdigest()
+
+
+def with_etag(response):
+    """Tag a 200 response and turn it into a 304 if If-None-Match matches"""
+    if response.status_code != 200:
+        return response
+
+    response.set_etag(compute_etag(response.get_data()))
+    # Revalidate every time; the tag is per user, so never share the response
+    response.headers["Cache-Control"] = "private, no-cache"
+    response.vary.add("Authorization")
+    return response.make_conditional(request)
+
+
+def etag_headers(body, headers):
+    """(status, extra headers) for an ASGI response body and request headers"""
+    tag = compute_etag(body)
+    extra = [
+        (b"etag", f'"{tag}"'.encode()),
+        (b"cache-control", b"private, no-cache"),
+        (b"vary", b"Authorization"),
+    ]
+    if_none_match = headers.get(b"if-none-match", b"").decode("latin-1")
+    candidates = {
+        value.strip().removeprefix("W/") for value in if_none_match.split(",")
+    }
+    if "*" in candidates or f'"{tag}"' in candidates:
+        return 304, extra
+    return 200, extra
@@ -0,0 +1,79 @@
+"""Run independent upstream queries concurrently within one request.
+
+gather() takes zero-argument callables (usually lambdas wrapping a query's
+.execute()), runs them on a per-worker thread pool and returns their results
+in order, so a handler waits for the slowest query instead of the sum of all
+of them. The pooled service role client is thread-safe, so queries can share
+it. Set QUERY_FANOUT_WORKERS=0 to run everything sequentially.
+"""
+
+import contextvars
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+FANOUT_WORKERS = int(os.getenv("QUERY_FANOUT_WORKERS", "8"))
+
+_executor = None
+_executor_pid = None
+_executor_lock = threading.Lock()
+_local = threading.local()
+
+
+def _get_executor():
+    global _executor, _executor_pid
+    with _executor_lock:
+        # Threads do not survive fork, so each worker builds its own pool
+        if _executor is None or _executor_pid != os.getpid():
+            _executor = ThreadPoolExecutor(
+                max_workers=FANOUT_WORKERS, thread_name_prefix="fanout"
+            )
+            _executor_pid = os.getpid()
+        return _executor
+
+
+def _call(fn):
+    _local.in_fanout = True
+    try:
+        return fn()
+    finally:
+        _local.in_fanout = False
+
+
+def _run_inline(fn, return_exceptions):
+    try:
+        return fn()
+    except Exception as e:
+        if not return_exceptions:
+            raise
+        return e
+
+
+def gather(*calls, return_exceptions=False):
+    """Run calls concurrently and return their results in order.
+
+    The first call runs on the calling thread. With return_exceptions=True a
+    failing call's exception is returned in its slot instead of raised, so
+    handlers can fall back per query as they would with sequential code.
+    """
+    # Nested fan-outs run inline so pool threads never wait on each other
+    if len(calls) < 2 or FANOUT_WORKERS < 1 or getattr(_local, "in_fanout", False):
+        return [_run_inline(fn, return_exceptions) for fn in calls]
+
+    executor = _get_executor()
+    # Each call gets a copy of our context so its queries count towards this request
+    futures = [
+        executor.submit(contextvars.copy_context().run, _call, fn) for fn in calls[1:]
+    ]
+    results = [_run_inline(calls[0], return_exceptions=True)]
+    for future in futures:
+        try:
+            results.append(future.result())
+        except Exception as e:
+            results.append(e)
+
+    if not return_exceptions:
+        for result in results:
+            if isinstance(result, Exception):
+                raise result
+    return results
@@ -0,0 +1,138 @@
+"""Liveness and readiness for load balancer probes.
+
+Probes hit every worker every few seconds, so they never wait on Supabase
+themselves. A per-worker monitor thread runs the connectivity check every
+HEALTH_CHECK_INTERVAL seconds (one cheap query through the pooled service
+role client) and retries a failed catalog warm-up; the readiness endpoint
+only reads the last result. A worker is ready when its last check succeeded
+and is recent, and its achievements catalog is loaded.
+"""
+
+import os
+import threading
+import time
+from datetime import UTC, datetime
+
+from utils.achievement_catalog import get_catalog_status, warm_catalog
+from utils.database import get_pool_status, get_service_role_client
+
+CHECK_INTERVAL = float(os.getenv("HEALTH_CHECK_INTERVAL", "10"))
+# A result older than this means the monitor is stuck (e.g. on a hung query)
+STALE_AFTER = float(os.getenv("HEALTH_CHECK_STALE_AFTER", str(CHECK_INTERVAL * 3)))
+
+
+def check_database(service_supabase=None):
+    """One round trip through the pool; returns (connected, message)"""
+    try:
+        service_supabase = service_supabase or get_service_role_client()
+        service_supabase.table("achievements").select("id").limit(1).execute()
+        return True, "Supabase connection successful"
+    except Exception as e:
+        return False, f"Connection failed: {e!s}"
+
+
+class HealthMonitor:
+    """Refreshes this worker's connectivity status in the background"""
+
+    def __init__(self, interval=CHECK_INTERVAL):
+        self.interval = interval
+        self._result = None
+        self._lock = threading.Lock()
+        self._thread_lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread = None
+        self._pid = None
+
+    def check(self):
+        """Run the checks now and store the result"""
+        if not get_catalog_status()["loaded"]:
+            try:
+                warm_catalog()
+            except Exception as e:
+                print(f"Catalog warm-up retry failed: {e}")
+
+        started = time.perf_counter()
+        connected, message = check_database()
+        latency = time.perf_counter() - started
+
+        with self._lock:
+            failures = 0 if connected else self._failures() + 1
+            self._result = {
+                "connected": connected,
+                "message": message,
+                "latency_ms": round(latency * 1000, 1),
+                "checked_at": datetime.now(UTC).isoformat(),
+                "consecutive_failures": failures,
+                "_monotonic": time.monotonic(),
+            }
+
+    def _failures(self):
+        # Caller holds self._lock
+        return self._result["consecutive_failures"] if self._result else 0
+
+    def last_result(self):
+        """Latest check with its age (not connected until the first one lands)"""
+        self.start()
+        with self._lock:
+            result = self._result
+        if result is None:
+            return {
+                "connected": False,
+                "message": "First check pending",
+                "latency_ms": None,
+                "checked_at": None,
+                "consecutive_failures": 0,
+                "age_seconds": None,
+            }
+
+        result = dict(result)
+        result["age_seconds"] = round(time.monotonic() - result.pop("_monotonic"), 1)
+        return result
+
+    def start(self):
+        """Start this worker's monitor thread if it is not running yet"""
+        # Threads do not survive fork, so each worker starts its own
+        with self._thread_lock:
+            if self._pid == os.getpid() and self._thread is not None:
+                return
+            self._pid = os.getpid()
+            with self._lock:
+                # A result inherited from the parent says nothing about us
+                self._result = None
+            self._stopped.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="health-monitor", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self):
+        while not self._stopped.is_set():
+            try:
+                self.check()
+            except Exception as e:
+                print(f"Health check error: {e}")
+            self._stopped.wait(self.interval)
+
+    def stop(self, timeout=None):
+        """Stop this process's monitor thread, waiting up to timeout for it"""
+        self._stopped.set()
+        with self._thread_lock:
+            thread = self._thread if self._pid == os.getpid() else None
+        if thread is not None:
+            thread.join(timeout)
+
+
+monitor = HealthMonitor()
+
+
+def get_readiness():
+    """(ready, details) from the monitor's last result, the catalog and the pool"""
+    database = monitor.last_result()
+    catalog = get_catalog_status()
+    database_ok = database["connected"] and database["age_seconds"] <= STALE_AFTER
+
+    return database_ok and catalog["loaded"], {
+        "database": database,
+        "catalog": catalog,
+        "pool": get_pool_status(),
+    }
@@ -0,0 +1,81 @@
+"""Background job runner for side effects that should not block a response.
+
+Jobs run on a per-worker thread pool and are retried with exponential
+backoff. Set BACKGROUND_JOBS=true to enable it; otherwise callers run their
+side effects inline as before. The full achievement check at login
+(utils/completion.recheck_achievements) is always queued here.
+"""
+
+import atexit
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+BACKGROUND_JOBS_ENABLED = os.getenv("BACKGROUND_JOBS", "false").lower() == "true"
+JOB_WORKERS = int(os.getenv("BACKGROUND_JOB_WORKERS", "4"))
+JOB_RETRIES = int(os.getenv("BACKGROUND_JOB_RETRIES", "3"))
+JOB_RETRY_BACKOFF = float(os.getenv("BACKGROUND_JOB_RETRY_BACKOFF", "0.5"))
+
+
+class JobRunner:
+    """Thread pool that retries failed jobs and is recreated after fork"""
+
+    def __init__(self, max_workers=JOB_WORKERS, retries=JOB_RETRIES):
+        self.max_workers = max_workers
+        self.retries = retries
+        self._executor = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self):
+        with self._lock:
+            if self._executor is None or self._pid != os.getpid():
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="job"
+                )
+                self._pid = os.getpid()
+            return self._executor
+
+    def submit(self, fn, *args, **kwargs):
+        """Queue fn(*args, **kwargs); returns a Future"""
+        return self._get_executor().submit(self._run, fn, args, kwargs)
+
+    def _run(self, fn, args, kwargs):
+        name = getattr(fn, "__name__", repr(fn))
+        for attempt in range(self.retries + 1):
+            try:
+                return fn(*args, **kwargs)
+            except Exception as e:
+                if attempt == self.retries:
+                    print(
+                        f"Background job {name} failed after {attempt + 1} tries: {e}"
+                    )
+                    raise
+                delay = JOB_RETRY_BACKOFF * (2**attempt)
+                print(f"Background job {name} failed ({e}), retrying in {delay}s")
+                time.sleep(delay)
+        return None
+
+    def shutdown(self, wait=True):
+        """Stop accepting jobs and, by default, finish the queued ones"""
+        with self._lock:
+            executor = self._executor if self._pid == os.getpid() else None
+            self._executor = None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+
+runner = JobRunner()
+
+
+def submit_job(fn, *args, **kwargs):
+    """Run fn in the background with retries"""
+    return runner.submit(fn, *args, **kwargs)
+
+
+def shutdown_jobs(wait=True):
+    runner.shutdown(wait=wait)
+
+
+atexit.register(shutdown_jobs)
@@ -0,0 +1,62 @@
+"""orjson-backed JSON provider for the Flask app.
+
+Install with init_json(app). It keeps the default provider's output rules
+(sorted keys, compact unless debugging, HTTP dates for date objects, str()
+of decimals and UUIDs) so responses carry the same data, and falls back to
+the default provider when orjson is not installed.
+"""
+
+import os
+
+from flask.json.provider import DefaultJSONProvider, _default
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+FAST_JSON_ENABLED = os.getenv("FAST_JSON", "true").lower() == "true"
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """DefaultJSONProvider with orjson doing the encoding and decoding"""
+
+    def _options(self, indent, sort_keys):
+        option = orjson.OPT_SORT_KEYS if sort_keys else 0
+        # Hand dates back to Flask's default so they stay HTTP dates
+        option |= orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return option
+
+    def _dumpb(self, obj, indent=False, sort_keys=None):
+        sort_keys = self.sort_keys if sort_keys is None else sort_keys
+        return orjson.dumps(
+            obj, default=_default, option=self._options(indent, sort_keys)
+        )
+
+    def dumps(self, obj, **kwargs):
+        if kwargs.keys() - {"indent", "separators", "sort_keys"}:
+            # e.g. cls= or ensure_ascii=False from a caller that needs json
+            return super().dumps(obj, **kwargs)
+        return self._dumpb(
+            obj, bool(kwargs.get("indent")), kwargs.get("sort_keys")
+        ).decode()
+
+    def loads(self, s, **kwargs):
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        return self._app.response_class(
+            self._dumpb(obj, indent) + b"\n", mimetype=self.mimetype
+        )
+
+
+def init_json(app):
+    """Use orjson for request parsing and jsonify when it is available"""
+    if FAST_JSON_ENABLED and orjson is not None:
+        app.json = OrjsonProvider(app)
@@ -1,3 +1,7 @@
+import sys
+from bisect import bisect_right
+from functools import cache
+
 LEVEL_SYSTEM = [
     {"level": 1, "name": "Hatchling", "min_xp": 0, "max_xp": 100},
     {"level": 2, "name": "Baby Gator", "min_xp": 100, "max_xp": 250},
@@ -12,38 +16,95 @@ LEVEL_SYSTEM = [
 ]
 
 
+# Parallel arrays compiled once at import so lookups are a single bisect
+LEVEL_MIN_XP = [level_data["min_xp"] for level_data in LEVEL_SYSTEM]
+LEVEL_NUMBERS = [level_data["level"] for level_data in LEVEL_SYSTEM]
+LEVEL_NAMES = [level_data["name"] for level_data in LEVEL_SYSTEM]
+LEVEL_MAX_XP = [level_data["max_xp"] for level_data in LEVEL_SYSTEM]
+MAX_LEVEL_INDEX = len(LEVEL_SYSTEM) - 1
+
+
+@cache
+def _level_arrays(np):
+    return np.array(LEVEL_MIN_XP), np.array(LEVEL_NUMBERS)
+
+
+def _level_index(total_xp):
+    """Index into the level arrays for total_xp, or -1 when it is negative"""
+    return bisect_right(LEVEL_MIN_XP, total_xp) - 1
+
+
+def get_level(total_xp):
+    """Get just the level number for total_xp"""
+    return LEVEL_NUMBERS[max(_level_index(total_xp), 0)]
+
+
+def get_levels(xp_values):
+    """Map many XP totals to levels at once (e.g. leaderboards, backfills).
+
+    numpy arrays are handled with one searchsorted call and return an array;
+    any other iterable returns a list.
+    """
+    # Only a caller that imported numpy can pass an ndarray, so importing this
+    # module never pays for numpy (it is optional)
+    np = sys.modules.get("numpy")
+    if np is not None and isinstance(xp_values, np.ndarray):
+        min_xp, levels = _level_arrays(np)
+        index = np.searchsorted(min_xp, xp_values, side="right") - 1
+        return levels[np.maximum(index, 0)]
+    return [
+        LEVEL_NUMBERS[max(bisect_right(LEVEL_MIN_XP, xp) - 1, 0)] for xp in xp_values
+    ]
+
+
 def get_level_info(total_xp):
     """Get level information based on total XP"""
-    for level_data in LEVEL_SYSTEM:
-        if level_data["min_xp"] <= total_xp < level_data["max_xp"]:
-            if level_data["level"] < 10:
-                xp_in_level = total_xp - level_data["min_xp"]
-                xp_for_level = level_data["max_xp"] - level_data["min_xp"]
-                progress_percent = int((xp_in_level / xp_for_level) * 100)
-                xp_to_next = level_data["max_xp"] - total_xp
-            else:
-                progress_percent = 100
-                xp_to_next = 0
-
-            return {
-                "level": level_data["level"],
-                "level_name": level_data["name"],
-                "current_xp": total_xp,
-                "min_xp_for_level": level_data["min_xp"],
-                "max_xp_for_level": level_data["max_xp"],
-                "xp_to_next_level": xp_to_next,
-                "progress_percent": progress_percent,
-            }
+    index = _level_index(total_xp)
+    if index < 0:
+        return {
+            "level": 1,
+            "level_name": "Hatchling",
+            "current_xp": 0,
+            "min_xp_for_level": 0,
+            "max_xp_for_level": 100,
+            "xp_to_next_level": 100,
+            "progress_percent": 0,
+        }
+
+    min_xp = LEVEL_MIN_XP[index]
+    max_xp = LEVEL_MAX_XP[index]
+    if index < MAX_LEVEL_INDEX:
+        progress_percent = int(((total_xp - min_xp) / (max_xp - min_xp)) * 100)
+        xp_to_next = max_xp - total_xp
+    else:
+        progress_percent = 100
+        xp_to_next = 0
 
     return {
-        "level": 1,
-        "level_name": "Hatchling",
-        "current_xp": 0,
-        "min_xp_for_level": 0,
-        "max_xp_for_level": 100,
-        "xp_to_next_level": 100,
-        "progress_percent": 0,
+        "level": LEVEL_NUMBERS[index],
+        "level_name": LEVEL_NAMES[index],
+        "current_xp": total_xp,
+        "min_xp_for_level": min_xp,
+        "max_xp_for_level": max_xp,
+        "xp_to_next_level": xp_to_next,
+        "progress_percent": progress_percent,
+    }
+
+
+def xp_summary(total_xp):
+    """The /api/xp payload for a total; max_xp_for_level is omitted at max level"""
+    level_info = get_level_info(total_xp)
+    summary = {
+        "total_xp": total_xp,
+        "level": level_info["level"],
+        "level_name": level_info["level_name"],
+        "xp_to_next_level": level_info["xp_to_next_level"],
+        "progress_percent": level_info["progress_percent"],
+        "min_xp_for_level": level_info["min_xp_for_level"],
     }
+    if level_info["level"] < LEVEL_NUMBERS[-1]:
+        summary["max_xp_for_level"] = level_info["max_xp_for_level"]
+    return summary
 
 
 XP_REWARDS = {
@@ -0,0 +1,163 @@
+"""Per-route request metrics exposed in Prometheus text format at /metrics.
+
+Latency, status codes, in-flight requests and payload sizes are recorded per
+route rule (e.g. /api/tasks/<task_id>/complete), so label cardinality stays
+bounded. To aggregate across gunicorn workers, point PROMETHEUS_MULTIPROC_DIR
+at an empty directory before the server starts: every worker then writes its
+samples to its own memory-mapped files there and /metrics merges them.
+Without it, /metrics only reports the worker that served the scrape.
+
+/metrics exposes per-route traffic and latency, so it is only served when
+METRICS_TOKEN is set, and then only to requests that send it as a bearer
+token (Prometheus: authorization.credentials in the scrape config).
+"""
+
+import hmac
+import os
+import time
+
+from flask import Response, abort, g, request
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+METRICS_TOKEN = os.getenv("METRICS_TOKEN", "")
+
+UNMATCHED_ENDPOINT = "<unmatched>"
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "Time spent handling a request",
+    ["method", "endpoint"],
+    buckets=LATENCY_BUCKETS,
+)
+REQUESTS = Counter(
+    "http_requests_total",
+    "Requests handled, by response status",
+    ["method", "endpoint", "status"],
+)
+IN_FLIGHT = Gauge(
+    "http_requests_in_flight",
+    "Requests currently being handled",
+    ["endpoint"],
+    multiprocess_mode="livesum",
+)
+REQUEST_SIZE = Histogram(
+    "http_request_size_bytes",
+    "Request body size",
+    ["method", "endpoint"],
+    buckets=SIZE_BUCKETS,
+)
+RESPONSE_SIZE = Histogram(
+    "http_response_size_bytes",
+    "Response body size",
+    ["method", "endpoint"],
+    buckets=SIZE_BUCKETS,
+)
+QUERY_LATENCY = Histogram(
+    "supabase_query_duration_seconds",
+    "Supabase round trip time, by the route that made it",
+    ["endpoint", "table", "operation"],
+    buckets=LATENCY_BUCKETS,
+)
+ROUND_TRIPS = Histogram(
+    "supabase_round_trips_per_request",
+    "Supabase round trips made while handling one request",
+    ["endpoint"],
+    buckets=(0, 1, 2, 3, 4, 6, 8, 12, 16, 24, 32),
+)
+
+
+def request_started(endpoint):
+    """Count a request as in flight; returns the start time for request_finished"""
+    IN_FLIGHT.labels(endpoint).inc()
+    return time.perf_counter()
+
+
+def request_finished(
+    started, method, endpoint, status, request_bytes=0, response_bytes=0
+):
+    """Record a finished request's latency, status and sizes"""
+    IN_FLIGHT.labels(endpoint).dec()
+    REQUEST_LATENCY.labels(method, endpoint).observe(time.perf_counter() - started)
+    REQUESTS.labels(method, endpoint, str(status)).inc()
+    REQUEST_SIZE.labels(method, endpoint).observe(request_bytes or 0)
+    if response_bytes is not None:
+        RESPONSE_SIZE.labels(method, endpoint).observe(response_bytes)
+
+
+def _endpoint_label():
+    return request.url_rule.rule if request.url_rule else UNMATCHED_ENDPOINT
+
+
+def _before_request():
+    g.metrics_endpoint = _endpoint_label()
+    g.metrics_started = request_started(g.metrics_endpoint)
+
+
+def _after_request(response):
+    started = g.pop("metrics_started", None)
+    if started is not None:
+        # Streamed responses have no known length
+        request_finished(
+            started,
+            request.method,
+            g.pop("metrics_endpoint"),
+            response.status_code,
+            request.content_length,
+            response.calculate_content_length(),
+        )
+    return response
+
+
+def _teardown_request(error=None):
+    # after_request never ran (e.g. the response failed to build)
+    started = g.pop("metrics_started", None)
+    if started is not None:
+        request_finished(
+            started, request.method, g.pop("metrics_endpoint"), 500, None, None
+        )
+
+
+def render_metrics():
+    """Prometheus exposition of every worker's metrics (or just this one's)"""
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry)
+
+
+def metrics_view():
+    authorization = request.headers.get("Authorization", "")
+    if not hmac.compare_digest(
+        authorization.encode(), f"Bearer {METRICS_TOKEN}".encode()
+    ):
+        abort(401)
+    return Response(render_metrics(), content_type=CONTENT_TYPE_LATEST)
+
+
+def init_metrics(app):
+    """Install the request hooks, and /metrics when METRICS_TOKEN is set"""
+    app.before_request(_before_request)
+    app.after_request(_after_request)
+    app.teardown_request(_teardown_request)
+    if METRICS_TOKEN:
+        app.add_url_rule("/metrics", "metrics", metrics_view)
+
+
+def mark_worker_dead(pid):
+    """Drop a dead worker's live gauges; call from gunicorn's child_exit hook"""
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        multiprocess.mark_process_dead(pid)
@@ -0,0 +1,22 @@
+"""Pending per-user notifications stored in the notifications table"""
+
+from datetime import UTC, datetime
+
+from utils.database import get_service_role_client
+
+
+def pop_notifications(user_id, service_supabase=None):
+    """Mark a user's pending notifications delivered and return them"""
+    service_supabase = service_supabase or get_service_role_client()
+    response = (
+        service_supabase.table("notifications")
+        .update({"delivered_at": datetime.now(UTC).isoformat()})
+        .eq("user_id", user_id)
+        .is_("delivered_at", "null")
+        .execute()
+    )
+    rows = sorted(response.data or [], key=lambda row: row["id"])
+    return [
+        {"type": row["kind"], "created_at": row.get("created_at"), **row["payload"]}
+        for row in rows
+    ]
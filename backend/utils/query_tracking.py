@@ -0,0 +1,187 @@
+"""Count and time every Supabase round trip and attribute it to a request.
+
+The pooled service role clients (sync and async) send through the tracking
+transports below, so each PostgREST call is recorded with its table and
+operation in the QueryLog of the request that made it. Requests that go over
+their round-trip budget (QUERY_ROUND_TRIP_BUDGET, or @query_budget(n) on a
+view) are logged with the full query list.
+
+count_round_trips() and assert_max_round_trips() let a test pin how many
+round trips a route may make.
+"""
+
+import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+import httpx
+from flask import current_app, g, request
+
+from utils.metrics import QUERY_LATENCY, ROUND_TRIPS
+
+DEFAULT_BUDGET = int(os.getenv("QUERY_ROUND_TRIP_BUDGET", "8"))
+
+_current_log = ContextVar("supabase_query_log", default=None)
+
+
+class QueryLog(list):
+    """Queries made while this log is active; nested logs also feed their parent"""
+
+    def __init__(self, endpoint=None, parent=None):
+        super().__init__()
+        self.endpoint = endpoint
+        self.parent = parent
+
+    def record(self, query):
+        self.append(query)
+        if self.parent is not None:
+            self.parent.record(query)
+
+    def describe(self):
+        return ", ".join(
+            f"{q['operation']} {q['table']} {q['duration'] * 1000:.1f}ms" for q in self
+        )
+
+
+def describe_request(method, url, headers):
+    """(table, operation) for a PostgREST request"""
+    path = url.path
+    if "/rest/v1/" not in path:
+        segments = [segment for segment in path.split("/") if segment]
+        return (segments[0] if segments else "/"), method.lower()
+
+    resource = path.split("/rest/v1/", 1)[1]
+    if resource.startswith("rpc/"):
+        return resource[len("rpc/") :], "rpc"
+
+    operation = {
+        "GET": "select",
+        "HEAD": "count",
+        "PATCH": "update",
+        "DELETE": "delete",
+    }.get(method)
+    if method == "POST":
+        prefer = headers.get("prefer", "")
+        operation = "upsert" if "resolution=" in prefer else "insert"
+    return resource, operation or method.lower()
+
+
+def _record(request_, started):
+    duration = time.perf_counter() - started
+    table, operation = describe_request(request_.method, request_.url, request_.headers)
+    log = _current_log.get()
+    endpoint = log.endpoint if log is not None and log.endpoint else "<none>"
+    QUERY_LATENCY.labels(endpoint, table, operation).observe(duration)
+    if log is not None:
+        log.record({"table": table, "operation": operation, "duration": duration})
+
+
+class QueryTrackingTransport(httpx.BaseTransport):
+    """Wraps the pooled transport to record each round trip"""
+
+    def __init__(self, transport):
+        self._transport = transport
+
+    def handle_request(self, request_):
+        started = time.perf_counter()
+        try:
+            return self._transport.handle_request(request_)
+        finally:
+            _record(request_, started)
+
+    def close(self):
+        self._transport.close()
+
+
+class AsyncQueryTrackingTransport(httpx.AsyncBaseTransport):
+    """QueryTrackingTransport for the async client"""
+
+    def __init__(self, transport):
+        self._transport = transport
+
+    async def handle_async_request(self, request_):
+        started = time.perf_counter()
+        try:
+            return await self._transport.handle_async_request(request_)
+        finally:
+            _record(request_, started)
+
+    async def aclose(self):
+        await self._transport.aclose()
+
+
+def start_request_log(endpoint):
+    """Begin collecting queries for a request; returns (log, reset token)"""
+    log = QueryLog(endpoint, parent=_current_log.get())
+    return log, _current_log.set(log)
+
+
+def finish_request_log(log, token, method, path, budget=None):
+    """Stop collecting, export the round-trip count and log budget overruns"""
+    _current_log.reset(token)
+    ROUND_TRIPS.labels(log.endpoint).observe(len(log))
+    budget = DEFAULT_BUDGET if budget is None else budget
+    if len(log) > budget:
+        print(
+            f"{method} {path} made {len(log)} Supabase round trips "
+            f"(budget {budget}): {log.describe()}"
+        )
+
+
+def query_budget(max_round_trips):
+    """Override QUERY_ROUND_TRIP_BUDGET for one view"""
+
+    def decorator(f):
+        # functools.wraps copies this onto any decorator stacked above
+        f.query_budget = max_round_trips
+        return f
+
+    return decorator
+
+
+def _before_request():
+    endpoint = request.url_rule.rule if request.url_rule else "<unmatched>"
+    g.query_log, g.query_log_token = start_request_log(endpoint)
+
+
+def _teardown_request(error=None):
+    log = g.pop("query_log", None)
+    if log is None:
+        return
+    view = current_app.view_functions.get(request.endpoint)
+    finish_request_log(
+        log,
+        g.pop("query_log_token"),
+        request.method,
+        request.path,
+        getattr(view, "query_budget", None),
+    )
+
+
+def init_query_tracking(app):
+    """Attribute Supabase round trips to the Flask request that made them"""
+    app.before_request(_before_request)
+    app.teardown_request(_teardown_request)
+
+
+@contextmanager
+def count_round_trips():
+    """Collect every query made inside the block, e.g. around a test request"""
+    log = QueryLog(parent=_current_log.get())
+    token = _current_log.set(log)
+    try:
+        yield log
+    finally:
+        _current_log.reset(token)
+
+
+def assert_max_round_trips(client, method, url, max_round_trips, **kwargs):
+    """Make a request with a Flask test client and assert its round-trip count"""
+    with count_round_trips() as log:
+        response = getattr(client, method.lower())(url, **kwargs)
+    assert len(log) <= max_round_trips, (
+        f"{method} {url} made {len(log)} round trips, expected at most "
+        f"{max_round_trips}: {log.describe()}"
+    )
+    return response
@@ -0,0 +1,229 @@
+"""Serving the frontend build (frontend/build) in production.
+
+The build is scanned once per worker into a manifest of path -> asset with
+its mimetype, Cache-Control, ETag and encoded variants, so a request is a
+dict lookup instead of resolving and stat-ing paths. Files up to
+STATIC_MEMORY_MAX_FILE bytes are held in memory; larger ones are streamed
+from disk.
+
+Precompressed variants written next to a file by precompress_static.py
+(main.1a2b3c4d.js.br, .gz) are served to clients that accept them, as long
+as they are newer than the file. Compressible files without any are
+compressed once at load instead of on every response.
+
+Fingerprinted names (CRA's static/js/main.1a2b3c4d.js) never change content,
+so they are cached for a year as immutable; index.html and the other fixed
+names are revalidated against their ETag. The manifest reloads when
+index.html changes (checked every STATIC_RELOAD_INTERVAL seconds), which
+picks up a frontend rebuilt while the backend is running.
+"""
+
+import mimetypes
+import os
+import re
+import threading
+import time
+from pathlib import Path
+
+from flask import current_app, jsonify, request
+from werkzeug.wsgi import wrap_file
+
+from utils.compression import (
+    MIN_SIZE,
+    choose_encoding,
+    compress,
+    compressible,
+    supported_encodings,
+)
+from utils.etag import compute_etag
+
+IMMUTABLE_MAX_AGE = int(os.getenv("STATIC_IMMUTABLE_MAX_AGE", "31536000"))
+REVALIDATE_MAX_AGE = int(os.getenv("STATIC_REVALIDATE_MAX_AGE", "0"))
+MEMORY_MAX_FILE = int(os.getenv("STATIC_MEMORY_MAX_FILE", str(1024 * 1024)))
+# 0 = only scan at startup
+RELOAD_INTERVAL = float(os.getenv("STATIC_RELOAD_INTERVAL", "2"))
+
+# Content hash in the name, e.g. main.1a2b3c4d.js or 453.1a2b3c4d.chunk.js
+FINGERPRINT = re.compile(r"\.[0-9a-f]{8,}\.")
+# Most preferred first
+VARIANT_SUFFIXES = {"br": ".br", "gzip": ".gz"}
+
+
+class StaticAsset:
+    """One file of the build and the encodings it can be sent in"""
+
+    def __init__(self, path, mimetype, cache_control):
+        self.path = path
+        self.mimetype = mimetype
+        self.cache_control = cache_control
+        # encoding (None = identity) -> {"path", "size", "etag", "body"}
+        self.variants = {}
+
+    @property
+    def encodings(self):
+        return tuple(e for e in VARIANT_SUFFIXES if e in self.variants)
+
+
+def _variant(path, size, etag, body=None):
+    if size > MEMORY_MAX_FILE:
+        body = None
+    elif body is None:
+        body = path.read_bytes()
+    return {"path": path, "size": size, "etag": etag, "body": body}
+
+
+def load_asset(path, name):
+    """StaticAsset for a file of the build, with its precompressed variants"""
+    mimetype = mimetypes.guess_type(name)[0] or "application/octet-stream"
+    if FINGERPRINT.search(name):
+        cache_control = f"public, max-age={IMMUTABLE_MAX_AGE}, immutable"
+    else:
+        cache_control = f"public, max-age={REVALIDATE_MAX_AGE}, must-revalidate"
+
+    asset = StaticAsset(path, mimetype, cache_control)
+    stat = path.stat()
+    body = path.read_bytes()
+    etag = compute_etag(body)
+    asset.variants[None] = _variant(path, len(body), etag, body)
+
+    for encoding, suffix in VARIANT_SUFFIXES.items():
+        variant_path = path.with_name(path.name + suffix)
+        try:
+            variant_stat = variant_path.stat()
+        except OSError:
+            continue
+        # Left over from an earlier build of the same name
+        if variant_stat.st_mtime_ns < stat.st_mtime_ns:
+            continue
+        asset.variants[encoding] = _variant(
+            variant_path, variant_stat.st_size, f"{etag}-{encoding}"
+        )
+
+    if (
+        not asset.encodings
+        and compressible(mimetype)
+        and MIN_SIZE <= len(body) <= MEMORY_MAX_FILE
+    ):
+        for encoding in supported_encodings():
+            compressed = compress(body, encoding)
+            if len(compressed) < len(body):
+                asset.variants[encoding] = _variant(
+                    None, len(compressed), f"{etag}-{encoding}", compressed
+                )
+    return asset
+
+
+class StaticManifest:
+    """path -> StaticAsset for every file under the build directory"""
+
+    def __init__(self, root):
+        self.root = Path(root).resolve()
+        self._assets = {}
+        self._stamp = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+        self.load()
+
+    def _index_stamp(self):
+        try:
+            stat = (self.root / "index.html").stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def load(self):
+        """Scan the build directory and replace the manifest"""
+        stamp = self._index_stamp()
+        assets = {}
+        if self.root.is_dir():
+            for path in sorted(self.root.rglob("*")):
+                if path.suffix in (".br", ".gz") or not path.is_file():
+                    continue
+                name = path.relative_to(self.root).as_posix()
+                try:
+                    assets[name] = load_asset(path, name)
+                except OSError as e:
+                    print(f"Skipping static file {name}: {e}")
+
+        with self._lock:
+            self._assets = assets
+            self._stamp = stamp
+            self._checked_at = time.monotonic()
+        print(f"Loaded {len(assets)} static files from {self.root}")
+
+    def _maybe_reload(self):
+        if RELOAD_INTERVAL <= 0:
+            return
+        now = time.monotonic()
+        with self._lock:
+            if now - self._checked_at < RELOAD_INTERVAL:
+                return
+            self._checked_at = now
+            stamp = self._stamp
+        if self._index_stamp() != stamp:
+            self.load()
+
+    def get(self, name):
+        self._maybe_reload()
+        return self._assets.get(name)
+
+
+def _asset_response(asset):
+    encoding = None
+    if asset.encodings:
+        encoding = choose_encoding(
+            request.headers.get("Accept-Encoding"), asset.encodings
+        )
+    variant = asset.variants[encoding]
+
+    if variant["body"] is not None:
+        response = current_app.response_class(variant["body"], mimetype=asset.mimetype)
+    else:
+        response = current_app.response_class(
+            # Closed by the WSGI server when the response is done
+            wrap_file(request.environ, variant["path"].open("rb")),
+            mimetype=asset.mimetype,
+        )
+        response.content_length = variant["size"]
+    # Already in its final encoding; keeps utils/compression off it
+    response.direct_passthrough = True
+
+    if encoding is not None:
+        response.headers["Content-Encoding"] = encoding
+    if asset.encodings:
+        response.vary.add("Accept-Encoding")
+    response.headers["Cache-Control"] = asset.cache_control
+    response.set_etag(variant["etag"])
+    return response.make_conditional(
+        request, accept_ranges=True, complete_length=variant["size"]
+    )
+
+
+def send_asset(path):
+    """Response for a build file, falling back to index.html for SPA routes"""
+    manifest = current_app.extensions["static_assets"]
+    asset = manifest.get(path) if path else None
+    if asset is None:
+        asset = manifest.get("index.html")
+    if asset is None:
+        return jsonify({"error": "not found", "message": "frontend not built"}), 404
+    return _asset_response(asset)
+
+
+def send_index():
+    return send_asset("index.html")
+
+
+def serve_static(path):
+    """Serve React build files"""
+    # Check if path is an API route
+    if path.startswith("api/"):
+        return jsonify({"error": "API route not found"}), 404
+    return send_asset(path)
+
+
+def init_static_assets(app, root):
+    """Serve the frontend build in root at / from a manifest built now"""
+    app.extensions["static_assets"] = StaticManifest(root)
+    app.add_url_rule("/", "serve", serve_static, defaults={"path": ""})
+    app.add_url_rule("/<path:path>", "serve", serve_static)
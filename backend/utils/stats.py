@@ -0,0 +1,97 @@
+"""Aggregate per-user stats computed by the database, not by fetching rows"""
+
+from datetime import date, datetime, timedelta
+
+from utils.level_system import get_level
+
+# Stat name -> table whose completed rows it counts
+COUNT_TABLES = {"tasks": "Tasks", "focus": "focus_sessions"}
+
+
+def _completed_query(service_supabase, category, user_id):
+    return (
+        service_supabase.table(COUNT_TABLES[category])
+        .select("id", count="exact", head=True)
+        .eq("user_id", user_id)
+        .eq("completed", True)
+    )
+
+
+def _total_xp_query(service_supabase, user_id):
+    return service_supabase.table("user_xp").select("total_xp").eq("user_id", user_id)
+
+
+def count_completed(service_supabase, category, user_id):
+    """Exact number of completed rows, as a HEAD request with a count header"""
+    response = _completed_query(service_supabase, category, user_id).execute()
+    return response.count or 0
+
+
+def get_total_xp(service_supabase, user_id):
+    """User's XP total, 0 when they have no user_xp row yet"""
+    response = _total_xp_query(service_supabase, user_id).execute()
+    return response.data[0]["total_xp"] if response.data else 0
+
+
+async def count_completed_async(service_supabase, category, user_id):
+    """count_completed for the async client"""
+    response = await _completed_query(service_supabase, category, user_id).execute()
+    return response.count or 0
+
+
+async def get_total_xp_async(service_supabase, user_id):
+    """get_total_xp for the async client"""
+    response = await _total_xp_query(service_supabase, user_id).execute()
+    return response.data[0]["total_xp"] if response.data else 0
+
+
+def achievement_stats(tasks_completed, focus_sessions, total_xp):
+    """Stats for describe_achievements; a failed count (an exception) counts as 0"""
+    if isinstance(tasks_completed, Exception):
+        print(f"Error getting task count: {tasks_completed}")
+        tasks_completed = 0
+
+    if isinstance(focus_sessions, Exception):
+        print(f"Error getting focus count: {focus_sessions}")
+        focus_sessions = 0
+
+    if isinstance(total_xp, Exception):
+        print(f"Error getting user level: {total_xp}")
+        level = 1
+    else:
+        level = get_level(total_xp)
+
+    return {
+        "tasks_completed": tasks_completed,
+        "focus_sessions": focus_sessions,
+        "level": level,
+    }
+
+
+def last_7_days(today=None):
+    """ISO dates of the past week, oldest first and ending today"""
+    today = today or date.today()
+    return [(today - timedelta(days=i)).isoformat() for i in range(6, -1, -1)]
+
+
+def daily_completions_query(service_supabase, user_id, dates):
+    return (
+        service_supabase.table("daily_task_stats")
+        .select("date, tasks_completed")
+        .eq("user_id", user_id)
+        .in_("date", dates)
+    )
+
+
+def summarize_daily_completions(dates, rows):
+    """Chart payload for GET /api/analytics/daily-completions"""
+    stats_dict = {stat["date"]: stat["tasks_completed"] for stat in rows}
+
+    daily_data = []
+    labels = []
+    for date_str in dates:
+        day_date = datetime.fromisoformat(date_str)
+        labels.append(day_date.strftime("%a"))
+        daily_data.append(stats_dict.get(date_str, 0))
+
+    return {"labels": labels, "data": daily_data, "dates": dates}
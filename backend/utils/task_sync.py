@@ -0,0 +1,152 @@
+"""Delta sync for GET /api/tasks/changes.
+
+The database stamps updated_date on every insert and update of "Tasks" and
+writes a task_tombstones row for every delete (migrations/004_task_sync.sql),
+so the change feed stays consistent whichever route (or script) made the
+change. A sync token is an opaque wrapper around the newest timestamp the
+client has seen; both timestamps come from the database clock, never the
+client's or this server's.
+
+updated_date is the writing transaction's start time, so a slow transaction
+can commit a row stamped slightly before a token that was handed out in the
+meantime. Each poll therefore re-reads SYNC_OVERLAP_SECONDS before the token;
+clients merge by id, so the repeats are harmless.
+"""
+
+import base64
+import json
+import os
+from datetime import UTC, datetime, timedelta
+
+from utils.fanout import gather
+
+SYNC_OVERLAP = timedelta(seconds=int(os.getenv("TASK_SYNC_OVERLAP_SECONDS", "5")))
+# Keep in step with the interval passed to prune_task_tombstones()
+TOMBSTONE_RETENTION = timedelta(
+    days=int(os.getenv("TASK_TOMBSTONE_RETENTION_DAYS", "30"))
+)
+# More changes than this and the client is told to reload the whole list
+MAX_CHANGES = int(os.getenv("TASK_SYNC_MAX_CHANGES", "500"))
+# Token for a user with no tasks or tombstones yet
+EMPTY_STATE = datetime.fromtimestamp(0, UTC)
+
+
+class SyncTokenError(ValueError):
+    """Malformed ?since= token"""
+
+
+def _parse_timestamp(value):
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=UTC)
+    return parsed
+
+
+def encode_sync_token(timestamp):
+    raw = json.dumps({"t": timestamp.isoformat()}).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_sync_token(token):
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        return _parse_timestamp(json.loads(base64.urlsafe_b64decode(padded))["t"])
+    except (ValueError, TypeError, KeyError) as e:
+        raise SyncTokenError("Invalid sync token") from e
+
+
+def latest_task_query(service_supabase, user_id):
+    return (
+        service_supabase.table("Tasks")
+        .select("updated_date")
+        .eq("user_id", user_id)
+        .not_.is_("updated_date", "null")
+        .order("updated_date", desc=True)
+        .limit(1)
+    )
+
+
+def latest_tombstone_query(service_supabase, user_id):
+    return (
+        service_supabase.table("task_tombstones")
+        .select("deleted_at")
+        .eq("user_id", user_id)
+        .order("deleted_at", desc=True)
+        .limit(1)
+    )
+
+
+def _newest(timestamps, default):
+    parsed = [_parse_timestamp(value) for value in timestamps if value]
+    return max(parsed, default=default)
+
+
+def sync_token_for(latest_task_rows, latest_tombstone_rows):
+    """Token from latest_task_query and latest_tombstone_query results"""
+    timestamps = [row["updated_date"] for row in latest_task_rows]
+    timestamps += [row["deleted_at"] for row in latest_tombstone_rows]
+    return encode_sync_token(_newest(timestamps, EMPTY_STATE))
+
+
+def get_sync_token(user_id, service_supabase):
+    """Token for the user's current state, to pair with a full task load
+
+    Reading it alongside the load, rather than strictly before, is fine:
+    anything the load missed was stamped within SYNC_OVERLAP of the token,
+    and the next poll re-reads that window.
+    """
+    tasks, tombstones = gather(
+        latest_task_query(service_supabase, user_id).execute,
+        latest_tombstone_query(service_supabase, user_id).execute,
+    )
+    return sync_token_for(tasks.data or [], tombstones.data or [])
+
+
+def get_task_changes(user_id, since, service_supabase):
+    """Tasks changed and ids deleted since a decoded token, plus the next token
+
+    Returns {"tasks", "deleted", "sync_token", "reset"}. reset means the
+    token predates the tombstone retention window or too much has changed,
+    and the client should reload the full list (and take a fresh token).
+    """
+    # A client that loaded an empty list holds nothing a pruned tombstone
+    # could have removed, so EMPTY_STATE never expires
+    if since != EMPTY_STATE and datetime.now(UTC) - since > TOMBSTONE_RETENTION:
+        return {"tasks": [], "deleted": [], "sync_token": None, "reset": True}
+
+    window_start = (since - SYNC_OVERLAP).isoformat()
+    tasks, tombstones = gather(
+        service_supabase.table("Tasks")
+        .select("*")
+        .eq("user_id", user_id)
+        .gte("updated_date", window_start)
+        .order("updated_date")
+        .limit(MAX_CHANGES + 1)
+        .execute,
+        service_supabase.table("task_tombstones")
+        .select("task_id, deleted_at")
+        .eq("user_id", user_id)
+        .gte("deleted_at", window_start)
+        .order("deleted_at")
+        .limit(MAX_CHANGES + 1)
+        .execute,
+    )
+    changed = tasks.data or []
+    deleted = tombstones.data or []
+
+    if len(changed) > MAX_CHANGES or len(deleted) > MAX_CHANGES:
+        return {"tasks": [], "deleted": [], "sync_token": None, "reset": True}
+
+    newest = _newest(
+        [row["updated_date"] for row in changed]
+        + [row["deleted_at"] for row in deleted],
+        since,
+    )
+    return {
+        "tasks": changed,
+        "deleted": [
+            {"id": row["task_id"], "deleted_at": row["deleted_at"]} for row in deleted
+        ],
+        "sync_token": encode_sync_token(newest),
+        "reset": False,
+    }
@@ -0,0 +1,163 @@
+"""Query options for GET /api/tasks: filters, field projection and keyset pages.
+
+Pages are ordered by (due_date, id) with undated tasks last. The cursor is
+an opaque token holding the last row's sort key, so each page is one indexed
+range scan no matter how deep the client has paged.
+"""
+
+import base64
+import json
+import os
+from datetime import datetime
+
+# Columns clients may ask for with ?fields=
+TASK_FIELDS = frozenset(
+    {
+        "id",
+        "user_id",
+        "title",
+        "description",
+        "due_date",
+        "priority",
+        "completed",
+        "create_date",
+        "updated_date",
+        "completed_date",
+        "assigned_to",
+    }
+)
+# Always selected: the cursor is built from them
+CURSOR_FIELDS = ("due_date", "id")
+
+DEFAULT_PAGE_SIZE = int(os.getenv("TASKS_PAGE_SIZE", "100"))
+MAX_PAGE_SIZE = int(os.getenv("TASKS_MAX_PAGE_SIZE", "500"))
+
+
+class TaskQueryError(ValueError):
+    """Invalid query string for GET /api/tasks"""
+
+
+def encode_cursor(task):
+    raw = json.dumps([task.get("due_date"), task["id"]]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor):
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        due_date, task_id = json.loads(base64.urlsafe_b64decode(padded))
+    except (ValueError, TypeError) as e:
+        raise TaskQueryError("Invalid cursor") from e
+    return due_date, str(task_id)
+
+
+def _parse_bool(name, value):
+    if value.lower() in ("true", "1"):
+        return True
+    if value.lower() in ("false", "0"):
+        return False
+    raise TaskQueryError(f"{name} must be true or false")
+
+
+def _parse_date(name, value):
+    try:
+        datetime.fromisoformat(value)
+    except ValueError as e:
+        raise TaskQueryError(f"{name} must be an ISO 8601 date") from e
+    return value
+
+
+def parse_task_query(args):
+    """Validate request.args into the options apply_task_query understands"""
+    options = {"limit": DEFAULT_PAGE_SIZE, "select": "*"}
+
+    limit = args.get("limit")
+    if limit is not None:
+        try:
+            options["limit"] = int(limit)
+        except ValueError as e:
+            raise TaskQueryError("limit must be an integer") from e
+        if not 1 <= options["limit"] <= MAX_PAGE_SIZE:
+            raise TaskQueryError(f"limit must be between 1 and {MAX_PAGE_SIZE}")
+
+    fields = args.get("fields")
+    if fields:
+        requested = [field.strip() for field in fields.split(",") if field.strip()]
+        unknown = sorted(set(requested) - TASK_FIELDS)
+        if unknown:
+            raise TaskQueryError(f"Unknown fields: {', '.join(unknown)}")
+        selected = list(dict.fromkeys([*requested, *CURSOR_FIELDS]))
+        options["select"] = ",".join(selected)
+        options["fields"] = requested
+
+    if args.get("completed") is not None:
+        options["completed"] = _parse_bool("completed", args["completed"])
+
+    if args.get("priority"):
+        options["priority"] = [
+            priority.strip()
+            for priority in args["priority"].split(",")
+            if priority.strip()
+        ]
+
+    for name in ("due_after", "due_before"):
+        if args.get(name):
+            options[name] = _parse_date(name, args[name])
+
+    if args.get("cursor"):
+        options["cursor"] = decode_cursor(args["cursor"])
+
+    return options
+
+
+def _quote(value):
+    # PostgREST needs reserved characters (",", ".", ":", "()") quoted
+    return '"' + str(value).replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+def apply_task_query(query, options):
+    """Add filters, keyset position, ordering and limit to a Tasks select"""
+    if "completed" in options:
+        query = query.eq("completed", options["completed"])
+    if options.get("priority"):
+        query = query.in_("priority", options["priority"])
+    if options.get("due_after"):
+        query = query.gte("due_date", options["due_after"])
+    if options.get("due_before"):
+        query = query.lte("due_date", options["due_before"])
+
+    if "cursor" in options:
+        due_date, task_id = options["cursor"]
+        if due_date is None:
+            query = query.is_("due_date", "null").gt("id", task_id)
+        else:
+            query = query.or_(
+                f"due_date.gt.{_quote(due_date)},"
+                f"and(due_date.eq.{_quote(due_date)},id.gt.{_quote(task_id)}),"
+                "due_date.is.null"
+            )
+
+    # One extra row tells us whether another page exists
+    return (
+        query.order("due_date", nullsfirst=False)
+        .order("id")
+        .limit(options["limit"] + 1)
+    )
+
+
+def paginate(rows, options):
+    """Trim the look-ahead row and build the response's tasks and pagination"""
+    has_more = len(rows) > options["limit"]
+    rows = rows[: options["limit"]]
+    next_cursor = encode_cursor(rows[-1]) if has_more else None
+
+    fields = options.get("fields")
+    if fields:
+        rows = [{field: row.get(field) for field in fields} for row in rows]
+
+    return rows, {
+        "limit": options["limit"],
+        "count": len(rows),
+        "has_more": has_more,
+        "next_cursor": next_cursor,
+    }
@@ -0,0 +1,219 @@
+"""Optional write-behind buffer for XP awards and daily task stats.
+
+With XP_WRITE_BEHIND enabled, XP deltas are coalesced per (user, reason)
+and task completions per (user, day), then flushed by a background thread
+as two batched RPCs (see migrations/002_batched_counters.sql) every
+XP_WRITE_BEHIND_INTERVAL seconds, or sooner once XP_WRITE_BEHIND_MAX_PENDING
+keys are waiting. Pending writes are flushed on interpreter exit and by the
+gunicorn worker_exit hook. When disabled, every call writes synchronously.
+
+Every flushed entry carries a key and a batch that fails is retried as is,
+never merged back into the buffer, so a batch that committed before the
+error (e.g. a timeout) is not applied twice (see
+migrations/006_write_behind_keys.sql).
+"""
+
+import atexit
+import os
+import threading
+import uuid
+from datetime import date
+
+from utils.database import get_service_role_client
+from utils.xp import award_xp
+
+WRITE_BEHIND_ENABLED = os.getenv("XP_WRITE_BEHIND", "false").lower() == "true"
+FLUSH_INTERVAL = float(os.getenv("XP_WRITE_BEHIND_INTERVAL", "1.0"))
+MAX_PENDING = int(os.getenv("XP_WRITE_BEHIND_MAX_PENDING", "100"))
+
+
+def increment_daily_task_stats(rows, service_supabase=None):
+    """Add tasks_completed counts for [{"user_id", "date", "count"}] in one call.
+
+    Rows may carry a "key"; see migrations/005_idempotent_jobs.sql.
+    """
+    service_supabase = service_supabase or get_service_role_client()
+    service_supabase.rpc("increment_daily_task_stats", {"p_rows": rows}).execute()
+
+
+class WriteBehindBuffer:
+    """Coalesces counter increments in memory and flushes them in batches"""
+
+    def __init__(self, flush_interval=FLUSH_INTERVAL, max_pending=MAX_PENDING):
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self._xp = {}
+        self._daily = {}
+        # Batches whose flush failed, retried with the same keys
+        self._failed_xp = []
+        self._failed_daily = []
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._thread = None
+        self._pid = None
+
+    def add_xp(self, user_id, amount, reason):
+        with self._lock:
+            key = (user_id, reason)
+            self._xp[key] = self._xp.get(key, 0) + amount
+            self._after_add()
+
+    def add_task_completion(self, user_id, day):
+        with self._lock:
+            key = (user_id, day)
+            self._daily[key] = self._daily.get(key, 0) + 1
+            self._after_add()
+
+    def _after_add(self):
+        # Caller holds self._lock
+        self._ensure_thread()
+        if len(self._xp) + len(self._daily) >= self.max_pending:
+            self._wake.set()
+
+    def pending_xp(self, user_id):
+        """XP buffered for a user in this process but not yet written"""
+        with self._lock:
+            buffered = sum(
+                amount for (uid, _), amount in self._xp.items() if uid == user_id
+            )
+            failed = sum(
+                award["amount"]
+                for awards in self._failed_xp
+                for award in awards
+                if award["user_id"] == user_id
+            )
+            return buffered + failed
+
+    def pending_count(self):
+        with self._lock:
+            failed = sum(len(batch) for batch in self._failed_xp + self._failed_daily)
+            return len(self._xp) + len(self._daily) + failed
+
+    def flush(self, service_supabase=None):
+        """Write everything buffered so far; failed batches are retried as is"""
+        with self._flush_lock:
+            with self._lock:
+                xp, self._xp = self._xp, {}
+                daily, self._daily = self._daily, {}
+                xp_batches, self._failed_xp = self._failed_xp, []
+                daily_batches, self._failed_daily = self._failed_daily, []
+
+            awards = [
+                {
+                    "user_id": user_id,
+                    "amount": amount,
+                    "reason": reason,
+                    "key": uuid.uuid4().hex,
+                }
+                for (user_id, reason), amount in xp.items()
+                if amount
+            ]
+            if awards:
+                xp_batches.append(awards)
+            rows = [
+                {
+                    "user_id": user_id,
+                    "date": day,
+                    "count": count,
+                    "key": uuid.uuid4().hex,
+                }
+                for (user_id, day), count in daily.items()
+            ]
+            if rows:
+                daily_batches.append(rows)
+
+            if not xp_batches and not daily_batches:
+                return
+
+            service_supabase = service_supabase or get_service_role_client()
+            for awards in xp_batches:
+                try:
+                    service_supabase.rpc(
+                        "award_xp_batch", {"p_awards": awards}
+                    ).execute()
+                except Exception as e:
+                    print(f"Failed to flush {len(awards)} XP awards: {e}")
+                    self._retry_later(self._failed_xp, awards)
+
+            # One call per batch: a call takes at most one row per (user, day)
+            for rows in daily_batches:
+                try:
+                    increment_daily_task_stats(rows, service_supabase)
+                except Exception as e:
+                    print(f"Failed to flush {len(rows)} daily stats rows: {e}")
+                    self._retry_later(self._failed_daily, rows)
+
+    def _retry_later(self, failed, batch):
+        with self._lock:
+            failed.append(batch)
+
+    def _ensure_thread(self):
+        # Threads do not survive fork, so each worker starts its own
+        if self._pid == os.getpid() and self._thread is not None:
+            return
+        self._pid = os.getpid()
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="xp-write-behind", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self):
+        while not self._stopped.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"Write-behind flush error: {e}")
+
+    def stop(self):
+        """Stop the flusher thread and write whatever is still pending"""
+        self._stopped.set()
+        self._wake.set()
+        if self._thread is not None and self._pid == os.getpid():
+            self._thread.join(timeout=self.flush_interval + 5)
+        self._thread = None
+        self.flush()
+
+
+buffer = WriteBehindBuffer()
+
+
+def record_xp(user_id, amount, reason, service_supabase=None):
+    """Award XP; returns the new total, or None when the write was buffered"""
+    if not WRITE_BEHIND_ENABLED:
+        return award_xp(user_id, amount, reason, service_supabase)
+    buffer.add_xp(user_id, amount, reason)
+    return None
+
+
+def record_task_completion(user_id, day=None, service_supabase=None, key=None):
+    """Count one completed task towards the user's daily stats.
+
+    A write with a key is applied at most once, however often it is repeated.
+    """
+    day = day or date.today().isoformat()
+    if not WRITE_BEHIND_ENABLED:
+        row = {"user_id": user_id, "date": day, "count": 1}
+        if key is not None:
+            row["key"] = key
+        increment_daily_task_stats([row], service_supabase)
+        return
+    buffer.add_task_completion(user_id, day)
+
+
+def pending_xp(user_id):
+    """XP this worker has accepted for a user but not flushed yet"""
+    return buffer.pending_xp(user_id) if WRITE_BEHIND_ENABLED else 0
+
+
+def flush_pending():
+    """Flush buffered writes now, e.g. on graceful shutdown"""
+    if WRITE_BEHIND_ENABLED:
+        buffer.stop()
+
+
+atexit.register(flush_pending)
@@ -0,0 +1,44 @@
+"""XP service backed by the award_xp() database function and xp_events ledger.
+
+See migrations/001_xp_ledger.sql. Every change goes through one RPC that
+increments user_xp atomically and appends the applied delta to the ledger,
+so concurrent awards cannot overwrite each other.
+"""
+
+from utils.database import get_service_role_client
+
+REASON_TASK_COMPLETION = "task_completion"
+REASON_POMODORO_COMPLETION = "pomodoro_completion"
+REASON_ACHIEVEMENT_UNLOCK = "achievement_unlock"
+REASON_ADMIN_ADJUSTMENT = "admin_adjustment"
+
+
+def award_xp(user_id, amount, reason, service_supabase=None):
+    """Atomically add amount (may be negative) to a user's XP; returns the new total"""
+    service_supabase = service_supabase or get_service_role_client()
+    response = service_supabase.rpc(
+        "award_xp",
+        {"p_user_id": user_id, "p_amount": int(amount), "p_reason": reason},
+    ).execute()
+    return response.data
+
+
+def replay_ledger(service_supabase=None, page_size=1000):
+    """Sum the ledger per user, returning {user_id: total_xp}"""
+    service_supabase = service_supabase or get_service_role_client()
+    totals = {}
+    start = 0
+    while True:
+        page = (
+            service_supabase.table("xp_events")
+            .select("user_id, amount")
+            .order("id")
+            .range(start, start + page_size - 1)
+            .execute()
+        )
+        for event in page.data or []:
+            totals[event["user_id"]] = totals.get(event["user_id"], 0) + event["amount"]
+
+        if not page.data or len(page.data) < page_size:
+            return totals
+        start += page_size
@@ -3,7 +3,9 @@ import os
 # Set production environment before importing app
 os.environ["FLASK_ENV"] = "production"
 
-from app import app
+from app import create_app
+
+app = create_app()
 
 if __name__ == "__main__":
     port = int(os.environ.get("PORT", 5000))
@@ -156,12 +156,21 @@
                 cd backend
                 export FLASK_ENV=production
                 export FLASK_DEBUG=0
-                gunicorn --bind 0.0.0.0:5000 --workers 4 --access-logfile - --error-logfile - wsgi:app
+                export PROMETHEUS_MULTIPROC_DIR="$(mktemp -d)"
+                gunicorn -c gunicorn.conf.py wsgi:app
+              '';
+
+              backend-async.exec = ''
+                cd backend
+                export FLASK_DEBUG=0
+                export PROMETHEUS_MULTIPROC_DIR="$(mktemp -d)"
+                uvicorn asgi:application --host 0.0.0.0 --port 5000 --workers 4
               '';
 
               frontend-prod.exec = ''
                 cd frontend
                 npm run build
+                cd ../backend && python precompress_static.py
                 echo "Frontend build complete. Serving static files via backend in production."
               '';
 
@@ -171,7 +180,8 @@
                 export FLASK_ENV=production
                 export FLASK_DEBUG=0
                 echo "Production mode: Frontend will be served by Flask at /"
-                gunicorn --bind 0.0.0.0:5000 --workers 4 --access-logfile - --error-logfile - wsgi:app
+                export PROMETHEUS_MULTIPROC_DIR="$(mktemp -d)"
+                gunicorn -c gunicorn.conf.py wsgi:app
               '';
             };
 
@@ -188,6 +198,7 @@
               echo "  backend   - Start Flask development server"
               echo "  frontend  - Start React development server"
               echo "  backend-prod  - Start production server"
+              echo "  backend-async - Start production server in ASGI mode"
               echo "  frontend-prod  - Build production frontend for backend"
               echo "  nix fmt   - Format and Lint ALL code"
               echo ""
@@ -1,5 +1,5 @@
-import React, { useState, useEffect } from 'react';
-import api from './services/api';
+import React, { useState, useEffect, useRef } from 'react';
+import api, { notificationsAPI, taskSyncAPI } from './services/api';
 import GameNotification from './components/GameNotification';
 
 import { Login } from './pages/Login';
@@ -21,6 +21,7 @@ function App() {
   const [xpData, setXpData] = useState(null);
   const [statsRefreshTrigger, setStatsRefreshTrigger] = useState(0);
   const [initialLoadComplete, setInitialLoadComplete] = useState(false);
+  const syncToken = useRef(null);
   const [newTask, setNewTask] = useState({
     title: '',
     description: '',
@@ -107,6 +108,10 @@ function App() {
             ...achievementNotifications,
           ]);
         }
+
+        if (response.data.achievements_pending) {
+          fetchNotificationsSoon();
+        }
       })
       .catch((error) => {
         console.error('Failed to sync task completion:', error);
@@ -114,6 +119,23 @@ function App() {
       });
   };
 
+  // Achievements earned in background jobs arrive as notifications
+  const fetchNotificationsSoon = () => {
+    setTimeout(() => {
+      notificationsAPI
+        .getPending()
+        .then((notifications) => {
+          if (notifications.length) {
+            setNotificationQueue((prev) => [...prev, ...notifications]);
+            fetchXPData();
+          }
+        })
+        .catch((error) =>
+          console.error('Failed to fetch notifications:', error)
+        );
+    }, 1500);
+  };
+
   const fetchXPData = async () => {
     try {
       const response = await api.get('/xp', {
@@ -122,54 +144,125 @@ function App() {
         },
       });
 
-      const newXpData = response.data;
-      setXpData(newXpData);
+      applyXPData(response.data);
+    } catch (error) {
+      console.error('Failed to check level:', error);
+    }
+  };
 
-      const currentLevel = newXpData.level;
+  const applyXPData = (newXpData) => {
+    setXpData(newXpData);
 
-      if (previousLevel !== null && currentLevel > previousLevel) {
-        setNotificationQueue((prev) => [
-          ...prev,
-          {
-            type: 'levelup',
-            level: currentLevel,
-            level_name: newXpData.level_name,
+    const currentLevel = newXpData.level;
+
+    if (previousLevel !== null && currentLevel > previousLevel) {
+      setNotificationQueue((prev) => [
+        ...prev,
+        {
+          type: 'levelup',
+          level: currentLevel,
+          level_name: newXpData.level_name,
+        },
+      ]);
+    }
+
+    setPreviousLevel(currentLevel);
+  };
+
+  //Fetch tasks from backend, continuing after a first page if given
+  const fetchTasks = async (firstPage = null) => {
+    try {
+      // Taken first so nothing changed during the load is missed
+      const token = firstPage
+        ? firstPage.sync_token
+        : await taskSyncAPI.getToken();
+      const allTasks = firstPage ? [...firstPage.tasks] : [];
+      // undefined until the first page is in, null once there are no more
+      let cursor = firstPage ? firstPage.pagination.next_cursor : undefined;
+      while (cursor !== null) {
+        const response = await api.get('/tasks', {
+          params: { limit: 500, ...(cursor && { cursor }) },
+          headers: {
+            Authorization: `Bearer ${localStorage.getItem('access_token')}`,
           },
-        ]);
+        });
+        allTasks.push(...(response.data.tasks || []));
+        cursor = response.data.pagination?.next_cursor ?? null;
       }
-
-      setPreviousLevel(currentLevel);
+      setTasks(allTasks);
+      syncToken.current = token;
     } catch (error) {
-      console.error('Failed to check level:', error);
+      console.error('Error fetching task(s): ', error);
     }
   };
 
-  //Fetch tasks from backend
-  const fetchTasks = async () => {
+  // XP and the first page of tasks in one request
+  const bootstrap = async () => {
     try {
-      const response = await api.get('/tasks', {
+      const response = await api.get('/bootstrap', {
+        params: { sections: 'xp,tasks', limit: 500 },
         headers: {
           Authorization: `Bearer ${localStorage.getItem('access_token')}`,
         },
       });
-      setTasks(response.data.tasks || []);
+      const { xp, tasks: firstPage, errors } = response.data;
+      if (errors) console.error('Bootstrap sections failed:', errors);
+      if (xp) applyXPData(xp);
+      else fetchXPData();
+      await fetchTasks(firstPage || null);
     } catch (error) {
-      console.error('Error fetching task(s): ', error);
+      console.error('Bootstrap failed:', error);
+      fetchTasks();
+      fetchXPData();
+    }
+  };
+
+  // Merge only what changed since the last load or sync into the task list
+  const syncTasks = async () => {
+    if (!syncToken.current) {
+      await fetchTasks();
+      return;
+    }
+    try {
+      const changes = await taskSyncAPI.getChanges(syncToken.current);
+      if (changes.reset) {
+        await fetchTasks();
+        return;
+      }
+      const deleted = new Set(changes.deleted.map((d) => String(d.id)));
+      const changed = new Map(changes.tasks.map((t) => [String(t.id), t]));
+      setTasks((current) => {
+        const merged = current
+          .filter((t) => !deleted.has(String(t.id)))
+          .map((t) => changed.get(String(t.id)) || t);
+        const known = new Set(merged.map((t) => String(t.id)));
+        const added = changes.tasks.filter((t) => !known.has(String(t.id)));
+        return [...merged, ...added];
+      });
+      syncToken.current = changes.sync_token;
+    } catch (error) {
+      console.error('Error syncing tasks: ', error);
     }
   };
 
   useEffect(() => {
     if (isAuthenticated && !initialLoadComplete) {
-      fetchTasks();
-      fetchXPData();
+      bootstrap();
       setInitialLoadComplete(true);
     } else if (isAuthenticated) {
-      fetchTasks();
-      fetchXPData();
+      bootstrap();
     }
     // eslint-disable-next-line react-hooks/exhaustive-deps
   }, [isAuthenticated, initialLoadComplete]);
 
+  // Login queues a full achievement check, whatever BACKGROUND_JOBS is
+  useEffect(() => {
+    if (isAuthenticated) {
+      fetchNotificationsSoon();
+    }
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, [isAuthenticated]);
+
   useEffect(() => {
     if (notificationQueue.length > 0 && !currentNotification) {
       setCurrentNotification(notificationQueue[0]);
@@ -196,8 +289,8 @@ function App() {
             },
           }
         );
-        await fetchTasks();
-        setTasks([...tasks, response.data.task]);
+        setTasks((current) => [...current, response.data.task]);
+        await syncTasks();
         setNewTask({
           title: '',
           description: '',
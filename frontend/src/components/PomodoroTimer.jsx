@@ -1,5 +1,5 @@
 import React, { useState, useEffect } from 'react';
-import { pomodoroAPI } from '../services/api';
+import { notificationsAPI, pomodoroAPI } from '../services/api';
 
 const PomodoroTimer = ({
   refreshXP,
@@ -67,6 +67,27 @@ const PomodoroTimer = ({
             ]);
           }
 
+          if (response.achievements_pending && setNotificationQueue) {
+            setTimeout(() => {
+              notificationsAPI
+                .getPending()
+                .then((notifications) => {
+                  if (notifications.length) {
+                    setNotificationQueue((prev) => [
+                      ...prev,
+                      ...notifications,
+                    ]);
+                    if (refreshXP) {
+                      refreshXP();
+                    }
+                  }
+                })
+                .catch((err) =>
+                  console.error('Failed to fetch notifications:', err)
+                );
+            }, 1500);
+          }
+
           if (refreshXP) {
             refreshXP();
           }
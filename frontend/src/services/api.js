@@ -81,6 +81,26 @@ export const xpAPI = {
   },
 };
 
+// Delta sync: getToken() before a full load, then getChanges(token) to poll
+export const taskSyncAPI = {
+  getToken: async () => {
+    const response = await api.get('/tasks/changes');
+    return response.data.sync_token;
+  },
+  getChanges: async (since) => {
+    const response = await api.get('/tasks/changes', { params: { since } });
+    return response.data;
+  },
+};
+
+// Notifications queued by background jobs (e.g. achievements)
+export const notificationsAPI = {
+  getPending: async () => {
+    const response = await api.get('/notifications');
+    return response.data.notifications;
+  },
+};
+
 export default api;
 
 // Boards API functions